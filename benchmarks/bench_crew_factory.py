@@ -0,0 +1,70 @@
+"""Per-case crew setup cost: ``build_crew`` from scratch vs a warm ``CrewFactory``.
+
+Builds the crew for the same PDF ``--cases`` times in a row both ways (no LLM is
+called; dummy API keys are set when missing) and prints total, mean and p95
+milliseconds per case. The factory's one-off warm-up is reported separately.
+
+    python benchmarks/bench_crew_factory.py examples/3568943.pdf --cases 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import time
+from pathlib import Path
+from typing import Callable, List
+
+
+def _time_cases(build: Callable[[], object], cases: int) -> List[float]:
+    timings = []
+    for _ in range(cases):
+        start = time.perf_counter()
+        build()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def _row(label: str, timings: List[float]) -> str:
+    p95 = statistics.quantiles(timings, n=20)[-1] if len(timings) > 1 else timings[0]
+    return f"{label:<16}{sum(timings):>12.1f}{statistics.mean(timings):>12.2f}{p95:>12.2f}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pdf_path", nargs="?", default="examples/3568943.pdf")
+    parser.add_argument("--cases", type=int, default=100)
+    parser.add_argument("--arbiters", type=int, choices=(1, 2, 3), default=3)
+    parser.add_argument("--ingestion-mode", choices=("agent", "direct"), default="direct")
+    args = parser.parse_args()
+
+    for key in ("OPENAI_API_KEY", "GEMINI_API_KEY", "DEEPSEEK_API_KEY"):
+        os.environ.setdefault(key, "benchmark-key")
+    os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+
+    from dili_rucam_agents.crew.crew import build_crew
+    from dili_rucam_agents.crew.factory import CrewFactory
+
+    pdf_path = str(Path(args.pdf_path).resolve())
+    options = {
+        "use_arbiter_beta": args.arbiters >= 2,
+        "use_arbiter_gamma": args.arbiters >= 3,
+        "ingestion_mode": args.ingestion_mode,
+    }
+
+    cold = _time_cases(lambda: build_crew(pdf_path, **options), args.cases)
+    start = time.perf_counter()
+    factory = CrewFactory(**options)
+    warmup_ms = (time.perf_counter() - start) * 1000
+    warm = _time_cases(lambda: factory.build(pdf_path), args.cases)
+
+    print(f"{args.cases} cases, {args.arbiters} arbiter(s), {args.ingestion_mode} ingestion")
+    print(f"{'setup':<16}{'total ms':>12}{'mean ms':>12}{'p95 ms':>12}")
+    print(_row("build_crew", cold))
+    print(_row("CrewFactory", warm))
+    print(f"factory warm-up: {warmup_ms:.1f} ms; speedup {statistics.mean(cold) / statistics.mean(warm):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Wall time and peak RSS of case bundle ingestion.
+
+Compares the per-extractor path (every extractor opens and parses the PDF on its
+own) with the shared ``PdfDocument`` path used by ``build_case_bundle``. Each mode
+runs in a fresh subprocess so peak RSS is not polluted by the other mode.
+
+    python benchmarks/bench_ingestion.py examples/3568943.pdf --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+MODES = ("per_extractor", "shared_document")
+
+
+def _run_mode(mode: str, pdf_path: Path, repeat: int) -> dict:
+    from dili_rucam_agents.ingestion.build_bundle import build_case_bundle
+    from dili_rucam_agents.ingestion.pdfplumber_tables import extract_tables
+    from dili_rucam_agents.ingestion.pymupdf_fallback import extract_fallback_blocks
+    from dili_rucam_agents.ingestion.unstructured_ingest import run_unstructured_ingest
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if mode == "per_extractor":
+            run_unstructured_ingest(pdf_path)
+            extract_fallback_blocks(pdf_path)
+            extract_tables(pdf_path)
+        else:
+            build_case_bundle(pdf_path)
+        timings.append(time.perf_counter() - start)
+
+    # ru_maxrss is KiB on Linux.
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return {
+        "mode": mode,
+        "median_s": statistics.median(timings),
+        "min_s": min(timings),
+        "peak_rss_mb": peak_rss_mb,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pdf_path", nargs="?", default="examples/3568943.pdf")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    pdf_path = Path(args.pdf_path).resolve()
+
+    if args.mode:
+        print(json.dumps(_run_mode(args.mode, pdf_path, args.repeat)))
+        return
+
+    print(f"{'mode':<18}{'median s':>10}{'min s':>10}{'peak RSS MB':>14}")
+    for mode in MODES:
+        completed = subprocess.run(
+            [sys.executable, __file__, str(pdf_path), "--repeat", str(args.repeat), "--mode", mode],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        row = json.loads(completed.stdout.strip().splitlines()[-1])
+        print(f"{row['mode']:<18}{row['median_s']:>10.4f}{row['min_s']:>10.4f}{row['peak_rss_mb']:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Latency and token cost of agent-driven vs direct case bundle ingestion.
+
+Runs the full crew once per mode (real LLM calls: the API keys from ``.env`` are
+required) and prints per-stage wall time plus prompt/completion tokens, split into
+the ingestion agent's share and the total. Both modes bypass the bundle cache
+so extraction time is comparable.
+
+    python benchmarks/bench_ingestion_modes.py examples/3568943.pdf
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+MODES = ("agent", "direct")
+
+
+def main() -> None:
+    from dili_rucam_agents.crew.crew import run_crew
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pdf_path", nargs="?", default="examples/3568943.pdf")
+    parser.add_argument("--analyst-concurrency", type=int, default=1)
+    parser.add_argument("--json", action="store_true", help="Print raw run_metrics instead of a table.")
+    args = parser.parse_args()
+    pdf_path = str(Path(args.pdf_path).resolve())
+
+    rows = []
+    for mode in MODES:
+        _, reports = run_crew(
+            pdf_path,
+            capture_reports=True,
+            use_bundle_cache=False,
+            analyst_concurrency=args.analyst_concurrency,
+            ingestion_mode=mode,
+        )
+        rows.append(json.loads(reports["run_metrics"]))
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+
+    print(f"{'mode':<8}{'ingest s':>10}{'crew s':>10}{'total s':>10}{'ingest tok':>12}{'prompt tok':>12}{'compl tok':>12}")
+    for row in rows:
+        stages = row["stage_seconds"]
+        usage = row["token_usage"]
+        total = usage.get("total", {})
+        ingest_tokens = usage.get("case_bundle", {}).get("total_tokens", 0)
+        print(
+            f"{row['ingestion_mode']:<8}{stages.get('ingestion', 0.0):>10.2f}{stages.get('crew', 0.0):>10.2f}"
+            f"{sum(stages.values()):>10.2f}{ingest_tokens:>12}{total.get('prompt_tokens', 0):>12}"
+            f"{total.get('completion_tokens', 0):>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
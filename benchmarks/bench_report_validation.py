@@ -0,0 +1,102 @@
+"""SECTION C audit throughput: streaming extraction and batch vs per-record validation.
+
+Writes synthetic analyst reports (a share of them with a wrong total or an item out
+of range) to a temporary directory, then times extracting SECTION C from the files
+with ``iter_section_c`` and validating the payloads with ``validate_rucam_batch``
+against calling ``validate_rucam_json`` once per record. Both validation paths keep
+every report (or its errors), as an audit does.
+
+    python benchmarks/bench_report_validation.py --records 20000 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+
+def _best(fn: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def _payloads(count: int, invalid_share: float, seed: int) -> List[Dict[str, Any]]:
+    from dili_rucam_agents.validators.rucam_engine import ITEM_RANGES, category_for_total
+
+    rng = random.Random(seed)
+    payloads = []
+    for _ in range(count):
+        scores = {item: rng.randint(low, high) for item, (low, high) in ITEM_RANGES.items()}
+        total = sum(scores.values())
+        if rng.random() < invalid_share:
+            total += 1
+        payloads.append(
+            {
+                "injury_pattern": rng.choice(["hepatocellular", "mixed", "cholestatic"]),
+                "R_ratio": round(rng.uniform(0.2, 12.0), 2),
+                "rucam_scores": scores,
+                "total_score": total,
+                "category": category_for_total(total),
+            }
+        )
+    return payloads
+
+
+def main() -> None:
+    from dili_rucam_agents.validators.report_batch import iter_section_c, validate_rucam_batch
+    from dili_rucam_agents.validators.rucam_json import validate_rucam_json
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--invalid-share", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    payloads = _payloads(args.records, args.invalid_share, args.seed)
+    narrative = "SECTION A — NARRATIVE\n" + "Lorem ipsum dolor sit amet. " * 60 + "\n\nSECTION B — TABLE\n| Item | Score |\n"
+
+    def per_record() -> List[Any]:
+        # What an audit loop does today: keep each report, or its error message.
+        outcomes: List[Any] = []
+        for payload in payloads:
+            try:
+                outcomes.append(validate_rucam_json(payload))
+            except ValueError as exc:
+                outcomes.append(str(exc))
+        return outcomes
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for index, payload in enumerate(payloads):
+            (root / f"report-{index:06d}.md").write_text(
+                f"{narrative}\nSECTION C — MACHINE-READABLE JSON\n```json\n{json.dumps(payload, indent=2)}\n```\n",
+                encoding="utf-8",
+            )
+        extract_seconds = _best(lambda: sum(1 for _ in iter_section_c([root])), args.repeat)
+
+    per_record_seconds = _best(per_record, args.repeat)
+    batch_seconds = _best(lambda: validate_rucam_batch(payloads), args.repeat)
+    invalid = sum(not result.ok for result in validate_rucam_batch(payloads))
+
+    print(f"records={args.records} invalid={invalid}")
+    print(f"{'stage':<28}{'seconds':>10}{'records/s':>12}")
+    for label, seconds in (
+        ("extract (iter_section_c)", extract_seconds),
+        ("validate per record", per_record_seconds),
+        ("validate_rucam_batch", batch_seconds),
+    ):
+        print(f"{label:<28}{seconds:>10.3f}{args.records / seconds:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
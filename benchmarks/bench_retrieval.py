@@ -0,0 +1,61 @@
+"""Input tokens of the full bundle, the LLM view and the retrieval view.
+
+Pads the case report with synthetic background pages (a stand-in for long
+reviews and supplements) and prints, per document length, the tokens each
+rendering hands to an analyst, the retrieval view's build time and whether every
+relevant passage was kept.
+
+    python benchmarks/bench_retrieval.py examples/3568943.pdf --pages 0 12 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from pathlib import Path
+
+from dili_rucam_agents.ingestion.build_bundle import build_case_bundle
+from dili_rucam_agents.ingestion.case_bundle import CaseBundleBlock
+from dili_rucam_agents.ingestion.retrieval import build_retrieval_view
+from dili_rucam_agents.tokens import count_tokens
+
+_BACKGROUND = (
+    "epilepsy neuralgia pharmacokinetics metabolism cytochrome epoxide clearance plasma concentration trial "
+    "cohort randomized placebo efficacy seizure frequency tolerability rash dizziness diplopia ataxia "
+    "mechanism immune hypersensitivity genetic polymorphism population incidence registry dose response"
+).split()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pdf_path", nargs="?", default="examples/3568943.pdf")
+    parser.add_argument("--pages", type=int, nargs="+", default=[0, 12, 40], help="Synthetic pages to append.")
+    parser.add_argument("--budget", type=int, default=6000, help="Token budget of both views.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    base = build_case_bundle(Path(args.pdf_path).resolve(), cache=None)
+    first_extra = max(block.page_number for block in base.blocks) + 1
+    print(f"{'pages':>6}{'full tok':>10}{'view tok':>10}{'retr tok':>10}{'retr ms':>9}{'complete':>10}")
+    for extra in args.pages:
+        bundle = build_case_bundle(Path(args.pdf_path).resolve(), cache=None)
+        rng = random.Random(args.seed)
+        for page_number in range(first_extra, first_extra + extra):
+            for line in range(12):
+                words = " ".join(rng.choice(_BACKGROUND) for _ in range(25))
+                bundle.blocks.append(CaseBundleBlock("NarrativeText", page_number, f"{words.capitalize()} ({line})."))
+
+        view = bundle.to_llm_view(args.budget)
+        start = time.perf_counter()
+        retrieval = build_retrieval_view(bundle, args.budget)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        complete = retrieval.retrieval.get("complete", "n/a")
+        print(
+            f"{first_extra - 1 + extra:>6}{count_tokens(bundle.to_json()):>10}{view.tokens_after:>10}"
+            f"{retrieval.tokens_after:>10}{elapsed_ms:>9.1f}{str(complete):>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
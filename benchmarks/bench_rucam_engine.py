@@ -0,0 +1,90 @@
+"""Rescoring throughput: the NumPy RUCAM engine vs per-record pydantic validation.
+
+Generates synthetic SECTION C records (a share of them with a wrong category or
+injury pattern) and times ``verify_batch``/``rescore_batch`` against validating each
+record with ``validate_rucam_json`` and re-deriving category and pattern in Python.
+
+    python benchmarks/bench_rucam_engine.py --records 50000 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Any, Callable, Dict, List
+
+
+def _time(fn: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def _records(count: int, seed: int) -> List[Dict[str, Any]]:
+    from dili_rucam_agents.validators.rucam_engine import ITEM_RANGES, category_for_total, injury_pattern_for_r
+
+    rng = random.Random(seed)
+    records = []
+    for _ in range(count):
+        scores = {item: rng.randint(low, high) for item, (low, high) in ITEM_RANGES.items()}
+        total = sum(scores.values())
+        r_value = round(rng.uniform(0.2, 12.0), 2)
+        records.append(
+            {
+                "injury_pattern": injury_pattern_for_r(r_value) if rng.random() > 0.1 else "mixed",
+                "R_ratio": r_value,
+                "rucam_scores": scores,
+                "total_score": total,
+                "category": category_for_total(total) if rng.random() > 0.1 else "Possible",
+            }
+        )
+    return records
+
+
+def main() -> None:
+    from dili_rucam_agents.validators.rucam_engine import (
+        category_for_total,
+        injury_pattern_for_r,
+        rescore_batch,
+        verify_batch,
+    )
+    from dili_rucam_agents.validators.rucam_json import validate_rucam_json
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=50000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    records = _records(args.records, args.seed)
+
+    def per_record() -> int:
+        flagged = 0
+        for record in records:
+            try:
+                report = validate_rucam_json(record)
+            except ValueError:
+                flagged += 1
+                continue
+            flagged += (
+                category_for_total(report.total_score) != report.category
+                or injury_pattern_for_r(report.R_ratio) != report.injury_pattern
+            )
+        return flagged
+
+    print(f"{'method':<22}{'seconds':>10}{'records/s':>14}")
+    for name, run in (
+        ("validate_rucam_json", per_record),
+        ("verify_batch", lambda: verify_batch(records)),
+        ("rescore_batch", lambda: rescore_batch(records)),
+    ):
+        elapsed = min(_time(run) for _ in range(args.repeat))
+        print(f"{name:<22}{elapsed:>10.3f}{args.records / elapsed:>14,.0f}")
+
+    flagged = sum(not check.ok for check in verify_batch(records))
+    print(f"{flagged} of {args.records} records inconsistent")
+
+
+if __name__ == "__main__":
+    main()
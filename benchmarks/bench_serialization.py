@@ -0,0 +1,56 @@
+"""Serialization cost of a case bundle: time, payload bytes and LLM tokens.
+
+Compares the historical ``indent=2`` tool output with the compact (minified) JSON
+and the compressed binary format used for cache entries, plus the load time of
+each payload back into a :class:`CaseBundle`.
+
+    python benchmarks/bench_serialization.py examples/3568943.pdf --repeat 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+from typing import Callable
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    from dili_rucam_agents.ingestion.build_bundle import build_case_bundle
+    from dili_rucam_agents.ingestion.case_bundle import CaseBundle
+    from dili_rucam_agents.tokens import count_tokens
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pdf_path", nargs="?", default="examples/3568943.pdf")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    bundle = build_case_bundle(Path(args.pdf_path).resolve(), cache=None)
+    formats = {
+        "indent2": (lambda: bundle.to_json(compact=False).encode("utf-8"), True),
+        "compact": (lambda: bundle.to_bytes(binary=False), True),
+        "binary": (lambda: bundle.to_bytes(binary=True), False),
+    }
+
+    print(f"{'format':<10}{'dump ms':>10}{'load ms':>10}{'bytes':>10}{'tokens':>10}")
+    for name, (dump, is_text) in formats.items():
+        payload = dump()
+        assert CaseBundle.from_bytes(payload).to_dict() == bundle.to_dict()
+        dump_ms = _time(dump, args.repeat) * 1000
+        load_ms = _time(lambda: CaseBundle.from_bytes(payload), args.repeat) * 1000
+        tokens = str(count_tokens(payload.decode("utf-8"))) if is_text else "-"
+        print(f"{name:<10}{dump_ms:>10.3f}{load_ms:>10.3f}{len(payload):>10}{tokens:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import threading
+import time
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from dili_rucam_agents.crew.repair import DEFAULT_REPAIR_RETRIES
+from dili_rucam_agents.ingestion.build_bundle import build_case_bundle
+from dili_rucam_agents.ingestion.bundle_cache import get_default_cache, sha256_file
+from dili_rucam_agents.pipeline import run_end_to_end
+
+MANIFEST_FILENAME = "manifest.jsonl"
+FINAL_REPORT_FILENAME = "final_report.md"
+
+# Manifest statuses, in the order a case moves through them.
+STATUS_INGESTED = "ingested"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+
+@dataclass
+class ManifestEntry:
+    pdf_path: str
+    status: str
+    output_dir: Optional[str] = None
+    stage_seconds: Dict[str, float] = field(default_factory=dict)
+    error: Optional[str] = None
+    updated_at: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "pdf_path": self.pdf_path,
+            "status": self.status,
+            "output_dir": self.output_dir,
+            "stage_seconds": dict(self.stage_seconds),
+            "error": self.error,
+            "updated_at": self.updated_at,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "ManifestEntry":
+        return cls(
+            pdf_path=payload["pdf_path"],
+            status=payload["status"],
+            output_dir=payload.get("output_dir"),
+            stage_seconds=dict(payload.get("stage_seconds", {})),
+            error=payload.get("error"),
+            updated_at=payload.get("updated_at", 0.0),
+        )
+
+
+class BatchManifest:
+    """Append-only JSONL log of per-PDF progress; the last line for a PDF wins.
+
+    Every status change is flushed and fsynced before the run moves on, so after a
+    crash the manifest reflects every case that completed. A torn final line from
+    an interrupted write is ignored on load.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self.entries: Dict[str, ManifestEntry] = self._load()
+
+    def _load(self) -> Dict[str, ManifestEntry]:
+        entries: Dict[str, ManifestEntry] = {}
+        if not self.path.exists():
+            return entries
+        with self.path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    entry = ManifestEntry.from_dict(json.loads(line))
+                except (ValueError, KeyError):
+                    continue
+                entries[entry.pdf_path] = entry
+        return entries
+
+    def status(self, pdf_path: Path) -> Optional[str]:
+        entry = self.entries.get(str(pdf_path))
+        return entry.status if entry else None
+
+    def record(self, entry: ManifestEntry) -> None:
+        entry.updated_at = time.time()
+        line = json.dumps(entry.to_dict(), ensure_ascii=False)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+                handle.flush()
+                os.fsync(handle.fileno())
+            self.entries[entry.pdf_path] = entry
+
+
+def discover_pdfs(source: Path) -> List[Path]:
+    """PDFs under a directory (recursive) or listed one per line in a text file."""
+
+    if source.is_dir():
+        return sorted(path.resolve() for path in source.rglob("*.pdf"))
+
+    pdfs: List[Path] = []
+    base = source.resolve().parent
+    for line in source.read_text(encoding="utf-8").splitlines():
+        entry = line.strip()
+        if not entry or entry.startswith("#"):
+            continue
+        path = Path(entry).expanduser()
+        pdfs.append((path if path.is_absolute() else base / path).resolve())
+    return pdfs
+
+
+def case_output_dir(output_root: Path, pdf_path: Path) -> Path:
+    """Per-case report directory; the content hash keeps same-named PDFs apart."""
+
+    return output_root / f"{pdf_path.stem}-{sha256_file(pdf_path)[:8]}"
+
+
+def _ingest(pdf_path: str, cache_dir: Optional[str]) -> float:
+    """CPU-pool worker: build the case bundle into the shared on-disk cache."""
+
+    start = time.perf_counter()
+    build_case_bundle(Path(pdf_path), cache=get_default_cache(Path(cache_dir) if cache_dir else None))
+    return time.perf_counter() - start
+
+
+def run_batch(
+    source: Path,
+    output_root: Path,
+    *,
+    manifest_path: Optional[Path] = None,
+    ingestion_workers: Optional[int] = None,
+    llm_concurrency: int = 2,
+    retry_failed: bool = False,
+    bundle_cache_dir: Optional[str] = None,
+    **pipeline_kwargs: Any,
+) -> Dict[str, int]:
+    """Run the crew over a corpus, resuming from the manifest.
+
+    Ingestion runs on a process pool and fills the case bundle cache; as each PDF
+    finishes ingesting, its LLM stage (direct ingestion mode, so the cached bundle
+    is injected without an ingestion agent) is queued on a thread pool of
+    ``llm_concurrency`` workers. Cases already marked ``done`` are skipped, and
+    ``failed`` cases only run again with ``retry_failed``. One :class:`CrewFactory`
+    is shared by all LLM workers, so agents and LLM clients are built once per batch.
+    """
+
+    output_root.mkdir(parents=True, exist_ok=True)
+    manifest = BatchManifest(manifest_path or output_root / MANIFEST_FILENAME)
+    pdfs = discover_pdfs(source)
+
+    summary = {"total": len(pdfs), "done": 0, "failed": 0, "skipped": 0}
+    pending: List[Path] = []
+    for pdf_path in pdfs:
+        status = manifest.status(pdf_path)
+        if status == STATUS_DONE or (status == STATUS_FAILED and not retry_failed):
+            summary["skipped"] += 1
+        else:
+            pending.append(pdf_path)
+    if not pending:
+        return summary
+
+    # Imported here: ingestion pool workers re-import this module and never need CrewAI.
+    from dili_rucam_agents.crew.factory import CrewFactory, factory_options
+
+    prompt_path = pipeline_kwargs.get("prompt_path")
+    crew_factory = CrewFactory(
+        Path(prompt_path).expanduser().resolve() if prompt_path else None,
+        ingestion_mode="direct",
+        bundle_cache_dir=bundle_cache_dir,
+        **factory_options(pipeline_kwargs),
+    )
+
+    def run_case(pdf_path: Path, ingest_seconds: float) -> ManifestEntry:
+        output_dir = case_output_dir(output_root, pdf_path)
+        start = time.perf_counter()
+        final_output = run_end_to_end(
+            str(pdf_path),
+            output_dir=str(output_dir),
+            ingestion_mode="direct",
+            use_bundle_cache=True,
+            bundle_cache_dir=bundle_cache_dir,
+            crew_factory=crew_factory,
+            **pipeline_kwargs,
+        )
+        (output_dir / FINAL_REPORT_FILENAME).write_text(str(final_output), encoding="utf-8")
+        return ManifestEntry(
+            pdf_path=str(pdf_path),
+            status=STATUS_DONE,
+            output_dir=str(output_dir),
+            stage_seconds={"ingestion": round(ingest_seconds, 4), "llm": round(time.perf_counter() - start, 4)},
+        )
+
+    def fail(pdf_path: Path, stage: str, exc: BaseException) -> None:
+        summary["failed"] += 1
+        message = "".join(traceback.format_exception_only(type(exc), exc)).strip()
+        manifest.record(ManifestEntry(pdf_path=str(pdf_path), status=STATUS_FAILED, error=f"{stage}: {message}"))
+
+    with ProcessPoolExecutor(ingestion_workers) as cpu_pool, ThreadPoolExecutor(llm_concurrency) as llm_pool:
+        ingest_futures: Dict[Future[float], Path] = {
+            cpu_pool.submit(_ingest, str(pdf_path), bundle_cache_dir): pdf_path for pdf_path in pending
+        }
+        llm_futures: Dict[Future[ManifestEntry], Path] = {}
+        for future in as_completed(ingest_futures):
+            pdf_path = ingest_futures[future]
+            try:
+                ingest_seconds = future.result()
+            except Exception as exc:
+                fail(pdf_path, "ingestion", exc)
+                continue
+            manifest.record(
+                ManifestEntry(
+                    pdf_path=str(pdf_path),
+                    status=STATUS_INGESTED,
+                    stage_seconds={"ingestion": round(ingest_seconds, 4)},
+                )
+            )
+            llm_futures[llm_pool.submit(run_case, pdf_path, ingest_seconds)] = pdf_path
+
+        for future in as_completed(llm_futures):
+            pdf_path = llm_futures[future]
+            try:
+                entry = future.result()
+            except Exception as exc:
+                fail(pdf_path, "llm", exc)
+                continue
+            manifest.record(entry)
+            summary["done"] += 1
+
+    return summary
+
+
+def _main() -> None:
+    parser = argparse.ArgumentParser(description="Run the RUCAM crew over a corpus of PDFs.")
+    parser.add_argument("source", help="Directory of PDFs (searched recursively) or a file listing one PDF per line.")
+    parser.add_argument("--output-dir", dest="output_dir", required=True, help="Root directory for per-case reports.")
+    parser.add_argument(
+        "--manifest",
+        dest="manifest_path",
+        help=f"Manifest JSONL path (defaults to <output-dir>/{MANIFEST_FILENAME}); rerun with it to resume.",
+    )
+    parser.add_argument(
+        "--ingestion-workers",
+        dest="ingestion_workers",
+        type=int,
+        help="Processes used for PDF ingestion (defaults to the CPU count).",
+    )
+    parser.add_argument(
+        "--llm-concurrency",
+        dest="llm_concurrency",
+        type=int,
+        default=2,
+        help="Cases whose analyst/arbiter stage may run at the same time.",
+    )
+    parser.add_argument(
+        "--retry-failed",
+        dest="retry_failed",
+        action="store_true",
+        help="Run cases again that the manifest records as failed.",
+    )
+    parser.add_argument("--bundle-cache-dir", dest="bundle_cache_dir", help="Case bundle cache directory.")
+    parser.add_argument("--arbiter-beta", dest="use_arbiter_beta", action="store_true")
+    parser.add_argument("--arbiter-gamma", dest="use_arbiter_gamma", action="store_true")
+    parser.add_argument("--analyst-concurrency", dest="analyst_concurrency", type=int, default=1)
+    parser.add_argument("--arbiter-concurrency", dest="arbiter_concurrency", type=int, default=1)
+    parser.add_argument("--llm-view-tokens", dest="llm_view_tokens", type=int)
+    parser.add_argument("--retrieval-view", dest="retrieval_view", action="store_true")
+    parser.add_argument("--repair-retries", dest="repair_retries", type=int, default=DEFAULT_REPAIR_RETRIES)
+    parser.add_argument("--stream", dest="stream", action="store_true", help="Write reports token by token.")
+    parser.add_argument("--no-llm-cache", dest="use_llm_cache", action="store_false")
+    parser.add_argument("--consensus-skip", dest="consensus_short_circuit", action="store_true")
+    args = parser.parse_args()
+
+    summary = run_batch(
+        Path(args.source).expanduser(),
+        Path(args.output_dir).expanduser().resolve(),
+        manifest_path=Path(args.manifest_path).expanduser() if args.manifest_path else None,
+        ingestion_workers=args.ingestion_workers,
+        llm_concurrency=args.llm_concurrency,
+        retry_failed=args.retry_failed,
+        bundle_cache_dir=args.bundle_cache_dir,
+        use_arbiter_beta=args.use_arbiter_beta,
+        use_arbiter_gamma=args.use_arbiter_gamma,
+        analyst_concurrency=args.analyst_concurrency,
+        arbiter_concurrency=args.arbiter_concurrency,
+        llm_view_tokens=args.llm_view_tokens,
+        retrieval_view=args.retrieval_view,
+        repair_retries=args.repair_retries,
+        stream=args.stream,
+        use_llm_cache=args.use_llm_cache,
+        consensus_short_circuit=args.consensus_short_circuit,
+    )
+    print(json.dumps(summary))
+
+
+__all__ = [
+    "BatchManifest",
+    "ManifestEntry",
+    "case_output_dir",
+    "discover_pdfs",
+    "run_batch",
+]
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI helper
+    _main()
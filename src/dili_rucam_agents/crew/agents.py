@@ -5,13 +5,36 @@ from typing import Optional
 
 from crewai import Agent, LLM
 
-from dili_rucam_agents.ingestion.build_bundle import CaseBundleExtractionTool
+from dili_rucam_agents.ingestion.tool import CaseBundleExtractionTool
 
+from .prompt_layout import with_static_prompt
 
-def build_ingestion_agent(model: Optional[str] = None) -> Agent:
-    """Agent responsible for deterministic PDF ingestion."""
 
-    tool = CaseBundleExtractionTool()
+def build_ingestion_agent(
+    model: Optional[str] = None,
+    *,
+    ingestion_workers: int = 1,
+    use_bundle_cache: bool = True,
+    bundle_cache_dir: Optional[str] = None,
+    llm_view_tokens: Optional[int] = None,
+    retrieval_view: bool = False,
+) -> Agent:
+    """Agent responsible for deterministic PDF ingestion.
+
+    With ``llm_view_tokens`` the tool returns the token-budgeted LLM view and its
+    output becomes the task answer verbatim, so the budget is not undone by the
+    ingestion model re-typing the bundle. ``retrieval_view`` does the same with the
+    relevance-pruned view of long documents.
+    """
+
+    tool = CaseBundleExtractionTool(
+        workers=ingestion_workers,
+        use_cache=use_bundle_cache,
+        cache_dir=bundle_cache_dir,
+        llm_view_tokens=llm_view_tokens,
+        retrieval_view=retrieval_view,
+        result_as_answer=bool(llm_view_tokens) or retrieval_view,
+    )
     ingestion_model = model or os.getenv("INGESTION_MODEL") or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
 
     return Agent(
@@ -34,16 +57,23 @@ def build_rucam_agent(
     model_env: str,
     default_model: str,
     vendor_note: str,
+    prompt_text: Optional[str] = None,
 ) -> Agent:
-    """Factory for GPT-5.2 and Gemini 3.0 analysts."""
+    """Factory for GPT-5.2 and Gemini 3.0 analysts.
+
+    ``prompt_text`` (the RUCAM production prompt) is placed in the system message,
+    ahead of any per-case content, so providers can cache it across cases.
+    """
 
     return Agent(
         role=f"{label} Expert DILI RUCAM Analyst",
         goal="Apply the production RUCAM prompt verbatim to case_bundle_json inputs.",
-        backstory=(
+        backstory=with_static_prompt(
             f"{label} is a board-certified hepatologist and pharmacovigilance researcher. "
             f"{vendor_note} Always compute R-ratio, determine injury pattern, score all seven RUCAM items, "
-            "and output Sections A/B/C exactly as specified."
+            "and output Sections A/B/C exactly as specified.",
+            "PRODUCTION PROMPT",
+            prompt_text,
         ),
         allow_delegation=False,
         verbose=True,
@@ -56,8 +86,13 @@ def build_arbiter_agent(
     label: str,
     model_env: str,
     default_model: str,
+    prompt_text: Optional[str] = None,
 ) -> Agent:
-    """Factory for the ensemble of hepatology arbiters."""
+    """Factory for the ensemble of hepatology arbiters.
+
+    ``prompt_text`` (the arbiter production prompt) goes into the system message;
+    for Anthropic models CrewAI stamps that message with ``cache_control``.
+    """
 
     arbiter_model = (
         os.getenv(model_env)
@@ -100,9 +135,11 @@ def build_arbiter_agent(
             "Compare GPT and Gemini reports, resolve every discrepancy, and emit a single final RUCAM decision "
             "plus justification."
         ),
-        backstory=(
+        backstory=with_static_prompt(
             "You chaired international RUCAM harmonization panels and only side with evidence backed by the "
-            "case bundle and scoring rules."
+            "case bundle and scoring rules.",
+            "ARBITER PROMPT",
+            prompt_text,
         ),
         allow_delegation=False,
         verbose=True,
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from dili_rucam_agents.validators.rucam_engine import RUCAM_ITEMS, category_for_total
+from dili_rucam_agents.validators.rucam_json import (
+    RucamReport,
+    extract_section_c,
+    sections_before_c,
+    validate_rucam_json,
+)
+
+
+@dataclass
+class ConsensusTolerance:
+    """How far the two analysts may differ and still skip arbitration."""
+
+    item_points: int = 0
+    r_ratio_relative: float = 0.05
+
+
+@dataclass
+class ConsensusResult:
+    agreed: bool
+    reasons: List[str] = field(default_factory=list)
+    gpt: Optional[RucamReport] = None
+    gemini: Optional[RucamReport] = None
+    consensus: Optional[Dict[str, Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"agreed": self.agreed, "reasons": list(self.reasons), "consensus": self.consensus}
+
+
+def _parse(label: str, report: Optional[str], reasons: List[str]) -> Optional[RucamReport]:
+    if not report:
+        reasons.append(f"{label}: empty report")
+        return None
+    payload = extract_section_c(report)
+    if payload is None:
+        reasons.append(f"{label}: SECTION C JSON not found")
+        return None
+    try:
+        return validate_rucam_json(payload)
+    except ValueError as exc:
+        reasons.append(f"{label}: {exc}")
+        return None
+
+
+def compare_reports(
+    gpt_report: Optional[str],
+    gemini_report: Optional[str],
+    tolerance: Optional[ConsensusTolerance] = None,
+) -> ConsensusResult:
+    """Compare both analysts' SECTION C item by item.
+
+    The analysts agree when injury pattern and category match, every RUCAM item is
+    within ``tolerance.item_points``, the R ratios are within the relative tolerance,
+    and the conservative consensus (per-item minimum) still lands in that category.
+    """
+
+    tolerance = tolerance or ConsensusTolerance()
+    reasons: List[str] = []
+    gpt = _parse("GPT-5.2", gpt_report, reasons)
+    gemini = _parse("Gemini 3.0", gemini_report, reasons)
+    if gpt is None or gemini is None:
+        return ConsensusResult(agreed=False, reasons=reasons, gpt=gpt, gemini=gemini)
+
+    if gpt.injury_pattern != gemini.injury_pattern:
+        reasons.append(f"injury_pattern {gpt.injury_pattern} != {gemini.injury_pattern}")
+    if gpt.category != gemini.category:
+        reasons.append(f"category {gpt.category} != {gemini.category}")
+    scale = max(abs(gpt.R_ratio), abs(gemini.R_ratio), 1e-9)
+    if abs(gpt.R_ratio - gemini.R_ratio) > tolerance.r_ratio_relative * scale:
+        reasons.append(f"R_ratio {gpt.R_ratio} vs {gemini.R_ratio}")
+
+    items: Dict[str, int] = {}
+    for item in RUCAM_ITEMS:
+        a, b = getattr(gpt.rucam_scores, item), getattr(gemini.rucam_scores, item)
+        if abs(a - b) > tolerance.item_points:
+            reasons.append(f"{item} {a} vs {b}")
+        items[item] = min(a, b)
+
+    total = sum(items.values())
+    if not reasons and category_for_total(total) != gpt.category:
+        reasons.append(f"conservative total {total} falls outside category {gpt.category}")
+    if reasons:
+        return ConsensusResult(agreed=False, reasons=reasons, gpt=gpt, gemini=gemini)
+
+    consensus = {
+        "injury_pattern": gpt.injury_pattern,
+        "R_ratio": round((gpt.R_ratio + gemini.R_ratio) / 2, 2),
+        "rucam_scores": items,
+        "total_score": total,
+        "category": gpt.category,
+    }
+    return ConsensusResult(agreed=True, gpt=gpt, gemini=gemini, consensus=consensus)
+
+
+def render_consensus_report(result: ConsensusResult, gpt_report: str, tolerance: ConsensusTolerance) -> str:
+    """Final report used in place of the arbiters when the analysts agree."""
+
+    if not result.agreed or result.consensus is None or result.gpt is None or result.gemini is None:
+        raise ValueError("consensus report requires agreeing analyst reports")
+    rows = [
+        f"| {item} | {getattr(result.gpt.rucam_scores, item)} | {getattr(result.gemini.rucam_scores, item)} "
+        f"| {result.consensus['rucam_scores'][item]} |"
+        for item in RUCAM_ITEMS
+    ]
+    return "\n".join(
+        [
+            "# Consensus Report (arbitration skipped)",
+            "",
+            "GPT-5.2 and Gemini 3.0 agreed on injury pattern, category and every RUCAM item "
+            f"(item tolerance ±{tolerance.item_points}, R ratio ±{tolerance.r_ratio_relative:.0%}); "
+            "no arbiter was called. Sections A and B are the GPT-5.2 analyst's.",
+            "",
+            sections_before_c(gpt_report).strip(),
+            "",
+            "## SECTION C — CONSENSUS JSON",
+            "```json",
+            json.dumps(result.consensus, indent=2),
+            "```",
+            "",
+            "## SECTION D — CONSENSUS JUSTIFICATION",
+            "| RUCAM Item | GPT-5.2 | Gemini 3.0 | Consensus |",
+            "| --- | --- | --- | --- |",
+            *rows,
+            f"| **Total** | {result.gpt.total_score} | {result.gemini.total_score} | "
+            f"**{result.consensus['total_score']} ({result.consensus['category']})** |",
+            "",
+            "Where item scores differ within tolerance the lower (more conservative) score is kept.",
+        ]
+    )
+
+
+class ConsensusGate:
+    """Shared condition for the arbiter tasks of one crew.
+
+    Created by :func:`run_crew`, bound to the analyst tasks by :func:`build_crew`.
+    The first arbiter's condition compares the analyst outputs; the decision is
+    memoized so every arbiter of the crew follows it and the caller can read it.
+    """
+
+    def __init__(self, tolerance: Optional[ConsensusTolerance] = None) -> None:
+        self.tolerance = tolerance or ConsensusTolerance()
+        self.gpt_task: Any = None
+        self.gemini_task: Any = None
+        self.result: Optional[ConsensusResult] = None
+        self._lock = threading.Lock()
+
+    def bind(self, gpt_task: Any, gemini_task: Any) -> None:
+        self.gpt_task = gpt_task
+        self.gemini_task = gemini_task
+
+    def evaluate(self) -> ConsensusResult:
+        with self._lock:
+            if self.result is None:
+                self.result = compare_reports(
+                    _raw(self.gpt_task), _raw(self.gemini_task), self.tolerance
+                )
+                CONSENSUS_MONITOR.record(self.result.agreed)
+            return self.result
+
+    def should_arbitrate(self, _previous_output: Any = None) -> bool:
+        return not self.evaluate().agreed
+
+
+def _raw(task: Any) -> Optional[str]:
+    output = getattr(task, "output", None)
+    return getattr(output, "raw", None) if output is not None else None
+
+
+class ConsensusMonitor:
+    """Process-wide count of consensus checks and skipped arbitrations."""
+
+    def __init__(self) -> None:
+        self.checked = 0
+        self.skipped = 0
+        self._lock = threading.Lock()
+
+    def record(self, agreed: bool) -> None:
+        with self._lock:
+            self.checked += 1
+            self.skipped += int(agreed)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            rate = self.skipped / self.checked if self.checked else 0.0
+            return {"checked": self.checked, "skipped": self.skipped, "skip_rate": round(rate, 4)}
+
+
+CONSENSUS_MONITOR = ConsensusMonitor()
+
+
+__all__ = [
+    "CONSENSUS_MONITOR",
+    "ConsensusGate",
+    "ConsensusResult",
+    "ConsensusTolerance",
+    "compare_reports",
+    "render_consensus_report",
+]
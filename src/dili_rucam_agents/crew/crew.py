@@ -1,20 +1,24 @@
 from __future__ import annotations
 
+import json
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from crewai import Crew, Process, Task
 
-from .agents import build_arbiter_agent, build_ingestion_agent, build_rucam_agent
-from .tasks import (
-    create_analysis_task,
-    create_arbiter_task,
-    create_case_bundle_task,
-    load_arbiter_prompt,
-    load_rucam_prompt,
-)
+from dili_rucam_agents.ingestion.build_bundle import render_case_bundle
+from dili_rucam_agents.tokens import count_tokens
 
-TaskMap = Dict[str, Task]
+from .consensus import CONSENSUS_MONITOR, ConsensusGate, ConsensusTolerance, render_consensus_report
+from .ensemble import aggregate_arbiters, render_ensemble_report
+from .factory import INGESTION_MODES, CrewFactory, TaskMap
+from .llm_cache import LLMResponseCache, get_default_llm_cache
+from .metrics import RunMetrics, capture_llm_calls
+from .repair import DEFAULT_REPAIR_RETRIES, SectionCRepair
+from .report_stream import stream_reports
+from .tasks import CASE_BUNDLE_INPUT
 
 
 def build_crew(
@@ -23,106 +27,69 @@ def build_crew(
     *,
     use_arbiter_beta: bool = False,
     use_arbiter_gamma: bool = False,
+    ingestion_workers: int = 1,
+    use_bundle_cache: bool = True,
+    bundle_cache_dir: Optional[str] = None,
+    llm_view_tokens: Optional[int] = None,
+    analyst_concurrency: int = 1,
+    arbiter_concurrency: int = 1,
+    ingestion_mode: str = "agent",
+    retrieval_view: bool = False,
+    repair_retries: int = DEFAULT_REPAIR_RETRIES,
+    llm_cache: Optional[LLMResponseCache] = None,
+    consensus_gate: Optional[ConsensusGate] = None,
+    factory: Optional[CrewFactory] = None,
 ) -> Tuple[Crew, TaskMap]:
-    prompt_text = load_rucam_prompt(prompt_path)
-    arbiter_prompt_text = load_arbiter_prompt()
-
-    ingestion_agent = build_ingestion_agent()
-    gpt_agent = build_rucam_agent(
-        label="GPT-5.2",
-        model_env="OPENAI_MODEL",
-        default_model="gpt-5.2",
-        vendor_note="OpenAI GPT-5.2 deterministic reasoning model.",
-    )
-    gemini_agent = build_rucam_agent(
-        label="Gemini 3.0",
-        model_env="GEMINI_MODEL",
-        default_model="gemini-3-pro-preview",
-        vendor_note="Google Gemini 3.0 dual-encoder causal reasoning model.",
-    )
-    arbiter_configs = [
-        {
-            "label": "Arbiter Alpha",
-            "model_env": "ARBITER_ALPHA_MODEL",
-            "enabled": True,
-            "default_model": "deepseek-reasoner",
-        },
-        {
-            "label": "Arbiter Beta",
-            "model_env": "ARBITER_BETA_MODEL",
-            "enabled": use_arbiter_beta,
-            "default_model": "gpt-5.2",
-        },
-        {
-            "label": "Arbiter Gamma",
-            "model_env": "ARBITER_GAMMA_MODEL",
-            "enabled": use_arbiter_gamma,
-            "default_model": "gpt-5.2",
-        },
-    ]
+    """Assemble the ingestion → analysts → arbiters crew for one PDF.
 
-    for config in arbiter_configs:
-        if not config["enabled"]:
-            continue
-        config["agent"] = build_arbiter_agent(
-            label=config["label"],
-            model_env=config["model_env"],
-            default_model=config.get("default_model", "gpt-5.2"),
-        )
+    Builds a one-off :class:`CrewFactory` from the keyword arguments (see it for the
+    ingestion modes and concurrency options). Pass a warm ``factory`` to reuse its
+    agents, LLM clients and prompts instead; its configuration then takes precedence.
+    """
 
-    case_bundle_task = create_case_bundle_task(pdf_path=pdf_path, agent=ingestion_agent)
-    gpt_task = create_analysis_task(
-        agent=gpt_agent,
-        case_bundle_task=case_bundle_task,
-        analyst_label="GPT-5.2",
-        prompt_text=prompt_text,
-        model_reference="OPENAI_MODEL",
-    )
-    gemini_task = create_analysis_task(
-        agent=gemini_agent,
-        case_bundle_task=case_bundle_task,
-        analyst_label="Gemini 3.0",
-        prompt_text=prompt_text,
-        model_reference="GEMINI_MODEL",
-    )
-    arbiter_tasks = []
-    for config in arbiter_configs:
-        agent = config.get("agent")
-        if not agent:
-            continue
-        task = create_arbiter_task(
-            agent=agent,
-            gpt_task=gpt_task,
-            gemini_task=gemini_task,
-            arbiter_label=config["label"],
-            prompt_text=arbiter_prompt_text,
+    if factory is None:
+        factory = CrewFactory(
+            prompt_path,
+            use_arbiter_beta=use_arbiter_beta,
+            use_arbiter_gamma=use_arbiter_gamma,
+            ingestion_workers=ingestion_workers,
+            use_bundle_cache=use_bundle_cache,
+            bundle_cache_dir=bundle_cache_dir,
+            llm_view_tokens=llm_view_tokens,
+            analyst_concurrency=analyst_concurrency,
+            arbiter_concurrency=arbiter_concurrency,
+            ingestion_mode=ingestion_mode,
+            retrieval_view=retrieval_view,
+            repair_retries=repair_retries,
         )
-        config["task"] = task
-        arbiter_tasks.append(task)
+    return factory.build(pdf_path, llm_cache=llm_cache, consensus_gate=consensus_gate)
 
-    arbiter_agents = [config["agent"] for config in arbiter_configs if config.get("agent")]
 
-    crew = Crew(
-        agents=[ingestion_agent, gpt_agent, gemini_agent, *arbiter_agents],
-        tasks=[case_bundle_task, gpt_task, gemini_task, *arbiter_tasks],
-        process=Process.sequential,
-        verbose=True,
-    )
+def detached_task_groups(crew: Crew, task_map: TaskMap) -> List[List[Task]]:
+    """Task-map entries :func:`build_crew` left out of ``crew``, as concurrent groups in run order."""
 
-    task_map: TaskMap = {
-        "case_bundle": case_bundle_task,
-        "gpt_52": gpt_task,
-        "gemini_30": gemini_task,
-    }
+    in_crew = {id(task) for task in crew.tasks}
+    analysts = [task_map[key] for key in ("gpt_52", "gemini_30") if id(task_map[key]) not in in_crew]
+    arbiters = [task for key, task in task_map.items() if key.startswith("arbiter_") and id(task) not in in_crew]
+    return [group for group in (analysts, arbiters) if group]
 
-    for config in arbiter_configs:
-        task = config.get("task")
-        if not task:
-            continue
-        label_key = f"arbiter_{config['label'].lower().replace(' ', '_')}"
-        task_map[label_key] = task
 
-    return crew, task_map
+def run_task_group(
+    tasks: List[Task], inputs: Dict[str, Any], max_workers: int, *, verbose: bool = True
+) -> List[Crew]:
+    """Kick off each task in its own one-task crew, up to ``max_workers`` at a time.
+
+    Context tasks (the analysts for an arbiter) must already have run; their outputs
+    are read from the task objects exactly as in the sequential crew.
+    """
+
+    crews = [
+        Crew(agents=[task.agent], tasks=[task], process=Process.sequential, verbose=verbose) for task in tasks
+    ]
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(crews)))) as pool:
+        for future in [pool.submit(crew.kickoff, inputs=inputs) for crew in crews]:
+            future.result()
+    return crews
 
 
 def run_crew(
@@ -132,15 +99,155 @@ def run_crew(
     capture_reports: bool = False,
     use_arbiter_beta: bool = False,
     use_arbiter_gamma: bool = False,
+    ingestion_workers: int = 1,
+    use_bundle_cache: bool = True,
+    bundle_cache_dir: Optional[str] = None,
+    llm_view_tokens: Optional[int] = None,
+    analyst_concurrency: int = 1,
+    arbiter_concurrency: int = 1,
+    ingestion_mode: str = "agent",
+    retrieval_view: bool = False,
+    repair_retries: int = DEFAULT_REPAIR_RETRIES,
+    use_llm_cache: bool = True,
+    llm_cache_path: Optional[str] = None,
+    consensus_tolerance: Optional[ConsensusTolerance] = None,
+    crew_factory: Optional[CrewFactory] = None,
+    stream_dir: Optional[Path] = None,
+    stream_stdout: bool = False,
     **kwargs,
 ) -> str | Tuple[str, Dict[str, Optional[str]]]:
-    crew, task_map = build_crew(
-        pdf_path=pdf_path,
-        prompt_path=prompt_path,
-        use_arbiter_beta=use_arbiter_beta,
-        use_arbiter_gamma=use_arbiter_gamma,
+    """Run the crew; with ``capture_reports`` also return reports and ``run_metrics``.
+
+    In ``direct`` ingestion mode the case bundle is built here, in Python, and passed
+    verbatim to the analysts as the ``case_bundle`` kickoff input, so no LLM sits
+    between the deterministic extractor and the analysts; ``run_metrics`` then carries
+    the bundle's run diagnostics under ``ingestion_diagnostics``.
+
+    An analyst or arbiter SECTION C that fails validation is repaired in place by
+    up to ``repair_retries`` small LLM calls (see :mod:`.repair`); ``run_metrics``
+    lists every repair under ``section_c_repairs``.
+
+    With ``consensus_tolerance`` the arbiters only run when the analysts disagree;
+    otherwise the returned output is a deterministic consensus report.
+
+    When two or more arbiters produce a valid SECTION C, their decisions are
+    combined by :func:`aggregate_arbiters` and the ensemble report is returned;
+    ``arbiter_concurrency`` above 1 runs those arbiters at the same time.
+
+    With ``stream_dir`` and/or ``stream_stdout`` the analyst and arbiter LLMs stream:
+    each agent's tokens are appended to its report file in ``stream_dir`` (and echoed
+    to stdout) as they arrive, and ``run_metrics`` records per-agent time to first
+    token under ``streaming`` (see :mod:`.report_stream`).
+
+    A warm ``crew_factory`` (shared across cases, e.g. by :mod:`dili_rucam_agents.batch`)
+    replaces the per-run agent and LLM client construction; its configuration must
+    match the ingestion and concurrency arguments given here.
+    """
+
+    metrics = RunMetrics(pdf_path=pdf_path, ingestion_mode=ingestion_mode)
+    llm_cache = get_default_llm_cache(Path(llm_cache_path) if llm_cache_path else None) if use_llm_cache else None
+    cache_before = llm_cache.stats.to_dict() if llm_cache is not None else {}
+    consensus_gate = ConsensusGate(consensus_tolerance) if consensus_tolerance is not None else None
+    inputs: Dict[str, Any] = {"pdf_path": pdf_path, **kwargs}
+    view_stats: Optional[Dict[str, Any]] = None
+
+    if ingestion_mode == "direct":
+        metrics.ingestion_diagnostics = {}
+        with metrics.stage("ingestion"):
+            bundle_text, view_stats = render_case_bundle(
+                Path(pdf_path),
+                workers=ingestion_workers,
+                use_cache=use_bundle_cache,
+                cache_dir=bundle_cache_dir,
+                llm_view_tokens=llm_view_tokens,
+                retrieval_view=retrieval_view,
+                diagnostics=metrics.ingestion_diagnostics,
+            )
+        inputs[CASE_BUNDLE_INPUT] = bundle_text
+        metrics.bundle_tokens = count_tokens(bundle_text)
+
+    with metrics.stage("build_crew"):
+        crew, task_map = build_crew(
+            pdf_path=pdf_path,
+            prompt_path=prompt_path,
+            use_arbiter_beta=use_arbiter_beta,
+            use_arbiter_gamma=use_arbiter_gamma,
+            ingestion_workers=ingestion_workers,
+            use_bundle_cache=use_bundle_cache,
+            bundle_cache_dir=bundle_cache_dir,
+            llm_view_tokens=llm_view_tokens,
+            analyst_concurrency=analyst_concurrency,
+            arbiter_concurrency=arbiter_concurrency,
+            ingestion_mode=ingestion_mode,
+            retrieval_view=retrieval_view,
+            repair_retries=repair_retries,
+            llm_cache=llm_cache,
+            consensus_gate=consensus_gate,
+            factory=crew_factory,
+        )
+    final_output: Any = None
+    group_crews: List[Crew] = []
+    report_agents = {
+        key: task.agent
+        for key, task in task_map.items()
+        if key in ("gpt_52", "gemini_30") or key.startswith("arbiter_")
+    }
+    streaming = (
+        stream_reports(report_agents, stream_dir, echo=stream_stdout)
+        if stream_dir is not None or stream_stdout
+        else nullcontext()
     )
-    final_output = crew.kickoff(inputs={"pdf_path": pdf_path, **kwargs})
+    with metrics.stage("crew"), capture_llm_calls(metrics, crew.agents), streaming as streamer:
+        if crew.tasks:
+            final_output = crew.kickoff(inputs=inputs)
+        for group in detached_task_groups(crew, task_map):
+            analysts = group[0] is task_map["gpt_52"] or group[0] is task_map["gemini_30"]
+            if not analysts and consensus_gate is not None and not consensus_gate.should_arbitrate():
+                continue
+            workers = analyst_concurrency if analysts else arbiter_concurrency
+            group_crews.extend(run_task_group(group, inputs, workers, verbose=crew.verbose))
+            final_output = _task_output_text(group[-1])
+    if streamer is not None:
+        metrics.streaming = streamer.to_dict()
+
+    consensus_report: Optional[str] = None
+    skipped: Set[str] = set()
+    if consensus_gate is not None:
+        result = consensus_gate.evaluate()
+        if result.agreed:
+            skipped = {key for key in task_map if key.startswith("arbiter_")}
+        arbiter_count = sum(1 for key in task_map if key.startswith("arbiter_"))
+        metrics.consensus = {
+            **result.to_dict(),
+            "arbiters_skipped": arbiter_count if result.agreed else 0,
+            "monitor": CONSENSUS_MONITOR.to_dict(),
+        }
+        if result.agreed:
+            consensus_report = render_consensus_report(
+                result, _task_output_text(task_map["gpt_52"]) or "", consensus_gate.tolerance
+            )
+            final_output = consensus_report
+
+    # Arbiters skipped by the gate have no output, or an empty ConditionalTask
+    # placeholder; they must not count as invalid arbiters or carry usage.
+    ran = {key: task for key, task in task_map.items() if key not in skipped}
+    for key, task in ran.items():
+        repair = getattr(getattr(task, "guardrail", None), "__self__", None)
+        if isinstance(repair, SectionCRepair) and repair.result is not None:
+            metrics.section_c_repairs[key] = repair.result.to_dict()
+
+    arbiter_reports = {
+        key.removeprefix("arbiter_"): _task_output_text(task)
+        for key, task in ran.items()
+        if key.startswith("arbiter_") and getattr(task, "output", None) is not None
+    }
+    ensemble_report: Optional[str] = None
+    if len(arbiter_reports) > 1:
+        ensemble = aggregate_arbiters(arbiter_reports)
+        metrics.arbiter_ensemble = ensemble.to_dict()
+        if ensemble.available:
+            ensemble_report = render_ensemble_report(ensemble, arbiter_reports)
+            final_output = ensemble_report
 
     if not capture_reports:
         return final_output
@@ -153,11 +260,57 @@ def run_crew(
     for key, task in task_map.items():
         if not key.startswith("arbiter_"):
             continue
-        reports[key] = _task_output_text(task)
+        reports[key] = _task_output_text(task) if key in ran else None
+
+    if consensus_report is not None:
+        reports["consensus"] = consensus_report
+    if ensemble_report is not None:
+        reports["arbiter_ensemble"] = ensemble_report
+
+    if "case_bundle" in task_map:
+        view_stats = _llm_view_stats(task_map["case_bundle"])
+    if view_stats:
+        reports["llm_view_stats"] = json.dumps(view_stats, indent=2)
+
+    for key, task in ran.items():
+        metrics.record_usage(key, _agent_usage(task))
+    metrics.record_usage("total", _total_usage([crew, *group_crews]))
+    if llm_cache is not None:
+        # The default cache is process-wide; report this run's share only.
+        metrics.llm_cache = {
+            name: value - cache_before.get(name, 0) for name, value in llm_cache.stats.to_dict().items()
+        }
+    reports["run_metrics"] = json.dumps(metrics.to_dict(), indent=2)
 
     return final_output, reports
 
 
+def _total_usage(crews: List[Crew]) -> Any:
+    usages = [crew.usage_metrics for crew in crews if getattr(crew, "usage_metrics", None) is not None]
+    if not usages:
+        return None
+    total = usages[0].model_copy()
+    for usage in usages[1:]:
+        total.add_usage_metrics(usage)
+    return total
+
+
+def _agent_usage(task: Task) -> Any:
+    llm = getattr(task.agent, "llm", None)
+    summary = getattr(llm, "get_token_usage_summary", None)
+    return summary() if callable(summary) else None
+
+
+def _llm_view_stats(task: Task) -> Optional[Dict[str, Any]]:
+    """Token savings recorded by the extraction tool when the LLM view was used."""
+
+    for tool in getattr(task.agent, "tools", None) or []:
+        stats = getattr(tool, "last_llm_view", None)
+        if stats:
+            return stats
+    return None
+
+
 def _task_output_text(task: Task) -> Optional[str]:
     output = getattr(task, "output", None)
     if output is None:
@@ -174,4 +327,4 @@ def _task_output_text(task: Task) -> Optional[str]:
     return str(output)
 
 
-__all__ = ["build_crew", "run_crew"]
+__all__ = ["INGESTION_MODES", "build_crew", "detached_task_groups", "run_crew", "run_task_group"]
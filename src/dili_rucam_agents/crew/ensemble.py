@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+from dili_rucam_agents.validators.rucam_engine import RUCAM_ITEMS, category_for_total, injury_pattern_for_r
+from dili_rucam_agents.validators.rucam_json import (
+    RucamReport,
+    extract_section_c,
+    sections_before_c,
+    validate_rucam_json,
+)
+
+# An ensemble decision needs at least this many parseable arbiter SECTION C blocks.
+MIN_ENSEMBLE_SIZE = 2
+
+
+def _low_median(values: Sequence[float]) -> float:
+    """Median that picks the lower middle value for even counts (conservative for scores)."""
+
+    ordered = sorted(values)
+    return ordered[(len(ordered) - 1) // 2]
+
+
+def _majority(values: Sequence[str]) -> str:
+    """Most common value; ties go to the value seen first (arbiter order)."""
+
+    counts = Counter(values)
+    best = max(counts.values())
+    return next(value for value in values if counts[value] == best)
+
+
+@dataclass
+class EnsembleResult:
+    """Deterministic combination of the arbiters' SECTION C decisions."""
+
+    arbiters: List[str] = field(default_factory=list)
+    reports: Dict[str, RucamReport] = field(default_factory=dict)
+    invalid: Dict[str, str] = field(default_factory=dict)
+    decision: Optional[Dict[str, Any]] = None
+    category_votes: Dict[str, int] = field(default_factory=dict)
+    majority_category: Optional[str] = None
+    item_spread: Dict[str, int] = field(default_factory=dict)
+    disagreement: float = 0.0
+
+    @property
+    def available(self) -> bool:
+        return self.decision is not None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "arbiters": list(self.arbiters),
+            "invalid": dict(self.invalid),
+            "decision": self.decision,
+            "category_votes": dict(self.category_votes),
+            "majority_category": self.majority_category,
+            "item_spread": dict(self.item_spread),
+            "disagreement": self.disagreement,
+        }
+
+
+def aggregate_arbiters(arbiter_reports: Dict[str, Optional[str]]) -> EnsembleResult:
+    """Combine arbiter reports (label → markdown) into one ensemble decision.
+
+    Each RUCAM item takes the (lower) median across arbiters and the total is
+    re-derived from those items, so the category always matches the score table.
+    Likewise the injury pattern is derived from the (lower) median R ratio rather
+    than voted separately, so the two never contradict each other.
+    ``majority_category`` records the plain vote over the arbiters' own categories.
+    ``disagreement`` is the mean absolute deviation of item scores from the
+    ensemble item, in RUCAM points; ``item_spread`` is the max–min per item.
+    """
+
+    result = EnsembleResult()
+    for label, report in arbiter_reports.items():
+        payload = extract_section_c(report) if report else None
+        if payload is None:
+            result.invalid[label] = "SECTION C JSON not found"
+            continue
+        try:
+            result.reports[label] = validate_rucam_json(payload)
+        except ValueError as exc:
+            result.invalid[label] = str(exc)
+    result.arbiters = list(result.reports)
+    if len(result.reports) < MIN_ENSEMBLE_SIZE:
+        return result
+
+    parsed = list(result.reports.values())
+    items: Dict[str, int] = {}
+    deviations: List[float] = []
+    for item in RUCAM_ITEMS:
+        scores = [getattr(report.rucam_scores, item) for report in parsed]
+        items[item] = int(_low_median(scores))
+        result.item_spread[item] = max(scores) - min(scores)
+        deviations.extend(abs(score - items[item]) for score in scores)
+
+    categories = [report.category for report in parsed]
+    result.category_votes = dict(Counter(categories))
+    result.majority_category = _majority(categories)
+    result.disagreement = round(sum(deviations) / len(deviations), 4)
+
+    total = sum(items.values())
+    r_value = round(_low_median([report.R_ratio for report in parsed]), 2)
+    result.decision = {
+        "injury_pattern": injury_pattern_for_r(r_value),
+        "R_ratio": r_value,
+        "rucam_scores": items,
+        "total_score": total,
+        "category": category_for_total(total),
+    }
+    return result
+
+
+def render_ensemble_report(result: EnsembleResult, arbiter_reports: Dict[str, Optional[str]]) -> str:
+    """Final report for a multi-arbiter run; Sections A and B come from the arbiter closest to the ensemble."""
+
+    if result.decision is None:
+        raise ValueError(f"ensemble report requires at least {MIN_ENSEMBLE_SIZE} valid arbiter reports")
+    total = result.decision["total_score"]
+    representative = min(result.arbiters, key=lambda label: abs(result.reports[label].total_score - total))
+    header = " | ".join(["RUCAM Item", *result.arbiters, "Ensemble", "Spread"])
+    rows = [
+        "| "
+        + " | ".join(
+            [
+                item,
+                *(str(getattr(result.reports[label].rucam_scores, item)) for label in result.arbiters),
+                str(result.decision["rucam_scores"][item]),
+                str(result.item_spread[item]),
+            ]
+        )
+        + " |"
+        for item in RUCAM_ITEMS
+    ]
+    totals = " | ".join(
+        [
+            "**Total**",
+            *(f"{result.reports[label].total_score} ({result.reports[label].category})" for label in result.arbiters),
+            f"**{total} ({result.decision['category']})**",
+            "",
+        ]
+    )
+    votes = ", ".join(f"{category}: {count}" for category, count in result.category_votes.items())
+    return "\n".join(
+        [
+            "# Arbiter Ensemble Report",
+            "",
+            f"{len(result.arbiters)} arbiters ({', '.join(result.arbiters)}) were combined by per-item median; "
+            f"Sections A and B are {representative}'s.",
+            "",
+            sections_before_c(arbiter_reports.get(representative) or "").strip(),
+            "",
+            "## SECTION C — ENSEMBLE JSON",
+            "```json",
+            json.dumps(result.decision, indent=2),
+            "```",
+            "",
+            "## SECTION D — ENSEMBLE JUSTIFICATION",
+            f"| {header} |",
+            "| " + " | ".join(["---"] * (len(result.arbiters) + 3)) + " |",
+            *rows,
+            f"| {totals} |",
+            "",
+            f"Category votes: {votes} (majority: {result.majority_category}). "
+            f"Mean absolute deviation from the ensemble: {result.disagreement} points per item.",
+        ]
+    )
+
+
+__all__ = [
+    "MIN_ENSEMBLE_SIZE",
+    "EnsembleResult",
+    "aggregate_arbiters",
+    "render_ensemble_report",
+]
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from crewai import Agent, Crew, Process, Task
+
+from dili_rucam_agents.ingestion.build_bundle import INGESTION_MODES
+from dili_rucam_agents.ingestion.bundle_cache import bundle_cache_key
+
+from .agents import build_arbiter_agent, build_ingestion_agent, build_rucam_agent
+from .consensus import ConsensusGate
+from .llm_cache import LLMResponseCache, install_llm_cache_on_agents
+from .repair import DEFAULT_REPAIR_RETRIES, SectionCRepair
+from .tasks import (
+    create_analysis_task,
+    create_arbiter_task,
+    create_case_bundle_task,
+    load_arbiter_prompt,
+    load_rucam_prompt,
+)
+
+TaskMap = Dict[str, Task]
+
+ARBITER_CONFIGS = (
+    {"label": "Arbiter Alpha", "model_env": "ARBITER_ALPHA_MODEL", "default_model": "deepseek-reasoner"},
+    {"label": "Arbiter Beta", "model_env": "ARBITER_BETA_MODEL", "default_model": "gpt-5.2"},
+    {"label": "Arbiter Gamma", "model_env": "ARBITER_GAMMA_MODEL", "default_model": "gpt-5.2"},
+)
+
+
+def _fresh_agent(template: Agent) -> Agent:
+    """Per-case copy of a warm agent.
+
+    ``Agent.copy`` shallow-copies the LLM, so the provider HTTP clients (the
+    expensive part to build) are shared, while the copy gets its own token counters,
+    ``call`` overrides (LLM cache) and tool instances.
+    """
+
+    agent = template.copy()
+    llm = agent.llm
+    if isinstance(getattr(llm, "_token_usage", None), dict):
+        llm._token_usage = {key: 0 for key in llm._token_usage}
+    if template.tools:
+        agent.tools = [tool.model_copy() for tool in template.tools]
+    return agent
+
+
+class CrewFactory:
+    """Builds agents, LLM clients and prompt text once; hands out a fresh crew per PDF.
+
+    The warm agents are templates and are never run; :meth:`build` copies them, so
+    one factory can serve many cases, including concurrently from threads or
+    asyncio tasks (via ``asyncio.to_thread``).
+
+    ``ingestion_mode="direct"`` drops the ingestion agent and task: the analysts read
+    the bundle from the ``case_bundle`` kickoff input instead (see ``run_crew``).
+
+    With ``analyst_concurrency`` above 1 the GPT-5.2 and Gemini 3.0 analyses run as
+    CrewAI async tasks: both start once the case bundle is ready and the first
+    arbiter waits for both, so analyst latency is the slower call instead of the sum.
+    There are two analysts, so any value of 2 or more runs them fully in parallel.
+
+    With ``retrieval_view`` analysts read the relevance-pruned view of the bundle
+    (see :mod:`dili_rucam_agents.ingestion.retrieval`), and the arbiters get the
+    same pruned view so they can check disagreements against the source passages.
+
+    Every analyst and arbiter task gets a :class:`SectionCRepair` guardrail: an
+    invalid SECTION C is fixed with up to ``repair_retries`` small calls (errors plus
+    prior output) instead of a crew rerun; 0 disables the stage.
+
+    With ``arbiter_concurrency`` above 1 and more than one arbiter enabled, the
+    arbiter tasks are left out of the returned crew and listed in the task map only;
+    ``run_crew`` runs them side by side once the analysts finish (see
+    ``detached_task_groups``). CrewAI does not let a crew end on several async
+    tasks, so async analysts are detached the same way in that case.
+    """
+
+    def __init__(
+        self,
+        prompt_path: Optional[Path] = None,
+        *,
+        use_arbiter_beta: bool = False,
+        use_arbiter_gamma: bool = False,
+        ingestion_workers: int = 1,
+        use_bundle_cache: bool = True,
+        bundle_cache_dir: Optional[str] = None,
+        llm_view_tokens: Optional[int] = None,
+        analyst_concurrency: int = 1,
+        arbiter_concurrency: int = 1,
+        ingestion_mode: str = "agent",
+        retrieval_view: bool = False,
+        repair_retries: int = DEFAULT_REPAIR_RETRIES,
+    ) -> None:
+        if analyst_concurrency < 1:
+            raise ValueError(f"analyst_concurrency must be >= 1, got {analyst_concurrency}")
+        if arbiter_concurrency < 1:
+            raise ValueError(f"arbiter_concurrency must be >= 1, got {arbiter_concurrency}")
+        if repair_retries < 0:
+            raise ValueError(f"repair_retries must be >= 0, got {repair_retries}")
+        if ingestion_mode not in INGESTION_MODES:
+            raise ValueError(f"ingestion_mode must be one of {INGESTION_MODES}, got {ingestion_mode!r}")
+
+        self.ingestion_mode = ingestion_mode
+        self.llm_view_tokens = llm_view_tokens
+        self.retrieval_view = retrieval_view
+        self.repair_retries = repair_retries
+        self.analysts_async = analyst_concurrency > 1
+        self.arbiters_parallel = arbiter_concurrency > 1 and (use_arbiter_beta or use_arbiter_gamma)
+        self.analysts_detached = self.arbiters_parallel and self.analysts_async
+
+        prompt_text = load_rucam_prompt(prompt_path)
+        arbiter_prompt_text = load_arbiter_prompt()
+
+        self._ingestion_agent: Optional[Agent] = None
+        if ingestion_mode == "agent":
+            self._ingestion_agent = build_ingestion_agent(
+                ingestion_workers=ingestion_workers,
+                use_bundle_cache=use_bundle_cache,
+                bundle_cache_dir=bundle_cache_dir,
+                llm_view_tokens=llm_view_tokens,
+                retrieval_view=retrieval_view,
+            )
+        self._gpt_agent = build_rucam_agent(
+            label="GPT-5.2",
+            model_env="OPENAI_MODEL",
+            default_model="gpt-5.2",
+            vendor_note="OpenAI GPT-5.2 deterministic reasoning model.",
+            prompt_text=prompt_text,
+        )
+        self._gemini_agent = build_rucam_agent(
+            label="Gemini 3.0",
+            model_env="GEMINI_MODEL",
+            default_model="gemini-3-pro-preview",
+            vendor_note="Google Gemini 3.0 dual-encoder causal reasoning model.",
+            prompt_text=prompt_text,
+        )
+        enabled = {"Arbiter Alpha": True, "Arbiter Beta": use_arbiter_beta, "Arbiter Gamma": use_arbiter_gamma}
+        self._arbiter_agents: List[Tuple[str, Agent]] = [
+            (
+                config["label"],
+                build_arbiter_agent(
+                    label=config["label"],
+                    model_env=config["model_env"],
+                    default_model=config["default_model"],
+                    prompt_text=arbiter_prompt_text,
+                ),
+            )
+            for config in ARBITER_CONFIGS
+            if enabled[config["label"]]
+        ]
+
+    def _repair(self, agent: Agent) -> Optional[Callable[[Any], Any]]:
+        return SectionCRepair(agent, self.repair_retries).validate if self.repair_retries else None
+
+    def build(
+        self,
+        pdf_path: str,
+        *,
+        llm_cache: Optional[LLMResponseCache] = None,
+        consensus_gate: Optional[ConsensusGate] = None,
+    ) -> Tuple[Crew, TaskMap]:
+        """Fresh agents, tasks and crew for one PDF.
+
+        When ``llm_cache`` is given, every agent's temperature-0 calls are served from
+        it. With a ``consensus_gate`` the arbiters become conditional tasks that are
+        skipped when the two analysts' SECTION C agree.
+        """
+
+        ingestion_agent = _fresh_agent(self._ingestion_agent) if self._ingestion_agent is not None else None
+        case_bundle_task = None
+        if ingestion_agent is not None:
+            case_bundle_task = create_case_bundle_task(
+                pdf_path=pdf_path,
+                agent=ingestion_agent,
+                llm_view=bool(self.llm_view_tokens) or self.retrieval_view,
+            )
+
+        gpt_agent = _fresh_agent(self._gpt_agent)
+        gemini_agent = _fresh_agent(self._gemini_agent)
+        analysts_async = self.analysts_async and not self.analysts_detached
+        gpt_task = create_analysis_task(
+            agent=gpt_agent,
+            case_bundle_task=case_bundle_task,
+            analyst_label="GPT-5.2",
+            model_reference="OPENAI_MODEL",
+            async_execution=analysts_async,
+            guardrail=self._repair(gpt_agent),
+        )
+        gemini_task = create_analysis_task(
+            agent=gemini_agent,
+            case_bundle_task=case_bundle_task,
+            analyst_label="Gemini 3.0",
+            model_reference="GEMINI_MODEL",
+            async_execution=analysts_async,
+            guardrail=self._repair(gemini_agent),
+        )
+        if consensus_gate is not None:
+            consensus_gate.bind(gpt_task, gemini_task)
+
+        task_map: TaskMap = {
+            "gpt_52": gpt_task,
+            "gemini_30": gemini_task,
+        }
+        if case_bundle_task is not None:
+            task_map["case_bundle"] = case_bundle_task
+
+        arbiter_agents: List[Agent] = []
+        arbiter_tasks: List[Task] = []
+        for label, template in self._arbiter_agents:
+            agent = _fresh_agent(template)
+            task = create_arbiter_task(
+                agent=agent,
+                gpt_task=gpt_task,
+                gemini_task=gemini_task,
+                arbiter_label=label,
+                # Detached arbiters are gated by run_crew itself; ConditionalTasks need a crew.
+                condition=(
+                    consensus_gate.should_arbitrate
+                    if consensus_gate is not None and not self.arbiters_parallel
+                    else None
+                ),
+                with_case_bundle=self.retrieval_view,
+                case_bundle_task=case_bundle_task,
+                guardrail=self._repair(agent),
+            )
+            arbiter_agents.append(agent)
+            arbiter_tasks.append(task)
+            task_map[f"arbiter_{label.lower().replace(' ', '_')}"] = task
+
+        ingestion_agents = [ingestion_agent] if ingestion_agent is not None else []
+        ingestion_tasks = [case_bundle_task] if case_bundle_task is not None else []
+        all_agents = [*ingestion_agents, gpt_agent, gemini_agent, *arbiter_agents]
+        if llm_cache is not None:
+            pdf_file = Path(pdf_path)
+            bundle_hash = bundle_cache_key(pdf_file) if pdf_file.is_file() else ""
+            install_llm_cache_on_agents(all_agents, llm_cache, bundle_hash=bundle_hash)
+
+        analyst_tasks = [] if self.analysts_detached else [gpt_task, gemini_task]
+        crew = Crew(
+            agents=all_agents,
+            tasks=[*ingestion_tasks, *analyst_tasks, *([] if self.arbiters_parallel else arbiter_tasks)],
+            process=Process.sequential,
+            verbose=True,
+        )
+        return crew, task_map
+
+
+_FACTORY_OPTIONS = (
+    "use_arbiter_beta",
+    "use_arbiter_gamma",
+    "ingestion_workers",
+    "use_bundle_cache",
+    "bundle_cache_dir",
+    "llm_view_tokens",
+    "analyst_concurrency",
+    "arbiter_concurrency",
+    "ingestion_mode",
+    "retrieval_view",
+    "repair_retries",
+)
+
+
+def factory_options(options: Dict[str, Any]) -> Dict[str, Any]:
+    """The subset of ``run_crew``-style keyword arguments that configure a :class:`CrewFactory`."""
+
+    return {name: options[name] for name in _FACTORY_OPTIONS if name in options}
+
+
+__all__ = ["ARBITER_CONFIGS", "INGESTION_MODES", "CrewFactory", "TaskMap", "factory_options"]
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+
+DEFAULT_LLM_CACHE_PATH = Path("~/.cache/dili_rucam_agents/llm_responses.sqlite3")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+
+# LLM attributes that change the response for identical messages.
+SAMPLING_ATTRIBUTES = (
+    "temperature",
+    "top_p",
+    "max_tokens",
+    "max_completion_tokens",
+    "seed",
+    "stop",
+    "reasoning_effort",
+    "response_format",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+)
+"""
+
+
+def _sha256(payload: Any) -> str:
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def request_key(llm: Any, messages: Any, bundle_hash: str = "") -> str:
+    """Cache key: model identity, rendered prompt hash, case-bundle hash and sampling params."""
+
+    return _sha256(
+        {
+            "model": getattr(llm, "model", None),
+            "provider": getattr(llm, "provider", None) or getattr(llm, "custom_llm_provider", None),
+            "base_url": getattr(llm, "base_url", None) or getattr(llm, "api_base", None),
+            "prompt_sha256": _sha256(messages),
+            "bundle_sha256": bundle_hash,
+            "sampling": {name: getattr(llm, name, None) for name in SAMPLING_ATTRIBUTES},
+        }
+    )
+
+
+@dataclass
+class LLMCacheStats:
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+        }
+
+
+class LLMResponseCache:
+    """SQLite-backed cache of temperature-0 LLM responses.
+
+    Every operation opens its own short-lived connection (WAL journal), so the cache
+    is safe to share between the crew's async task threads and between processes of
+    a batch run. Entries older than ``max_age_seconds`` are ignored and purged, and
+    the least recently read entries are evicted once responses exceed ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+    ) -> None:
+        self.path = Path(path or os.getenv("DILI_RUCAM_LLM_CACHE") or DEFAULT_LLM_CACHE_PATH).expanduser()
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.stats = LLMCacheStats()
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT response FROM responses WHERE key = ? AND created >= ?",
+                (key, now - self.max_age_seconds),
+            ).fetchone()
+            if row is not None:
+                conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        with self._lock:
+            if row is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return row[0] if row is not None else None
+
+    def put(self, key: str, model: str, response: str) -> None:
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, size, created, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, len(response.encode("utf-8")), now, now),
+            )
+        with self._lock:
+            self.stats.writes += 1
+        self.evict()
+
+    def evict(self) -> int:
+        """Apply age and size limits; return the number of entries removed."""
+
+        with closing(self._connect()) as conn, conn:
+            removed = conn.execute(
+                "DELETE FROM responses WHERE created < ?", (time.time() - self.max_age_seconds,)
+            ).rowcount
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > self.max_bytes:
+                for key, size in conn.execute("SELECT key, size FROM responses ORDER BY accessed").fetchall():
+                    if total <= self.max_bytes:
+                        break
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    total -= size
+                    removed += 1
+        with self._lock:
+            self.stats.evictions += removed
+        return removed
+
+    def clear(self) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM responses")
+
+    def __len__(self) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+def install_llm_cache(llm: Any, cache: LLMResponseCache, *, bundle_hash: str = "") -> None:
+    """Route ``llm.call`` through ``cache`` for deterministic, tool-free calls.
+
+    Only temperature-0 calls that return plain text are cached. Calls that carry
+    tools or a response model are always forwarded, because their side effects
+    (tool execution) or structured results must not be replayed from text.
+    """
+
+    if getattr(llm, "temperature", None) not in (0, 0.0):
+        return
+    original: Callable[..., Any] = llm.call
+
+    def cached_call(messages: Any, tools: Any = None, *args: Any, **kwargs: Any) -> Any:
+        if tools or kwargs.get("available_functions") or kwargs.get("response_model"):
+            return original(messages, tools, *args, **kwargs)
+
+        key = request_key(llm, messages, bundle_hash)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        response = original(messages, tools, *args, **kwargs)
+        if isinstance(response, str) and response.strip():
+            try:
+                cache.put(key, str(getattr(llm, "model", "")), response)
+            except sqlite3.Error:  # pragma: no cover - caching is best-effort
+                pass
+        return response
+
+    # LLM classes are pydantic models; bypass field validation for the instance override.
+    object.__setattr__(llm, "call", cached_call)
+
+
+def install_llm_cache_on_agents(agents: Iterable[Any], cache: LLMResponseCache, *, bundle_hash: str = "") -> None:
+    for agent in agents:
+        llm = getattr(agent, "llm", None)
+        if llm is not None:
+            install_llm_cache(llm, cache, bundle_hash=bundle_hash)
+
+
+_DEFAULT_CACHES: Dict[Path, LLMResponseCache] = {}
+_DEFAULT_CACHES_LOCK = threading.Lock()
+
+
+def get_default_llm_cache(path: Optional[Path] = None) -> LLMResponseCache:
+    """Process-wide cache per database so hit/miss counters accumulate across runs."""
+
+    resolved = Path(path or os.getenv("DILI_RUCAM_LLM_CACHE") or DEFAULT_LLM_CACHE_PATH).expanduser().resolve()
+    with _DEFAULT_CACHES_LOCK:
+        cache = _DEFAULT_CACHES.get(resolved)
+        if cache is None:
+            cache = LLMResponseCache(resolved)
+            _DEFAULT_CACHES[resolved] = cache
+        return cache
+
+
+__all__ = [
+    "LLMCacheStats",
+    "LLMResponseCache",
+    "get_default_llm_cache",
+    "install_llm_cache",
+    "install_llm_cache_on_agents",
+    "request_key",
+]
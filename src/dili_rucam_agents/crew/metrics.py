@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+@dataclass
+class RunMetrics:
+    """Wall time per stage and LLM token usage per agent for one crew run."""
+
+    pdf_path: str
+    ingestion_mode: str
+    stage_seconds: Dict[str, float] = field(default_factory=dict)
+    token_usage: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    bundle_tokens: Optional[int] = None
+    ingestion_diagnostics: Optional[Dict[str, Any]] = None
+    llm_cache: Optional[Dict[str, int]] = None
+    consensus: Optional[Dict[str, Any]] = None
+    arbiter_ensemble: Optional[Dict[str, Any]] = None
+    section_c_repairs: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    streaming: Optional[Dict[str, Dict[str, Any]]] = None
+    llm_calls: List[Dict[str, Any]] = field(default_factory=list)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_seconds[name] = round(
+                self.stage_seconds.get(name, 0.0) + time.perf_counter() - start, 4
+            )
+
+    def record_usage(self, key: str, usage: Any) -> None:
+        """Store a CrewAI ``UsageMetrics`` (or plain dict) under ``key``."""
+
+        if usage is None:
+            return
+        payload = usage.model_dump() if hasattr(usage, "model_dump") else dict(usage)
+        self.token_usage[key] = {name: int(value or 0) for name, value in payload.items()}
+
+    def record_llm_call(self, agent_role: Optional[str], model: Optional[str], usage: Any) -> None:
+        """Append one provider call, splitting input tokens into cached and uncached."""
+
+        prompt_tokens = int(usage.prompt_tokens or 0)
+        cached = int(usage.cached_prompt_tokens or 0)
+        self.llm_calls.append(
+            {
+                "agent": agent_role,
+                "model": model,
+                "prompt_tokens": prompt_tokens,
+                "cached_prompt_tokens": cached,
+                "uncached_prompt_tokens": max(prompt_tokens - cached, 0),
+                "cache_creation_tokens": int(usage.cache_creation_tokens or 0),
+                "completion_tokens": int(usage.completion_tokens or 0),
+            }
+        )
+
+    def prompt_cache_summary(self) -> Dict[str, Any]:
+        prompt_tokens = sum(call["prompt_tokens"] for call in self.llm_calls)
+        cached = sum(call["cached_prompt_tokens"] for call in self.llm_calls)
+        return {
+            "calls": len(self.llm_calls),
+            "prompt_tokens": prompt_tokens,
+            "cached_prompt_tokens": cached,
+            "uncached_prompt_tokens": prompt_tokens - cached,
+            "cached_fraction": round(cached / prompt_tokens, 4) if prompt_tokens else 0.0,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "pdf_path": self.pdf_path,
+            "ingestion_mode": self.ingestion_mode,
+            "stage_seconds": dict(self.stage_seconds),
+            "token_usage": {key: dict(value) for key, value in self.token_usage.items()},
+            "bundle_tokens": self.bundle_tokens,
+            "ingestion_diagnostics": self.ingestion_diagnostics,
+            "llm_cache": dict(self.llm_cache) if self.llm_cache is not None else None,
+            "consensus": self.consensus,
+            "arbiter_ensemble": self.arbiter_ensemble,
+            "section_c_repairs": {key: dict(value) for key, value in self.section_c_repairs.items()},
+            "streaming": {key: dict(value) for key, value in self.streaming.items()} if self.streaming else None,
+            "prompt_cache": self.prompt_cache_summary(),
+            "llm_calls": [dict(call) for call in self.llm_calls],
+        }
+
+
+@contextmanager
+def capture_llm_calls(metrics: RunMetrics, agents: Iterable[Any]) -> Iterator[None]:
+    """Record every completed LLM call of ``agents`` into ``metrics.llm_calls``.
+
+    Usage comes from CrewAI's ``LLMCallCompletedEvent`` (the provider/LiteLLM usage
+    block). The event bus is process-wide, so calls are filtered by agent id and
+    concurrent runs do not see each other's calls. Cache hits from
+    :mod:`llm_cache` never reach a provider and are not recorded.
+    """
+
+    from crewai.events import LLMCallCompletedEvent, crewai_event_bus
+    from crewai.types.usage_metrics import UsageMetrics
+
+    agent_ids = {str(agent.id) for agent in agents}
+    lock = threading.Lock()
+
+    def on_completed(_source: Any, event: Any) -> None:
+        if event.agent_id not in agent_ids:
+            return
+        usage = UsageMetrics.from_provider_dict(event.usage)
+        if usage is None:
+            return
+        with lock:
+            metrics.record_llm_call(event.agent_role, event.model, usage)
+
+    crewai_event_bus.on(LLMCallCompletedEvent)(on_completed)
+    try:
+        yield
+    finally:
+        crewai_event_bus.flush()
+        crewai_event_bus.off(LLMCallCompletedEvent, on_completed)
+
+
+__all__ = ["RunMetrics", "capture_llm_calls"]
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import Optional
+
+# Provider prompt caches (OpenAI, Anthropic, Gemini, DeepSeek) match on an exact
+# prefix, so every request is laid out as:
+#
+#   system message  persona + production prompt        identical for every case
+#   user message    task instructions + case content   instructions first, case data last
+#
+# CrewAI marks the system message as a cache breakpoint; the native Anthropic
+# provider turns that into an explicit ``cache_control`` block, while OpenAI,
+# Gemini and DeepSeek cache the same prefix implicitly.
+
+
+def static_block(title: str, text: str) -> str:
+    """Prompt file as a byte-stable block: LF line endings, no trailing whitespace."""
+
+    lines = text.replace("\r\n", "\n").replace("\r", "\n").strip().split("\n")
+    body = "\n".join(line.rstrip() for line in lines)
+    return f"--- BEGIN {title} ---\n{body}\n--- END {title} ---"
+
+
+def with_static_prompt(backstory: str, title: str, prompt_text: Optional[str]) -> str:
+    """Append the production prompt to an agent backstory so it lands in the system message."""
+
+    if not prompt_text:
+        return backstory
+    return f"{backstory}\n\n{static_block(title, prompt_text)}"
+
+
+def assemble_description(instructions: str, case_content: Optional[str] = None) -> str:
+    """Task description with the fixed instructions ahead of any per-case content."""
+
+    if case_content is None:
+        return instructions
+    return f"{instructions}\n\n{case_content}"
+
+
+__all__ = ["assemble_description", "static_block", "with_static_prompt"]
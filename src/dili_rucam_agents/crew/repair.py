@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from dili_rucam_agents.validators.rucam_engine import (
+    CATEGORIES,
+    CATEGORY_THRESHOLDS,
+    ITEM_RANGES,
+    R_CHOLESTATIC,
+    R_HEPATOCELLULAR,
+    accepted_patterns,
+    category_for_total,
+)
+
+# Repair calls allowed per task before the invalid output is passed on unchanged.
+DEFAULT_REPAIR_RETRIES = 2
+
+# Where an unparseable SECTION C object ends when it is replaced.
+_NEXT_HEADING = re.compile(r"^\s*(?:#+\s|SECTION\s+D\b)", re.MULTILINE)
+
+
+def _category_rules() -> str:
+    lower = None
+    rules = []
+    for upper, category in zip((*CATEGORY_THRESHOLDS, None), CATEGORIES):
+        if lower is None:
+            rules.append(f"{category} <= {upper}")
+        elif upper is None:
+            rules.append(f"{category} >= {lower}")
+        else:
+            rules.append(f"{category} {lower}-{upper}")
+        lower = upper + 1 if upper is not None else None
+    return ", ".join(rules)
+
+
+REPAIR_SYSTEM_PROMPT = (
+    "You correct the SECTION C JSON of a RUCAM causality report. Reply with only the corrected JSON "
+    "object in a ```json fence. Keys: injury_pattern (hepatocellular | mixed | cholestatic), R_ratio "
+    "(number >= 0), rucam_scores with integer items "
+    + ", ".join(
+        f"{'other_causes_excluded' if item == 'alternative_causes_excluded' else item} [{low}, {high}]"
+        for item, (low, high) in ITEM_RANGES.items()
+    )
+    + f", total_score (the sum of the items) and category ({_category_rules()}). "
+    f"R >= {R_HEPATOCELLULAR:g} is hepatocellular, R <= {R_CHOLESTATIC:g} cholestatic, mixed in between. "
+    "Keep the scores and evidence of the report's SECTION B; change only what the listed errors require."
+)
+
+
+def section_c_problems(report: str) -> Optional[List[str]]:
+    """Why ``report``'s SECTION C is invalid; ``[]`` when valid, ``None`` when it has none at all.
+
+    Beyond the schema (``RucamReport``), the category must match the total and the
+    injury pattern must match R.
+    """
+
+    # The pydantic report models load on first use: the pipeline CLI imports this
+    # module for DEFAULT_REPAIR_RETRIES and keeps `--help` free of them.
+    from dili_rucam_agents.validators.report_batch import validate_rucam_batch
+    from dili_rucam_agents.validators.rucam_json import extract_section_c, section_c_heading
+
+    payload = extract_section_c(report)
+    if payload is None:
+        if section_c_heading(report):
+            return ["SECTION C JSON missing or not parseable"]
+        return None
+
+    result = validate_rucam_batch([payload])[0]
+    if not result.ok:
+        return result.errors
+    parsed = result.report
+    problems = []
+    expected_category = category_for_total(parsed.total_score)
+    if parsed.category != expected_category:
+        problems.append(
+            f"category: {parsed.category!r} does not match total_score {parsed.total_score} ({expected_category!r})"
+        )
+    if parsed.injury_pattern not in accepted_patterns(parsed.R_ratio):
+        problems.append(
+            f"injury_pattern: {parsed.injury_pattern!r} does not match R_ratio {parsed.R_ratio} "
+            f"({' or '.join(repr(p) for p in accepted_patterns(parsed.R_ratio))})"
+        )
+    return problems
+
+
+def replace_section_c(report: str, payload: Dict[str, Any]) -> str:
+    """``report`` with its SECTION C JSON swapped for ``payload`` (appended when absent).
+
+    The JSON replaced is the one :func:`extract_section_c` reads, found through the
+    same heading and fence patterns.
+    """
+
+    from dili_rucam_agents.validators.rucam_json import section_c_heading, section_c_span
+
+    block = "```json\n" + json.dumps(payload, indent=2, ensure_ascii=False) + "\n```"
+    span = section_c_span(report)
+    if span is not None:
+        start, end = span
+        return f"{report[:start]}{block}{report[end:]}"
+
+    heading = section_c_heading(report)
+    if heading is None:
+        return f"{report.rstrip()}\n\n## SECTION C — MACHINE-READABLE JSON\n\n{block}\n"
+    tail = report[heading.end() :]
+    start = tail.find("{")
+    if start == -1:
+        return f"{report[: heading.end()]}\n\n{block}\n{tail.lstrip()}"
+    # Unparseable object: replace up to the next heading (or the end).
+    following = _NEXT_HEADING.search(tail, start)
+    end = following.start() if following else len(tail)
+    return f"{report[: heading.end()]}{tail[:start]}{block}{tail[end:]}"
+
+
+@dataclass
+class RepairResult:
+    """What the repair stage did to one task output."""
+
+    problems: List[str] = field(default_factory=list)
+    attempts: int = 0
+    repaired: bool = False
+    remaining: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "problems": list(self.problems),
+            "attempts": self.attempts,
+            "repaired": self.repaired,
+            "remaining": list(self.remaining),
+        }
+
+
+class SectionCRepair:
+    """Task guardrail (:meth:`validate`) that fixes an invalid SECTION C with small follow-up calls.
+
+    CrewAI's own guardrail retry re-runs the whole task (production prompt, case
+    bundle, analyst reports). This guardrail instead sends the agent's LLM only the
+    validation errors and the prior output, asks for the corrected JSON, and splices
+    it into the report, up to ``retries`` times. It always passes: an output it
+    cannot repair (including when a repair call itself fails) continues unchanged,
+    exactly as without the stage, and ``result`` records what happened. Reports
+    with no SECTION C at all are left alone.
+    """
+
+    def __init__(self, agent: Any, retries: int = DEFAULT_REPAIR_RETRIES) -> None:
+        self.agent = agent
+        self.retries = retries
+        self.result: Optional[RepairResult] = None
+
+    def _ask(self, report: str, problems: List[str], previous: Optional[str]) -> str:
+        parts = ["Validation errors:", *(f"- {problem}" for problem in problems)]
+        parts.append(f"--- BEGIN PRIOR OUTPUT ---\n{report}\n--- END PRIOR OUTPUT ---")
+        if previous is not None:
+            parts.append(f"Your previous correction was still invalid:\n{previous}")
+        messages = [
+            {"role": "system", "content": REPAIR_SYSTEM_PROMPT},
+            {"role": "user", "content": "\n\n".join(parts)},
+        ]
+        return str(self.agent.llm.call(messages, from_agent=self.agent))
+
+    # Handed to CrewAI as the bound method: its guardrail events read the source of
+    # the callable, which fails for instances. No return annotation either, since
+    # CrewAI checks it at runtime and string annotations fail that check.
+    def validate(self, output: Any):
+        from dili_rucam_agents.validators.rucam_json import extract_section_c
+
+        report = output.raw or ""
+        problems = section_c_problems(report)
+        if not problems:
+            return True, output
+
+        result = RepairResult(problems=list(problems), remaining=list(problems))
+        self.result = result
+        previous: Optional[str] = None
+        for _ in range(self.retries):
+            result.attempts += 1
+            try:
+                reply = self._ask(report, result.remaining, previous)
+            except Exception as exc:  # provider/network errors must not fail the task
+                result.remaining = [*result.remaining, f"repair call failed: {type(exc).__name__}: {exc}"]
+                return True, output
+            payload = extract_section_c(reply)
+            candidate = replace_section_c(report, payload) if payload is not None else None
+            remaining = section_c_problems(candidate) if candidate is not None else None
+            if candidate is not None and remaining == []:
+                result.repaired = True
+                result.remaining = []
+                return True, candidate
+            result.remaining = remaining or ["reply contained no JSON object"]
+            previous = reply
+        return True, output
+
+
+__all__ = [
+    "DEFAULT_REPAIR_RETRIES",
+    "REPAIR_SYSTEM_PROMPT",
+    "RepairResult",
+    "SectionCRepair",
+    "replace_section_c",
+    "section_c_problems",
+]
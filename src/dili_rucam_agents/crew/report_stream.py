@@ -0,0 +1,192 @@
+"""Live report files while the crew runs.
+
+With streaming on, the analyst and arbiter LLMs are created with ``stream=True``
+and :func:`stream_reports` appends every token to that agent's report file (and,
+optionally, to stdout) as it arrives, so Section A can be read while Section C
+is still generating. The files are overwritten with the final, validated reports
+when the run finishes. Responses replayed from :mod:`.llm_cache` never stream and
+only appear in the final files.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, Optional
+
+# Report key (``run_crew`` task-map key or derived report) -> file in ``--output-dir``.
+REPORT_FILENAMES: Dict[str, str] = {
+    "gpt_52": "gpt-5.2_report.md",
+    "gemini_30": "gemini-3.0_report.md",
+    "llm_view_stats": "llm_view_stats.json",
+    "run_metrics": "run_metrics.json",
+    "consensus": "consensus_report.md",
+    "arbiter_ensemble": "arbiter_ensemble_report.md",
+}
+
+
+def report_filename(key: str) -> Optional[str]:
+    """File name a report key is written to, ``None`` for keys that are not persisted."""
+
+    if key in REPORT_FILENAMES:
+        return REPORT_FILENAMES[key]
+    if key.startswith("arbiter_"):
+        return f"{key.replace('_', '-')}_report.md"
+    return None
+
+
+@dataclass
+class AgentStream:
+    """Tokens streamed by one agent and when the first one arrived."""
+
+    key: str
+    filename: str
+    chunks: int = 0
+    characters: int = 0
+    first_call_at: Optional[datetime] = None
+    first_token_at: Optional[datetime] = None
+    last_call_id: Optional[str] = None
+
+    def time_to_first_token(self) -> Optional[float]:
+        if self.first_call_at is None or self.first_token_at is None:
+            return None
+        return round((self.first_token_at - self.first_call_at).total_seconds(), 4)
+
+    def to_dict(self, started_at: datetime) -> Dict[str, Any]:
+        return {
+            "file": self.filename,
+            "chunks": self.chunks,
+            "characters": self.characters,
+            "time_to_first_token_seconds": self.time_to_first_token(),
+            "first_token_after_seconds": (
+                round((self.first_token_at - started_at).total_seconds(), 4) if self.first_token_at else None
+            ),
+        }
+
+
+class ReportStreamer:
+    """Appends streamed chunks of the given agents to their report files.
+
+    ``agents`` maps report keys (``gpt_52``, ``arbiter_arbiter_alpha``, ...) to
+    agents. Stdout echo prefixes a ``==> file <==`` header whenever the speaking
+    agent changes, so concurrent analysts stay readable.
+    """
+
+    def __init__(
+        self,
+        agents: Dict[str, Any],
+        output_dir: Optional[Path] = None,
+        *,
+        echo: Optional[IO[str]] = None,
+    ) -> None:
+        self.output_dir = output_dir
+        self.echo = echo
+        self.started_at = datetime.now(timezone.utc)
+        self.streams: Dict[str, AgentStream] = {}
+        self._keys: Dict[str, str] = {}
+        for key, agent in agents.items():
+            filename = report_filename(key)
+            if filename is None:
+                raise ValueError(f"no report file for {key!r}")
+            self.streams[key] = AgentStream(key=key, filename=filename)
+            self._keys[str(agent.id)] = key
+        self._files: Dict[str, IO[str]] = {}
+        self._echo_key: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def on_call_started(self, event: Any) -> None:
+        key = self._keys.get(event.agent_id)
+        if key is None:
+            return
+        with self._lock:
+            stream = self.streams[key]
+            if stream.first_call_at is None or event.timestamp < stream.first_call_at:
+                stream.first_call_at = event.timestamp
+
+    def on_chunk(self, event: Any) -> None:
+        key = self._keys.get(event.agent_id)
+        if key is None or event.tool_call is not None or not event.chunk:
+            return
+        with self._lock:
+            stream = self.streams[key]
+            text = event.chunk
+            # A later call of the same agent (a ReAct step or a SECTION C repair)
+            # starts on its own paragraph.
+            if stream.last_call_id is not None and event.call_id != stream.last_call_id:
+                text = "\n\n" + text
+            stream.last_call_id = event.call_id
+            if stream.first_token_at is None:
+                stream.first_token_at = event.timestamp
+            stream.chunks += 1
+            stream.characters += len(event.chunk)
+            self._write(stream, text)
+
+    def _write(self, stream: AgentStream, text: str) -> None:
+        if self.output_dir is not None:
+            handle = self._files.get(stream.key)
+            if handle is None:
+                handle = self._files[stream.key] = (self.output_dir / stream.filename).open("w", encoding="utf-8")
+            handle.write(text)
+            handle.flush()
+        if self.echo is not None:
+            if self._echo_key != stream.key:
+                self.echo.write(f"\n==> {stream.filename} <==\n")
+                self._echo_key = stream.key
+            self.echo.write(text)
+            self.echo.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            for handle in self._files.values():
+                handle.close()
+            self._files.clear()
+            if self.echo is not None and self._echo_key is not None:
+                self.echo.write("\n")
+                self.echo.flush()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: stream.to_dict(self.started_at) for key, stream in self.streams.items()}
+
+
+@contextmanager
+def stream_reports(
+    agents: Dict[str, Any],
+    output_dir: Optional[Path] = None,
+    *,
+    echo: bool = False,
+) -> Iterator[ReportStreamer]:
+    """Turn on streaming for ``agents`` and write their tokens while the block runs.
+
+    CrewAI delivers ``LLMStreamChunkEvent`` synchronously on the calling thread, so
+    chunks are written in order; like :func:`.metrics.capture_llm_calls`, events are
+    filtered by agent id so concurrent runs do not see each other's tokens.
+    """
+
+    from crewai.events import LLMCallStartedEvent, LLMStreamChunkEvent, crewai_event_bus
+
+    for agent in agents.values():
+        agent.llm.stream = True
+    streamer = ReportStreamer(agents, output_dir, echo=sys.stdout if echo else None)
+
+    def on_started(_source: Any, event: Any) -> None:
+        streamer.on_call_started(event)
+
+    def on_chunk(_source: Any, event: Any) -> None:
+        streamer.on_chunk(event)
+
+    crewai_event_bus.on(LLMCallStartedEvent)(on_started)
+    crewai_event_bus.on(LLMStreamChunkEvent)(on_chunk)
+    try:
+        yield streamer
+    finally:
+        crewai_event_bus.flush()
+        crewai_event_bus.off(LLMCallStartedEvent, on_started)
+        crewai_event_bus.off(LLMStreamChunkEvent, on_chunk)
+        streamer.close()
+
+
+__all__ = ["REPORT_FILENAMES", "AgentStream", "ReportStreamer", "report_filename", "stream_reports"]
@@ -2,9 +2,12 @@ from __future__ import annotations
 
 from pathlib import Path
 from textwrap import dedent
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 
 from crewai import Agent, Task
+from crewai.tasks.conditional_task import ConditionalTask
+
+from .prompt_layout import assemble_description
 
 
 DEFAULT_RUCAM_PROMPT_PATH = (
@@ -13,6 +16,9 @@ DEFAULT_RUCAM_PROMPT_PATH = (
 DEFAULT_ARBITER_PROMPT_PATH = (
     Path(__file__).resolve().parents[1] / "prompts" / "arbiter_production.md"
 )
+# Kickoff input carrying the pre-built bundle in direct ingestion mode. CrewAI
+# substitutes it in a single pass, so braces inside the bundle are left alone.
+CASE_BUNDLE_INPUT = "case_bundle"
 
 
 def load_rucam_prompt(prompt_path: Optional[Path] = None) -> str:
@@ -25,20 +31,34 @@ def load_arbiter_prompt(prompt_path: Optional[Path] = None) -> str:
     return path.read_text(encoding="utf-8")
 
 
-def create_case_bundle_task(*, pdf_path: str, agent: Agent) -> Task:
+# Direct ingestion: the bundle is part of the task itself, not a prior task output.
+_CASE_BUNDLE_CONTENT = "--- BEGIN CASE BUNDLE ---\n{" + CASE_BUNDLE_INPUT + "}\n--- END CASE BUNDLE ---"
+
+
+def create_case_bundle_task(*, pdf_path: str, agent: Agent, llm_view: bool = False) -> Task:
+    if llm_view:
+        contract = (
+            "The case_bundle_extractor returns the token-budgeted LLM view of case_bundle_json "
+            "(labs, medications, timeline first); return it verbatim."
+        )
+        expected_output = "The case bundle LLM view exactly as returned by the case_bundle_extractor tool."
+    else:
+        contract = "Use the case_bundle_extractor tool to produce the canonical case_bundle_json contract defined in agent.md."
+        expected_output = (
+            "A valid case_bundle_json object containing pdf_path, extraction_notes, blocks, normalized_text, "
+            "tables, unknowns, and quality as described in agent.md."
+        )
+
     return Task(
         name="case_bundle_generation",
         description=dedent(
             f"""
             Deterministically ingest the clinical PDF located at "{pdf_path}".
-            Use the case_bundle_extractor tool to produce the canonical case_bundle_json contract defined in agent.md.
+            {contract}
             Preserve every page, avoid hallucinations, and document extraction gaps.
             """
         ).strip(),
-        expected_output=(
-            "A valid case_bundle_json object containing pdf_path, extraction_notes, blocks, normalized_text, "
-            "tables, unknowns, and quality as described in agent.md."
-        ),
+        expected_output=expected_output,
         agent=agent,
         inputs={"pdf_path": pdf_path},
     )
@@ -47,23 +67,28 @@ def create_case_bundle_task(*, pdf_path: str, agent: Agent) -> Task:
 def create_analysis_task(
     *,
     agent: Agent,
-    case_bundle_task: Task,
+    case_bundle_task: Optional[Task],
     analyst_label: str,
-    prompt_text: str,
     model_reference: str,
+    async_execution: bool = False,
+    guardrail: Optional[Callable[[Any], Any]] = None,
 ) -> Task:
-    description = dedent(
-        f"""
-        You are the {analyst_label} RUCAM Analyst. Consume the shared case_bundle_json exactly as produced.
-        Follow every instruction in rucam_analysis_production.md without deviation.
+    """Analyst task; the production prompt itself lives in the agent's system message.
 
-        --- BEGIN PRODUCTION PROMPT ---
-        {prompt_text}
-        --- END PRODUCTION PROMPT ---
+    ``guardrail`` (e.g. :class:`.repair.SectionCRepair`) post-processes the report.
+    """
 
+    instructions = dedent(
+        f"""
+        You are the {analyst_label} RUCAM Analyst. Consume the shared case_bundle_json exactly as produced.
+        Its lab_index (LAB INDEX in the LLM view) lists the liver tests and candidate R ratios found by
+        deterministic extraction; use it to locate values, and confirm each against the cited page.
+        Follow every instruction in the PRODUCTION PROMPT of your system instructions
+        (rucam_analysis_production.md) without deviation.
         Reference your model via the {model_reference} environment variable. Temperature must remain 0.
         """
     ).strip()
+    description = assemble_description(instructions, _CASE_BUNDLE_CONTENT if case_bundle_task is None else None)
 
     return Task(
         name=f"{analyst_label.lower().replace(' ', '_')}_analysis",
@@ -72,8 +97,10 @@ def create_analysis_task(
             f"A complete {analyst_label} report containing SECTION A narrative, SECTION B RUCAM table, "
             "and SECTION C JSON."
         ),
-        context=[case_bundle_task],
+        context=[case_bundle_task] if case_bundle_task is not None else [],
         agent=agent,
+        async_execution=async_execution,
+        guardrail=guardrail,
     )
 
 
@@ -83,36 +110,54 @@ def create_arbiter_task(
     gpt_task: Task,
     gemini_task: Task,
     arbiter_label: str,
-    prompt_text: str,
+    condition: Optional[Callable[[Any], bool]] = None,
+    with_case_bundle: bool = False,
+    case_bundle_task: Optional[Task] = None,
+    guardrail: Optional[Callable[[Any], Any]] = None,
 ) -> Task:
-    description = dedent(
-        f"""
-        You are {arbiter_label}, the senior hepatology arbiter. Consume the shared case_bundle_json as well as the
-        GPT-5.2 and Gemini 3.0 analyst reports. Resolve all disagreements strictly according to the source evidence.
-        Follow every instruction in arbiter_production.md verbatim.
+    """Arbiter task; the arbiter prompt lives in the agent's system message, the analyst reports arrive as context.
 
-        --- BEGIN ARBITER PROMPT ---
-        {prompt_text}
-        --- END ARBITER PROMPT ---
+    ``with_case_bundle`` also hands the arbiter the (relevance-pruned) case bundle:
+    from ``case_bundle_task`` when there is one, otherwise from the direct-ingestion
+    kickoff input.
+    """
 
-        Temperature must remain 0.
-        """
-    ).strip()
+    case_content = _CASE_BUNDLE_CONTENT if with_case_bundle and case_bundle_task is None else None
+    description = assemble_description(
+        dedent(
+            f"""
+            You are {arbiter_label}, the senior hepatology arbiter. Consume the shared case_bundle_json as well as the
+            GPT-5.2 and Gemini 3.0 analyst reports. Resolve all disagreements strictly according to the source evidence;
+            the bundle's lab_index gives the extracted liver tests and candidate R ratios with page references.
+            Follow every instruction in the ARBITER PROMPT of your system instructions (arbiter_production.md) verbatim.
+            Temperature must remain 0.
+            """
+        ).strip(),
+        case_content,
+    )
+    context = [gpt_task, gemini_task]
+    if with_case_bundle and case_bundle_task is not None:
+        context.insert(0, case_bundle_task)
 
     safe_label = arbiter_label.lower().replace(" ", "_")
-
-    return Task(
+    task_kwargs: Dict[str, Any] = dict(
         name=f"{safe_label}_senior_hepatology_arbitration",
         description=description,
         expected_output=(
             "Final SECTION A/B/C report with consolidated scores plus SECTION D — Arbiter Justification."
         ),
-        context=[gpt_task, gemini_task],
+        context=context,
         agent=agent,
+        guardrail=guardrail,
     )
+    if condition is not None:
+        # Skipped (no LLM call) when the condition returns False, e.g. on analyst consensus.
+        return ConditionalTask(condition=condition, **task_kwargs)
+    return Task(**task_kwargs)
 
 
 __all__ = [
+    "CASE_BUNDLE_INPUT",
     "DEFAULT_RUCAM_PROMPT_PATH",
     "DEFAULT_ARBITER_PROMPT_PATH",
     "load_rucam_prompt",
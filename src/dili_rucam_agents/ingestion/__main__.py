@@ -0,0 +1,64 @@
+"""Ingestion-only CLI: ``python -m dili_rucam_agents.ingestion <pdf>``.
+
+Builds the case bundle without importing CrewAI or any LLM client, so it is cheap
+to run from shell loops and worker processes. Run diagnostics (per-page pdfplumber
+times, bundle cache hit or miss) are printed to stderr as one JSON line.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .build_bundle import render_case_bundle
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m dili_rucam_agents.ingestion",
+        description="Build the case_bundle_json for a PDF (no LLM calls).",
+    )
+    parser.add_argument("pdf_path", help="PDF to ingest.")
+    parser.add_argument("--workers", type=int, default=1, help="Processes used for the extractors.")
+    parser.add_argument("--no-cache", dest="use_cache", action="store_false", help="Ignore the case bundle cache.")
+    parser.add_argument("--cache-dir", dest="cache_dir", help="Case bundle cache directory.")
+    parser.add_argument(
+        "--llm-view-tokens",
+        dest="llm_view_tokens",
+        type=int,
+        help="Print the token-budgeted LLM view instead of the full JSON (stats go to stderr).",
+    )
+    parser.add_argument(
+        "--retrieval-view",
+        dest="retrieval_view",
+        action="store_true",
+        help="Print the relevance-pruned view (PDFs over ten pages); recall diagnostics go to stderr.",
+    )
+    parser.add_argument("--output", "-o", help="Write to this file instead of stdout.")
+    args = parser.parse_args(argv)
+
+    diagnostics: Dict[str, Any] = {}
+    text, view_stats = render_case_bundle(
+        Path(args.pdf_path).expanduser().resolve(),
+        workers=args.workers,
+        use_cache=args.use_cache,
+        cache_dir=args.cache_dir,
+        llm_view_tokens=args.llm_view_tokens,
+        retrieval_view=args.retrieval_view,
+        diagnostics=diagnostics,
+    )
+    if view_stats:
+        print(json.dumps(view_stats), file=sys.stderr)
+    # Timings vary run to run, so they go to stderr and never into the bundle.
+    print(json.dumps({"diagnostics": diagnostics}), file=sys.stderr)
+    if args.output:
+        Path(args.output).write_text(text, encoding="utf-8")
+    else:
+        sys.stdout.write(text + "\n")
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI helper
+    main()
@@ -1,14 +1,25 @@
 from __future__ import annotations
 
-import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List
-
-from crewai.tools import BaseTool
-
-from .case_bundle import CaseBundle, CaseBundleBlock, CaseBundleTable, QualityMetrics, merge_blocks
+from typing import Any, Dict, List, Optional, Tuple
+
+from .bundle_cache import CaseBundleCache, get_default_cache
+from .case_bundle import (
+    CaseBundle,
+    CaseBundleBlock,
+    CaseBundleTable,
+    PageQuality,
+    QualityMetrics,
+)
+from .dedupe import merge_blocks_with_stats
+from .lab_index import build_lab_index
+from .llm_view import DEFAULT_LLM_VIEW_TOKENS
+from .pdf_document import PdfDocument
 from .pdfplumber_tables import extract_tables
-from .pymupdf_fallback import extract_fallback_blocks
+from .pymupdf_fallback import extract_fallback_blocks, pages_needing_fallback
+from .quality_probe import choose_strategy, probe_page_quality
+from .retrieval import build_retrieval_view
 from .unstructured_ingest import run_unstructured_ingest
 
 
@@ -16,37 +27,116 @@ class CaseBundleExtractionError(RuntimeError):
     pass
 
 
-def build_case_bundle(pdf_path: Path) -> CaseBundle:
+ExtractorResults = Tuple[
+    List[PageQuality],
+    Tuple[List[CaseBundleBlock], List[str], str],
+    Tuple[List[CaseBundleBlock], List[str]],
+    Tuple[List[CaseBundleTable], List[str]],
+]
+
+
+def _run_extractors(pdf_path: Path, workers: int, table_timings: Dict[int, float]) -> ExtractorResults:
+    """Run the quality probe and the three extractors, serially or on a process pool.
+
+    The PyMuPDF probe runs first and picks the unstructured strategy. The PyMuPDF
+    fallback only runs for pages whose text unstructured failed to recover, so it
+    always waits for unstructured; pdfplumber is independent of both. Results are
+    returned in a fixed order so the merged bundle and its extraction notes do not
+    depend on which extractor finished first. Per-page pdfplumber times (ms) are
+    collected into ``table_timings``.
+    """
+
+    # One shared document: the PDF is read once and PyMuPDF/pdfplumber are opened
+    # a single time for all in-process extractors instead of once per extractor.
+    with PdfDocument(pdf_path) as document:
+        page_quality = probe_page_quality(document)
+        strategy = choose_strategy(page_quality)
+
+        if workers > 1:
+            # Worker processes cannot share an open document; each one re-opens the
+            # PDF. pdfplumber page shards are queued on the same pool as unstructured.
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                unstructured_future = pool.submit(run_unstructured_ingest, pdf_path, strategy)
+                table_results = extract_tables(pdf_path, workers=workers, executor=pool, timings=table_timings)
+                unstructured_results = unstructured_future.result()
+        else:
+            unstructured_results = run_unstructured_ingest(document, strategy)
+            table_results = extract_tables(document, timings=table_timings)
+
+        fallback_pages = pages_needing_fallback(unstructured_results[0], page_quality)
+        fallback_results: Tuple[List[CaseBundleBlock], List[str]] = ([], [])
+        if fallback_pages:
+            fallback_results = extract_fallback_blocks(document, fallback_pages)
+
+    return page_quality, unstructured_results, fallback_results, table_results
+
+
+def build_case_bundle(
+    pdf_path: Path,
+    *,
+    workers: int = 1,
+    cache: Optional[CaseBundleCache] = None,
+) -> CaseBundle:
+    """Build the canonical case bundle.
+
+    ``workers > 1`` runs unstructured and the pdfplumber page shards concurrently
+    in a process pool, so latency tracks the slowest extractor instead of their sum.
+    Output is identical to the serial path. When ``cache`` is given, a previous result for the same PDF
+    content and extractor configuration is returned without re-ingesting.
+    """
+
     if not pdf_path.exists():
         raise CaseBundleExtractionError(f"PDF not found: {pdf_path}")
 
-    blocks: List[CaseBundleBlock] = []
+    if cache is None:
+        return _extract_case_bundle(pdf_path, workers)
+
+    cache_key = cache.key_for(pdf_path)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        # The key is content-addressed; report the path this run was asked for.
+        cached.pdf_path = str(pdf_path)
+        cached.diagnostics = {"bundle_cache": "hit"}
+        return cached
+
+    bundle = _extract_case_bundle(pdf_path, workers)
+    bundle.diagnostics["bundle_cache"] = "miss"
+    try:
+        cache.put(cache_key, bundle)
+    except OSError:  # pragma: no cover - caching is best-effort
+        pass
+    return bundle
+
+
+def _extract_case_bundle(pdf_path: Path, workers: int) -> CaseBundle:
     notes: List[str] = []
+    table_timings: Dict[int, float] = {}
 
-    unstructured_blocks, unstructured_notes = run_unstructured_ingest(pdf_path)
-    blocks.extend(unstructured_blocks)
-    notes.extend(unstructured_notes)
+    (
+        page_quality,
+        (unstructured_blocks, unstructured_notes, unstructured_strategy),
+        (fallback_blocks, fallback_notes),
+        (tables, table_notes),
+    ) = _run_extractors(pdf_path, workers, table_timings)
+
+    deduped_blocks, dedupe_stats = merge_blocks_with_stats(unstructured_blocks, fallback_blocks)
 
-    fallback_blocks: List[CaseBundleBlock] = []
-    if not blocks:
-        fallback_blocks, fallback_notes = extract_fallback_blocks(pdf_path)
-        blocks.extend(fallback_blocks)
-        notes.extend(fallback_notes)
-    else:
-        fb_blocks, fb_notes = extract_fallback_blocks(pdf_path)
-        fallback_blocks = fb_blocks
-        notes.extend(fb_notes)
-
-    tables, table_notes = extract_tables(pdf_path)
+    notes.extend(unstructured_notes)
+    notes.extend(fallback_notes)
     notes.extend(table_notes)
+    notes.append(
+        f"dedupe removed_blocks={dedupe_stats.removed_blocks} removed_tokens={dedupe_stats.removed_tokens}"
+    )
 
-    deduped_blocks = merge_blocks(blocks, fallback_blocks)
     normalized_text = "\n".join(block.text for block in deduped_blocks if block.text).strip()
+    lab_index = build_lab_index(deduped_blocks, tables)
 
     quality = QualityMetrics(
         unstructured_total_score=len(unstructured_blocks),
         fallback_pages=[block.page_number for block in fallback_blocks],
         fallback_total_score=len(fallback_blocks),
+        unstructured_strategy=unstructured_strategy,
+        page_quality=page_quality,
     )
 
     return CaseBundle(
@@ -57,28 +147,62 @@ def build_case_bundle(pdf_path: Path) -> CaseBundle:
         tables=tables,
         unknowns=[],
         quality=quality,
+        lab_index=lab_index,
+        diagnostics={"pdfplumber_page_ms": table_timings},
     )
 
 
-class CaseBundleExtractionTool(BaseTool):
-    """CrewAI tool wrapper around the deterministic case bundle pipeline."""
-
-    name: str = "case_bundle_extractor"
-    description: str = (
-        "Convert a PDF path into the canonical case_bundle_json contract "
-        "defined in agent.md using deterministic ingestion."
-    )
-
-    def _run(self, pdf_path: str) -> str:
-        bundle = build_case_bundle(Path(pdf_path))
-        return json.dumps(bundle.to_dict(), indent=2)
-
-    async def _arun(self, pdf_path: str) -> str:  # pragma: no cover - async parity
-        return self._run(pdf_path)
+def render_case_bundle(
+    pdf_path: Path,
+    *,
+    workers: int = 1,
+    use_cache: bool = True,
+    cache_dir: Optional[str] = None,
+    llm_view_tokens: Optional[int] = None,
+    retrieval_view: bool = False,
+    diagnostics: Optional[Dict[str, Any]] = None,
+) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """Build (or load) the bundle and render what the analysts read.
+
+    Returns compact ``case_bundle_json``, or the token-budgeted LLM view when
+    ``llm_view_tokens`` is set together with its token statistics. With
+    ``retrieval_view`` documents over ten pages are pruned to the passages that
+    rank for a RUCAM item (see :mod:`.retrieval`); the statistics then include
+    per-item recall. ``diagnostics``, when given, receives the bundle's
+    :attr:`CaseBundle.diagnostics` (per-page pdfplumber ms, bundle cache hit or miss).
+    """
+
+    cache = get_default_cache(Path(cache_dir) if cache_dir else None) if use_cache else None
+    bundle = build_case_bundle(pdf_path, workers=workers, cache=cache)
+    if diagnostics is not None:
+        diagnostics.update(bundle.diagnostics)
+    if retrieval_view:
+        view = build_retrieval_view(bundle, llm_view_tokens or DEFAULT_LLM_VIEW_TOKENS)
+        return view.text, {"pdf_path": bundle.pdf_path, **view.to_dict()}
+    if llm_view_tokens:
+        view = bundle.to_llm_view(llm_view_tokens)
+        return view.text, {"pdf_path": bundle.pdf_path, **view.to_dict()}
+    return bundle.to_json(compact=True), None
+
+
+# "agent": an LLM ingestion agent calls the extraction tool (original flow).
+# "direct": build_case_bundle runs in Python and is injected into the analyst tasks.
+INGESTION_MODES = ("agent", "direct")
+
+
+def __getattr__(name: str) -> Any:
+    # The CrewAI tool lives in .tool so ingestion-only imports never load CrewAI.
+    if name == "CaseBundleExtractionTool":
+        from .tool import CaseBundleExtractionTool
+
+        return CaseBundleExtractionTool
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
+    "INGESTION_MODES",
     "CaseBundleExtractionError",
     "CaseBundleExtractionTool",
     "build_case_bundle",
+    "render_case_bundle",
 ]
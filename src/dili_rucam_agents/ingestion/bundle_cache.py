@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+from . import dedupe, pymupdf_fallback, quality_probe
+from .case_bundle import CaseBundle
+
+# Bump whenever build_case_bundle output changes for the same PDF so stale
+# entries are never served.
+BUNDLE_SCHEMA_VERSION = 7
+
+# Settings that change what build_case_bundle produces. Worker counts are
+# deliberately absent: parallel and serial runs yield identical bundles.
+INGESTION_SETTINGS: Dict[str, Any] = {
+    "unstructured_routing": "quality_probe",
+    "quality_probe_thresholds": {
+        "min_text_chars": quality_probe.MIN_TEXT_CHARS,
+        "min_text_coverage": quality_probe.MIN_TEXT_COVERAGE,
+        "scanned_image_coverage": quality_probe.SCANNED_IMAGE_COVERAGE,
+        "hi_res_column_count": quality_probe.HI_RES_COLUMN_COUNT,
+    },
+    "fallback_thresholds": {
+        "min_chars": pymupdf_fallback.FALLBACK_MIN_CHARS,
+        "min_coverage": pymupdf_fallback.FALLBACK_MIN_COVERAGE,
+    },
+    "dedupe": {
+        "shingle_size": dedupe.SHINGLE_SIZE,
+        "containment_threshold": dedupe.CONTAINMENT_THRESHOLD,
+        "min_containment_shingles": dedupe.MIN_CONTAINMENT_SHINGLES,
+    },
+    "unstructured_chunking_strategy": "by_title",
+    "unstructured_infer_table_structure": True,
+}
+
+EXTRACTOR_DISTRIBUTIONS = ("unstructured", "pdfplumber", "pdfminer.six", "PyMuPDF")
+
+DEFAULT_CACHE_DIR = Path("~/.cache/dili_rucam_agents/case_bundles")
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+DEFAULT_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+
+# Entries are CaseBundle.to_bytes() payloads (zlib-compressed compact JSON).
+# ``.json`` files are entries written before the binary format and are removed
+# on the next eviction pass.
+_CACHE_SUFFIX = ".bundle"
+_LEGACY_SUFFIX = ".json"
+# Eviction only ever touches files named like an entry (``<sha256 key><suffix>``):
+# the directory may be shared with reports, metrics or a batch manifest.
+_ENTRY_NAME = re.compile(r"[0-9a-f]{64}")
+
+
+def sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def extractor_versions() -> Dict[str, str]:
+    versions: Dict[str, str] = {}
+    for distribution in EXTRACTOR_DISTRIBUTIONS:
+        try:
+            versions[distribution] = metadata.version(distribution)
+        except metadata.PackageNotFoundError:
+            versions[distribution] = "missing"
+    return versions
+
+
+def bundle_cache_key(pdf_path: Path, settings: Optional[Mapping[str, Any]] = None) -> str:
+    """Identity of the bundle ``build_case_bundle`` produces for ``pdf_path``.
+
+    Covers the PDF content, :data:`BUNDLE_SCHEMA_VERSION`, the extractor versions
+    and the ingestion settings; the LLM response cache keys on it as well.
+    """
+
+    material = {
+        "pdf_sha256": sha256_file(pdf_path),
+        "schema_version": BUNDLE_SCHEMA_VERSION,
+        "extractors": extractor_versions(),
+        "settings": dict(settings if settings is not None else INGESTION_SETTINGS),
+    }
+    encoded = json.dumps(material, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+        }
+
+
+class CaseBundleCache:
+    """Content-addressed on-disk cache of ``build_case_bundle`` results.
+
+    Entries are keyed by the PDF's SHA-256, the installed extractor versions,
+    :data:`INGESTION_SETTINGS` and :data:`BUNDLE_SCHEMA_VERSION`. Writes go through a
+    temporary file plus ``os.replace`` so concurrent workers never observe a partial
+    entry, and are stored in the compressed :meth:`CaseBundle.to_bytes` format.
+    Entries older than ``max_age_seconds`` are dropped, and the least recently
+    used entries are evicted once the directory exceeds ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+    ) -> None:
+        self.directory = Path(directory or os.getenv("DILI_RUCAM_CACHE_DIR") or DEFAULT_CACHE_DIR).expanduser()
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def key_for(self, pdf_path: Path, settings: Optional[Mapping[str, Any]] = None) -> str:
+        return bundle_cache_key(pdf_path, settings)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}{_CACHE_SUFFIX}"
+
+    def _entries(self, suffix: str) -> List[Path]:
+        return [path for path in self.directory.glob(f"*{suffix}") if _ENTRY_NAME.fullmatch(path.name[: -len(suffix)])]
+
+    def get(self, key: str) -> Optional[CaseBundle]:
+        path = self._entry_path(key)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self._count_miss()
+            return None
+
+        if time.time() - stat.st_mtime > self.max_age_seconds:
+            path.unlink(missing_ok=True)
+            with self._lock:
+                self.stats.evictions += 1
+            self._count_miss()
+            return None
+
+        try:
+            bundle = CaseBundle.from_bytes(path.read_bytes())
+        except (OSError, ValueError, KeyError, TypeError, zlib.error):
+            # Corrupt or foreign entry; drop it and rebuild.
+            path.unlink(missing_ok=True)
+            self._count_miss()
+            return None
+
+        # Refresh mtime so size-based eviction is least-recently-used.
+        try:
+            os.utime(path)
+        except OSError:  # pragma: no cover - racing eviction
+            pass
+        with self._lock:
+            self.stats.hits += 1
+        return bundle
+
+    def put(self, key: str, bundle: CaseBundle) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        payload = bundle.to_bytes(binary=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, prefix=".tmp-", suffix=_CACHE_SUFFIX)
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(tmp_name, self._entry_path(key))
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        with self._lock:
+            self.stats.writes += 1
+        self.evict()
+
+    def evict(self) -> int:
+        """Apply age and size limits; return the number of entries removed."""
+
+        if not self.directory.exists():
+            return 0
+
+        now = time.time()
+        entries = []
+        removed = 0
+        for path in self._entries(_LEGACY_SUFFIX):
+            path.unlink(missing_ok=True)
+            removed += 1
+        for path in self._entries(_CACHE_SUFFIX):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if now - stat.st_mtime > self.max_age_seconds:
+                path.unlink(missing_ok=True)
+                removed += 1
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        with self._lock:
+            self.stats.evictions += removed
+        return removed
+
+    def clear(self) -> None:
+        if not self.directory.exists():
+            return
+        for suffix in (_CACHE_SUFFIX, _LEGACY_SUFFIX):
+            for path in self._entries(suffix):
+                path.unlink(missing_ok=True)
+
+    def _count_miss(self) -> None:
+        with self._lock:
+            self.stats.misses += 1
+
+
+_DEFAULT_CACHES: Dict[Path, CaseBundleCache] = {}
+_DEFAULT_CACHES_LOCK = threading.Lock()
+
+
+def get_default_cache(directory: Optional[Path] = None) -> CaseBundleCache:
+    """Process-wide cache per directory so hit/miss counters accumulate across calls."""
+
+    resolved = Path(directory or os.getenv("DILI_RUCAM_CACHE_DIR") or DEFAULT_CACHE_DIR).expanduser().resolve()
+    with _DEFAULT_CACHES_LOCK:
+        cache = _DEFAULT_CACHES.get(resolved)
+        if cache is None:
+            cache = CaseBundleCache(resolved)
+            _DEFAULT_CACHES[resolved] = cache
+        return cache
+
+
+__all__ = [
+    "BUNDLE_SCHEMA_VERSION",
+    "INGESTION_SETTINGS",
+    "CacheStats",
+    "CaseBundleCache",
+    "bundle_cache_key",
+    "extractor_versions",
+    "get_default_cache",
+    "sha256_file",
+]
@@ -1,10 +1,37 @@
 from __future__ import annotations
 
+import json
+import zlib
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Sequence
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
 
+if TYPE_CHECKING:
+    from .llm_view import LlmView
 
-@dataclass
+# Binary bundles are zlib-compressed compact JSON behind this magic prefix; plain
+# JSON payloads never start with it, so from_bytes accepts both.
+BINARY_MAGIC = b"DRCB\x01"
+
+
+def dumps_compact(payload: Any) -> bytes:
+    """Minified UTF-8 JSON, via orjson when it is installed."""
+
+    try:
+        import orjson  # type: ignore
+    except ImportError:  # pragma: no cover - optional accelerator
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return orjson.dumps(payload)
+
+
+def loads_json(data: bytes | str) -> Any:
+    try:
+        import orjson  # type: ignore
+    except ImportError:  # pragma: no cover - optional accelerator
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+@dataclass(slots=True)
 class CaseBundleBlock:
     """Normalized narrative/text block coming from any extractor."""
 
@@ -19,8 +46,16 @@ class CaseBundleBlock:
             "text": self.text,
         }
 
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "CaseBundleBlock":
+        return cls(
+            element_type=payload["element_type"],
+            page_number=payload["page_number"],
+            text=payload["text"],
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class CaseBundleTable:
     page_number: int
     table_index: int
@@ -35,22 +70,192 @@ class CaseBundleTable:
             "preview": self.preview,
         }
 
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "CaseBundleTable":
+        return cls(
+            page_number=payload["page_number"],
+            table_index=payload["table_index"],
+            raw_rows=payload["raw_rows"],
+            preview=payload["preview"],
+        )
+
+
+@dataclass(slots=True)
+class LabMeasurement:
+    """One liver test value read from a table or a sentence (see ``lab_index``).
+
+    ``unit`` is ``"xULN"`` when the source reports a multiple of the upper limit of
+    normal. ``day`` is counted from ``day_basis``: ``"drug_start"`` (stated relative
+    to starting the drug), ``"admission"`` or ``"stated"`` (a day/week label as
+    printed, origin not given); both are None when the source gives no timing.
+    """
+
+    analyte: str
+    value: float
+    unit: Optional[str]
+    uln: Optional[float]
+    day: Optional[int]
+    day_basis: Optional[str]
+    page_number: int
+    source: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "analyte": self.analyte,
+            "value": self.value,
+            "unit": self.unit,
+            "uln": self.uln,
+            "day": self.day,
+            "day_basis": self.day_basis,
+            "page_number": self.page_number,
+            "source": self.source,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "LabMeasurement":
+        return cls(
+            analyte=payload["analyte"],
+            value=payload["value"],
+            unit=payload.get("unit"),
+            uln=payload.get("uln"),
+            day=payload.get("day"),
+            day_basis=payload.get("day_basis"),
+            page_number=payload["page_number"],
+            source=payload["source"],
+        )
+
+
+@dataclass(slots=True)
+class RRatioCandidate:
+    """R ratio from an ALT and an ALP value reported together (same sentence or table column)."""
+
+    r_ratio: float
+    injury_pattern: str
+    alt: float
+    alt_uln: float
+    alp: float
+    alp_uln: float
+    day: Optional[int]
+    day_basis: Optional[str]
+    page_number: int
+    source: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "r_ratio": self.r_ratio,
+            "injury_pattern": self.injury_pattern,
+            "alt": self.alt,
+            "alt_uln": self.alt_uln,
+            "alp": self.alp,
+            "alp_uln": self.alp_uln,
+            "day": self.day,
+            "day_basis": self.day_basis,
+            "page_number": self.page_number,
+            "source": self.source,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "RRatioCandidate":
+        return cls(
+            r_ratio=payload["r_ratio"],
+            injury_pattern=payload["injury_pattern"],
+            alt=payload["alt"],
+            alt_uln=payload["alt_uln"],
+            alp=payload["alp"],
+            alp_uln=payload["alp_uln"],
+            day=payload.get("day"),
+            day_basis=payload.get("day_basis"),
+            page_number=payload["page_number"],
+            source=payload["source"],
+        )
+
+
+@dataclass(slots=True)
+class LabIndex:
+    """Typed liver test time series and the R ratios it supports."""
+
+    measurements: List[LabMeasurement] = field(default_factory=list)
+    r_ratios: List[RRatioCandidate] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "measurements": [measurement.to_dict() for measurement in self.measurements],
+            "r_ratios": [candidate.to_dict() for candidate in self.r_ratios],
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "LabIndex":
+        return cls(
+            measurements=[LabMeasurement.from_dict(item) for item in payload.get("measurements", [])],
+            r_ratios=[RRatioCandidate.from_dict(item) for item in payload.get("r_ratios", [])],
+        )
+
+
+@dataclass(slots=True)
+class PageQuality:
+    """PyMuPDF pre-flight scores for one page (see ``quality_probe``)."""
+
+    page_number: int
+    char_count: int
+    text_coverage: float
+    char_density: float
+    column_count: int
+    image_coverage: float
+    strategy: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "page_number": self.page_number,
+            "char_count": self.char_count,
+            "text_coverage": self.text_coverage,
+            "char_density": self.char_density,
+            "column_count": self.column_count,
+            "image_coverage": self.image_coverage,
+            "strategy": self.strategy,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "PageQuality":
+        return cls(
+            page_number=payload["page_number"],
+            char_count=payload["char_count"],
+            text_coverage=payload["text_coverage"],
+            char_density=payload["char_density"],
+            column_count=payload["column_count"],
+            image_coverage=payload["image_coverage"],
+            strategy=payload["strategy"],
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class QualityMetrics:
     unstructured_total_score: int = 0
     fallback_pages: List[int] = field(default_factory=list)
     fallback_total_score: int = 0
+    unstructured_strategy: str = ""
+    page_quality: List[PageQuality] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "unstructured_total_score": self.unstructured_total_score,
             "fallback_pages": self.fallback_pages,
             "fallback_total_score": self.fallback_total_score,
+            "unstructured_strategy": self.unstructured_strategy,
+            "page_quality": [page.to_dict() for page in self.page_quality],
         }
 
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "QualityMetrics":
+        return cls(
+            unstructured_total_score=payload.get("unstructured_total_score", 0),
+            fallback_pages=list(payload.get("fallback_pages", [])),
+            fallback_total_score=payload.get("fallback_total_score", 0),
+            unstructured_strategy=payload.get("unstructured_strategy", ""),
+            page_quality=[PageQuality.from_dict(page) for page in payload.get("page_quality", [])],
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class CaseBundle:
     pdf_path: str
     extraction_notes: List[str]
@@ -59,6 +264,11 @@ class CaseBundle:
     tables: List[CaseBundleTable]
     unknowns: List[str]
     quality: QualityMetrics
+    lab_index: LabIndex = field(default_factory=LabIndex)
+    # Run diagnostics such as extractor timings. Never serialized: they differ
+    # between identical runs, and the bundle JSON must stay byte-identical for
+    # the bundle and LLM caches.
+    diagnostics: Dict[str, Any] = field(default_factory=dict, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -69,17 +279,66 @@ class CaseBundle:
             "tables": [table.to_dict() for table in self.tables],
             "unknowns": self.unknowns,
             "quality": self.quality.to_dict(),
+            "lab_index": self.lab_index.to_dict(),
         }
 
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "CaseBundle":
+        """Inverse of :meth:`to_dict`."""
+
+        return cls(
+            pdf_path=payload["pdf_path"],
+            extraction_notes=list(payload.get("extraction_notes", [])),
+            blocks=[CaseBundleBlock.from_dict(block) for block in payload.get("blocks", [])],
+            normalized_text=payload.get("normalized_text", ""),
+            tables=[CaseBundleTable.from_dict(table) for table in payload.get("tables", [])],
+            unknowns=list(payload.get("unknowns", [])),
+            quality=QualityMetrics.from_dict(payload.get("quality", {})),
+            lab_index=LabIndex.from_dict(payload.get("lab_index", {})),
+        )
+
+    def to_json(self, *, compact: bool = True) -> str:
+        """Serialize for tools and files; ``compact=False`` keeps the indent=2 layout."""
+
+        if compact:
+            return dumps_compact(self.to_dict()).decode("utf-8")
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_bytes(self, *, binary: bool = True) -> bytes:
+        """Compact JSON bytes, zlib-compressed behind :data:`BINARY_MAGIC` when ``binary``."""
+
+        payload = dumps_compact(self.to_dict())
+        if binary:
+            return BINARY_MAGIC + zlib.compress(payload, 6)
+        return payload
+
+    @classmethod
+    def from_json(cls, text: str | bytes) -> "CaseBundle":
+        return cls.from_dict(loads_json(text))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CaseBundle":
+        """Inverse of :meth:`to_bytes` (binary or plain JSON)."""
+
+        if data.startswith(BINARY_MAGIC):
+            data = zlib.decompress(data[len(BINARY_MAGIC) :])
+        return cls.from_json(data)
+
+    def to_llm_view(self, token_budget: Optional[int] = None) -> "LlmView":
+        """Prompt-ready rendering; see :func:`dili_rucam_agents.ingestion.llm_view.build_llm_view`."""
+
+        from .llm_view import DEFAULT_LLM_VIEW_TOKENS, build_llm_view
+
+        return build_llm_view(self, token_budget or DEFAULT_LLM_VIEW_TOKENS)
+
 
 def merge_blocks(*block_sequences: Sequence[CaseBundleBlock]) -> List[CaseBundleBlock]:
-    blocks: List[CaseBundleBlock] = []
-    seen: set[tuple[int, str]] = set()
-    for seq in block_sequences:
-        for block in seq:
-            key = (block.page_number, block.text)
-            if key in seen:
-                continue
-            seen.add(key)
-            blocks.append(block)
-    return sorted(blocks, key=lambda b: (b.page_number, b.element_type))
+    """Merge extractor outputs, dropping exact and near-duplicate blocks per page.
+
+    See :func:`dili_rucam_agents.ingestion.dedupe.dedupe_blocks` for the rules.
+    """
+
+    from .dedupe import merge_blocks_with_stats
+
+    blocks, _ = merge_blocks_with_stats(*block_sequences)
+    return blocks
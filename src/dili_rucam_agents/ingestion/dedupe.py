@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import re
+import unicodedata
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Sequence, Set, Tuple
+
+from dili_rucam_agents.tokens import count_tokens
+
+from .case_bundle import CaseBundleBlock
+
+# Word n-gram size for shingles; 3 survives chunk boundaries while still being
+# specific enough that unrelated sentences rarely share many shingles.
+SHINGLE_SIZE = 3
+# Drop a block when at least this share of its shingles already appears in the
+# blocks kept earlier on the same page.
+CONTAINMENT_THRESHOLD = 0.8
+# Blocks with fewer shingles (titles, captions, short labels) are only removed on
+# an exact normalized match; their words alone appear everywhere on the page.
+MIN_CONTAINMENT_SHINGLES = 8
+
+_SOFT_HYPHEN_BREAK = re.compile(r"(\w)[-\u00ad\u2010\u2011]\s+(\w)")
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+def normalize_text(text: str) -> str:
+    """Fold the differences extractors introduce for the same passage.
+
+    NFKC expands ligatures (``ﬁ`` → ``fi``), line-break hyphenation is joined
+    (``hepato- toxicity`` → ``hepatotoxicity``), punctuation and case are dropped
+    and whitespace collapses to single spaces.
+    """
+
+    folded = unicodedata.normalize("NFKC", text)
+    folded = _SOFT_HYPHEN_BREAK.sub(r"\1\2", folded)
+    return " ".join(_NON_WORD.sub(" ", folded.lower()).split())
+
+
+def shingles(normalized: str, size: int = SHINGLE_SIZE) -> FrozenSet[int]:
+    words = normalized.split()
+    if len(words) <= size:
+        return frozenset([zlib.crc32(normalized.encode("utf-8"))]) if words else frozenset()
+    return frozenset(
+        zlib.crc32(" ".join(words[index : index + size]).encode("utf-8"))
+        for index in range(len(words) - size + 1)
+    )
+
+
+@dataclass
+class DedupeStats:
+    removed_blocks: int = 0
+    removed_tokens: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"removed_blocks": self.removed_blocks, "removed_tokens": self.removed_tokens}
+
+
+def dedupe_blocks(
+    block_sequences: Sequence[Sequence[CaseBundleBlock]],
+) -> Tuple[List[CaseBundleBlock], DedupeStats]:
+    """Drop exact and near-duplicate blocks, page by page, keeping first occurrences.
+
+    Sequences are consumed in priority order (element-level extractors first), so a
+    whole-page fallback block whose shingles are already covered by the element
+    blocks of that page is the one that is removed. Containment is computed exactly
+    against the union of kept shingles rather than with MinHash sketches: a case
+    bundle holds a few hundred blocks, and a sketch cannot measure coverage by a
+    union of several blocks.
+    """
+
+    kept: List[CaseBundleBlock] = []
+    stats = DedupeStats()
+    seen_exact: Set[Tuple[int, str]] = set()
+    page_shingles: Dict[int, Set[int]] = defaultdict(set)
+
+    for sequence in block_sequences:
+        for block in sequence:
+            normalized = normalize_text(block.text)
+            exact_key = (block.page_number, normalized)
+            block_shingles = shingles(normalized)
+
+            duplicate = exact_key in seen_exact
+            if not duplicate and len(block_shingles) >= MIN_CONTAINMENT_SHINGLES:
+                covered = len(block_shingles & page_shingles[block.page_number])
+                duplicate = covered >= CONTAINMENT_THRESHOLD * len(block_shingles)
+
+            if duplicate:
+                stats.removed_blocks += 1
+                stats.removed_tokens += count_tokens(block.text)
+                continue
+
+            seen_exact.add(exact_key)
+            page_shingles[block.page_number].update(block_shingles)
+            kept.append(block)
+
+    return kept, stats
+
+
+def merge_blocks_with_stats(
+    *block_sequences: Sequence[CaseBundleBlock],
+) -> Tuple[List[CaseBundleBlock], DedupeStats]:
+    blocks, stats = dedupe_blocks(block_sequences)
+    return sorted(blocks, key=lambda b: (b.page_number, b.element_type)), stats
+
+
+__all__ = [
+    "CONTAINMENT_THRESHOLD",
+    "MIN_CONTAINMENT_SHINGLES",
+    "SHINGLE_SIZE",
+    "DedupeStats",
+    "dedupe_blocks",
+    "merge_blocks_with_stats",
+    "normalize_text",
+    "shingles",
+]
@@ -0,0 +1,432 @@
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from dili_rucam_agents.validators.rucam_engine import injury_pattern_for_r, r_ratio
+
+from .case_bundle import CaseBundleBlock, CaseBundleTable, LabIndex, LabMeasurement, RRatioCandidate
+
+# Canonical analyte names, in rendering order.
+ANALYTES = ("ALT", "AST", "ALP", "GGT", "TBIL")
+
+# Abbreviations are matched case-sensitively ("ALT", not "alt"); full names in any case.
+_ANALYTE_PATTERNS = {
+    "ALT": r"\b(?:ALT|SGPT|(?i:alanine\s+(?:amino)?trans(?:aminase|ferase)))\b",
+    "AST": r"\b(?:AST|SGOT|(?i:aspartate\s+(?:amino)?trans(?:aminase|ferase)))\b",
+    "ALP": r"\b(?:ALP|Alk\.?\s?Phos|Alk\.?\s?P|(?i:alkaline\s+phosphatase))\b",
+    "GGT": r"(?:\bGGTP?\b|γ-?GT\b|(?i:\bgamma[-\s]?glutamyl[-\s]?trans(?:ferase|peptidase)))",
+    "TBIL": r"\b(?:T-?BIL|TBIL|(?i:(?<!direct\s)(?<!conjugated\s)(?:total\s+)?bilirubin))\b",
+}
+_ANALYTE = re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern in _ANALYTE_PATTERNS.items()))
+
+_NUMBER = r"\d{1,3}(?:,\d{3})+(?!\d)|\d+(?:[.,]\d+)?"
+_UNIT = (
+    r"(?P<multiple>(?:x|×|times)\s*(?:the\s+)?(?:ULN|upper\s+limit(?:\s+of\s+normal)?))"
+    r"|(?P<unit>[µu]mol/l(?:iter)?|mg/dl|k?IU/l|U/l|[µu]kat/l|units?|U\b)"
+)
+# Value after an analyte name: a short gap ("was", ", ", "rose to"), the number, an optional unit.
+_VALUE = re.compile(rf"(?P<gap>[^\d;\n]{{0,40}}?)(?P<value>{_NUMBER})(?:\s*(?:{_UNIT}))?", re.IGNORECASE)
+# "(normal, 5-45)", "(ULN 40 U/L)", "(reference range < 1.2)": the last number is the ULN.
+_ULN_NOTE = re.compile(
+    r"\(\s*(?:normal(?:\s+range)?|nl|n|uln|upper\s+limit(?:\s+of\s+normal)?|ref(?:erence)?\.?(?:\s+range)?)"
+    r"\s*[:,=]?\s*(?P<body>[^()]*?\d[^()]*)\)",
+    re.IGNORECASE,
+)
+_ULN_HEADER = re.compile(r"\b(?:normal|ref(?:erence)?|uln|upper limit|range)\b", re.IGNORECASE)
+
+_WORD_NUMBERS = {
+    "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7, "eight": 8,
+    "nine": 9, "ten": 10, "eleven": 11, "twelve": 12,
+}  # fmt: skip
+_UNIT_DAYS = {"day": 1, "week": 7, "month": 30}
+_COUNT = r"\d+|" + "|".join(_WORD_NUMBERS)
+# "8 weeks after starting carbamazepine", "after three weeks of treatment".
+_AFTER_DRUG_START = re.compile(
+    rf"\b(?P<count>{_COUNT})\s+(?P<unit>day|week|month)s?\s+(?:after|following)\s+(?:the\s+)?"
+    r"(?:start(?:ing)?|initiation|initiating|beginning|onset|introduction|commencement)\b"
+    rf"|\bafter\s+(?P<count2>{_COUNT})\s+(?P<unit2>day|week|month)s?\s+of\s+(?:\w+\s+)?"
+    r"(?:treatment|therapy|administration|intake)\b",
+    re.IGNORECASE,
+)
+_DAY_LABEL = re.compile(r"\b(?:(?P<unit>day|d|week|wk|w)\s*(?P<count>[-+]?\d+))\b", re.IGNORECASE)
+_ADMISSION = re.compile(r"\b(?:on|at|upon)\s+(?:the\s+day\s+of\s+)?admission\b|^\s*admission\s*$", re.IGNORECASE)
+# Numbers that are times, not values: "on day 3", "3 days later".
+_TIME_BEFORE = re.compile(r"\b(?:day|d|week|wk|month|year)s?\s*$", re.IGNORECASE)
+_TIME_AFTER = re.compile(r"\s*(?:days?|weeks?|wks?|months?|years?|h|hours?|%)(?![a-z])", re.IGNORECASE)
+# The gap before a value may hold a unit in parentheses ("ALT (U/L) 450") but no other
+# brackets; figure-axis OCR ("bilirubin (pmoUI) 01)") otherwise yields bogus values.
+_CLEAN_GAP = re.compile(r"[^()]*(?:\([^()]*(?:/\s*d?l|units?|iu)[^()]*\)[^()]*)?", re.IGNORECASE)
+_LIST_JOINER = re.compile(r"[\s,/&]*(?:and|or)?[\s,/&]*", re.IGNORECASE)
+_DEHYPHENATE = re.compile(r"(?<=[a-z])- (?=[a-z])")
+_SENTENCE_BREAK = re.compile(r"(?<=[.;!?])\s+(?=[A-Z(\[])")
+_CELL_NUMBER = re.compile(rf"^\s*[<>≤≥]?\s*(?P<value>{_NUMBER})\s*[*†‡↑↓HL]*\s*$")
+_CELL_RANGE = re.compile(rf"^\s*(?:(?:{_NUMBER})\s*[-–]\s*|[<≤]\s*|up\s+to\s+)(?P<uln>{_NUMBER})\b", re.IGNORECASE)
+
+Timing = Tuple[Optional[int], Optional[str]]
+_NO_TIMING: Timing = (None, None)
+Label = Tuple[str, Optional[str]]
+Run = Tuple[Label, List[Tuple[int, float]], Optional[float]]
+Group = List[LabMeasurement]
+
+
+def _to_float(text: str) -> float:
+    if re.fullmatch(r"\d{1,3}(?:,\d{3})+", text):
+        return float(text.replace(",", ""))
+    return float(text.replace(",", "."))
+
+
+def _count(text: str) -> int:
+    return int(text) if text.lstrip("+-").isdigit() else _WORD_NUMBERS[text.lower()]
+
+
+def _unit_days(unit: str) -> int:
+    unit = unit.lower()
+    if unit.startswith("w"):
+        return 7
+    return _UNIT_DAYS.get(unit, 1)
+
+
+def sentence_timing(text: str) -> Timing:
+    """Day offset stated in a sentence: from drug start, a day/week label, or admission."""
+
+    match = _AFTER_DRUG_START.search(text)
+    if match:
+        count = match.group("count") or match.group("count2")
+        unit = match.group("unit") or match.group("unit2")
+        return _count(count) * _unit_days(unit), "drug_start"
+    match = _DAY_LABEL.search(text)
+    if match and match.group("unit").lower() in ("day", "week"):
+        return _count(match.group("count")) * _unit_days(match.group("unit")), "stated"
+    if _ADMISSION.search(text):
+        return 0, "admission"
+    return _NO_TIMING
+
+
+def cell_timing(cell: str) -> Timing:
+    """Day offset of a table header or row label ("Day 7", "D7", "Week 2", "Admission")."""
+
+    match = _DAY_LABEL.fullmatch(cell.strip())
+    if match:
+        return _count(match.group("count")) * _unit_days(match.group("unit")), "stated"
+    if _ADMISSION.search(cell.strip()):
+        return 0, "admission"
+    return _NO_TIMING
+
+
+def _uln_from(body: str) -> Optional[float]:
+    numbers = re.findall(_NUMBER, body)
+    return _to_float(numbers[-1]) if numbers else None
+
+
+def _bracketed_unit(text: str) -> Optional[str]:
+    match = re.search(r"(?:[µu]mol/l|mg/dl|k?IU/l|U/l|[µu]kat/l|x\s*ULN)", text, re.IGNORECASE)
+    return match.group(0) if match else None
+
+
+def _analyte_label(cell: str) -> Optional[Tuple[str, Optional[str]]]:
+    """Analyte (and unit) when a table cell is a row/column label such as "ALT (U/L)"."""
+
+    cell = cell.strip()
+    match = _ANALYTE.match(cell)
+    if not match or len(cell) > 48 or _CELL_NUMBER.match(cell[match.end() :] or "x"):
+        return None
+    return match.lastgroup or "", _bracketed_unit(cell[match.end() :])
+
+
+def _measurement(
+    analyte: str,
+    value: float,
+    unit: Optional[str],
+    uln: Optional[float],
+    timing: Timing,
+    page_number: int,
+    source: str,
+) -> LabMeasurement:
+    return LabMeasurement(
+        analyte=analyte,
+        value=value,
+        unit=unit,
+        uln=uln,
+        day=timing[0],
+        day_basis=timing[1],
+        page_number=page_number,
+        source=source,
+    )
+
+
+def sentence_measurements(sentence: str, page_number: int, timing: Timing = _NO_TIMING) -> List[LabMeasurement]:
+    """Inline lab mentions, e.g. "serum alanine aminotransferase, 91 units (normal, 5-45)"."""
+
+    text = _DEHYPHENATE.sub("", sentence)
+    timing = sentence_timing(text) if timing == _NO_TIMING else timing
+    # Reference ranges are read separately, so their numbers are never taken as values.
+    notes = list(_ULN_NOTE.finditer(text))
+    masked = _ULN_NOTE.sub(lambda match: " " * len(match.group(0)), text)
+    names = list(_ANALYTE.finditer(masked))
+
+    measurements: List[LabMeasurement] = []
+    listed = False
+    for position, name in enumerate(names):
+        limit = names[position + 1].start() if position + 1 < len(names) else len(masked)
+        if _LIST_JOINER.fullmatch(masked[name.end() : limit]):
+            # "ALT and AST were 450 and 300": values cannot be paired safely.
+            listed = True
+            continue
+        if listed:
+            listed = False
+            continue
+        value = _VALUE.match(masked, name.end(), limit)
+        while value is not None and (_TIME_BEFORE.search(value.group("gap")) or _TIME_AFTER.match(masked, value.end())):
+            value = _VALUE.match(masked, value.end(), limit)
+        if value is None or not _CLEAN_GAP.fullmatch(value.group("gap")):
+            continue
+        uln = next(
+            (_uln_from(note.group("body")) for note in notes if name.end() <= note.start() < limit),
+            None,
+        )
+        unit = "xULN" if value.group("multiple") else value.group("unit")
+        if unit is None:
+            unit = _bracketed_unit(value.group("gap"))
+        measurements.append(
+            _measurement(
+                name.lastgroup or "",
+                _to_float(value.group("value")),
+                unit,
+                None if unit == "xULN" else uln,
+                timing,
+                page_number,
+                "text",
+            )
+        )
+    return measurements
+
+
+def _cell_uln(cell: str, *, bare_number: bool) -> Optional[float]:
+    """Upper end of a range cell ("5-40", "<40"); a bare number counts in a normal-range column."""
+
+    match = _CELL_RANGE.match(cell)
+    if match:
+        return _to_float(match.group("uln"))
+    number = _CELL_NUMBER.match(cell) if bare_number else None
+    return _to_float(number.group("value")) if number else None
+
+
+def _column_header_groups(table: CaseBundleTable, rows: List[List[str]], header: Dict[int, Label]) -> List[Group]:
+    """Analytes as column headers (``rows`` excludes the header row): one group per row, timed by its label."""
+
+    source = f"table:{table.table_index}"
+    ulns: Dict[int, float] = {}
+    groups: List[Group] = []
+    for row in rows:
+        if not row:
+            continue
+        if _ULN_HEADER.search(row[0]):
+            for index in header:
+                uln = _cell_uln(row[index], bare_number=True) if index < len(row) else None
+                if uln is not None:
+                    ulns[index] = uln
+            continue
+        timing = cell_timing(row[0])
+        group: Group = []
+        for index, (analyte, unit) in header.items():
+            number = _CELL_NUMBER.match(row[index]) if index < len(row) else None
+            if number:
+                value = _to_float(number.group("value"))
+                group.append(_measurement(analyte, value, unit, None, timing, table.page_number, source))
+        groups.append(group)
+    # ULN rows may follow the data rows.
+    for group in groups:
+        for measurement in group:
+            index = next(index for index, label in header.items() if label[0] == measurement.analyte)
+            measurement.uln = ulns.get(index)
+    return [group for group in groups if group]
+
+
+def _row_runs(row: Sequence[str], uln_columns: Set[int]) -> List[Run]:
+    """Split a row into (analyte label, [(column, value)], ULN) runs, one per label cell."""
+
+    runs: List[Run] = []
+    open_run = False
+    for index, cell in enumerate(row):
+        label = _analyte_label(cell)
+        if label:
+            runs.append((label, [], None))
+            open_run = True
+            continue
+        if not open_run or not cell:
+            continue
+        uln = _cell_uln(cell, bare_number=index in uln_columns)
+        number = _CELL_NUMBER.match(cell)
+        if uln is not None:
+            runs[-1] = (runs[-1][0], runs[-1][1], uln)
+        elif number:
+            runs[-1][1].append((index, _to_float(number.group("value"))))
+        else:
+            # Another label ("INR", "Platelets"): its values are not this analyte's.
+            open_run = False
+    return runs
+
+
+def _row_label_groups(
+    table: CaseBundleTable,
+    rows: List[List[str]],
+    column_timing: Dict[int, Timing],
+    uln_columns: Set[int],
+) -> List[Group]:
+    """Analytes as row labels: one group per timed column, otherwise one per row."""
+
+    source = f"table:{table.table_index}"
+    groups: Dict[Tuple[str, int], Group] = {}
+    for row_index, row in enumerate(rows):
+        for (analyte, unit), values, uln in _row_runs(row, uln_columns):
+            for column, value in values:
+                timing = column_timing.get(column, _NO_TIMING)
+                key = ("column", column) if column in column_timing else ("row", row_index)
+                groups.setdefault(key, []).append(
+                    _measurement(analyte, value, unit, uln, timing, table.page_number, source)
+                )
+    return list(groups.values())
+
+
+def table_measurements(table: CaseBundleTable) -> List[Group]:
+    """Lab values from a table, grouped by time point.
+
+    Handles analytes as row labels (values across day columns, an optional
+    normal-range column, or label/value pairs on one row) and analytes as column
+    headers (one row per day, optional normal-range row).
+    """
+
+    rows = [[(cell or "").strip() for cell in row] for row in table.raw_rows]
+    column_timing: Dict[int, Timing] = {}
+    uln_columns: Set[int] = set()
+    for row_index, row in enumerate(rows):
+        labels: Dict[int, Label] = {}
+        for index, cell in enumerate(row):
+            label = _analyte_label(cell)
+            if label:
+                labels[index] = label
+        if len(labels) >= 2 and not any(_CELL_NUMBER.match(cell) for cell in row):
+            return _column_header_groups(table, rows[:row_index] + rows[row_index + 1 :], labels)
+        if labels:
+            continue
+        for index, cell in enumerate(row):
+            timing = cell_timing(cell)
+            if timing != _NO_TIMING:
+                column_timing[index] = timing
+            elif _ULN_HEADER.search(cell):
+                uln_columns.add(index)
+    return _row_label_groups(table, rows, column_timing, uln_columns)
+
+
+def _r_candidate(group: Sequence[LabMeasurement]) -> Optional[RRatioCandidate]:
+    alt = next((m for m in group if m.analyte == "ALT" and (m.uln or m.unit == "xULN")), None)
+    alp = next((m for m in group if m.analyte == "ALP" and (m.uln or m.unit == "xULN")), None)
+    if alt is None or alp is None or alp.value <= 0:
+        return None
+    alt_uln = 1.0 if alt.unit == "xULN" else float(alt.uln or 0)
+    alp_uln = 1.0 if alp.unit == "xULN" else float(alp.uln or 0)
+    value = round(r_ratio(alt.value, alt_uln, alp.value, alp_uln), 2)
+    return RRatioCandidate(
+        r_ratio=value,
+        injury_pattern=injury_pattern_for_r(value),
+        alt=alt.value,
+        alt_uln=alt_uln,
+        alp=alp.value,
+        alp_uln=alp_uln,
+        day=alt.day,
+        day_basis=alt.day_basis,
+        page_number=alt.page_number,
+        source=alt.source,
+    )
+
+
+def _measurement_key(measurement: LabMeasurement) -> Tuple[object, ...]:
+    return (measurement.analyte, measurement.value, measurement.day, measurement.day_basis, measurement.page_number)
+
+
+def build_lab_index(blocks: Sequence[CaseBundleBlock], tables: Sequence[CaseBundleTable]) -> LabIndex:
+    """Deterministic lab time series plus candidate R ratios for a case bundle.
+
+    Tables are read first; a value that a text block repeats (same analyte, value,
+    day and page, e.g. an unstructured ``Table`` block) is kept once, with the
+    table as its source. Every R candidate pairs an ALT and an ALP reported
+    together with their ULNs (or as multiples of the ULN); nothing is paired across
+    sentences or columns, so candidates never mix time points.
+    """
+
+    groups: List[List[LabMeasurement]] = []
+    for table in tables:
+        groups.extend(table_measurements(table))
+    for block in blocks:
+        for sentence in _SENTENCE_BREAK.split(_DEHYPHENATE.sub("", block.text)):
+            found = sentence_measurements(sentence, block.page_number)
+            if found:
+                groups.append(found)
+
+    seen = set()
+    measurements: List[LabMeasurement] = []
+    for group in groups:
+        for measurement in group:
+            key = _measurement_key(measurement)
+            if key not in seen:
+                seen.add(key)
+                measurements.append(measurement)
+
+    candidates: List[RRatioCandidate] = []
+    for group in groups:
+        candidate = _r_candidate(group)
+        if candidate is not None and candidate not in candidates:
+            candidates.append(candidate)
+
+    order = {analyte: index for index, analyte in enumerate(ANALYTES)}
+    measurements.sort(
+        key=lambda m: (order[m.analyte], m.day is None, m.day if m.day is not None else 0, m.page_number)
+    )
+    return LabIndex(measurements=measurements, r_ratios=candidates)
+
+
+def _timing_label(day: Optional[int], day_basis: Optional[str]) -> str:
+    if day_basis == "admission" and day == 0:
+        return " @admission"
+    if day_basis == "drug_start":
+        return f" @day {day} of drug"
+    if day is not None:
+        return f" @day {day}"
+    return ""
+
+
+def render_lab_index(index: LabIndex) -> str:
+    """Compact prompt rendering: one line per analyte, then the R candidates."""
+
+    if not index.measurements:
+        return ""
+    lines = ["## LAB INDEX (deterministic extraction; confirm against the cited page)"]
+    for analyte in ANALYTES:
+        values = [m for m in index.measurements if m.analyte == analyte]
+        if not values:
+            continue
+        rendered = []
+        for m in values:
+            unit = f" {m.unit}" if m.unit else ""
+            uln = f" (ULN {m.uln:g})" if m.uln is not None else ""
+            rendered.append(f"{m.value:g}{unit}{uln}{_timing_label(m.day, m.day_basis)} [p{m.page_number} {m.source}]")
+        lines.append(f"{analyte}: " + "; ".join(rendered))
+    for candidate in index.r_ratios:
+        lines.append(
+            f"R candidate: {candidate.r_ratio:g} {candidate.injury_pattern} "
+            f"(ALT {candidate.alt:g}/{candidate.alt_uln:g}, ALP {candidate.alp:g}/{candidate.alp_uln:g})"
+            f"{_timing_label(candidate.day, candidate.day_basis)} [p{candidate.page_number} {candidate.source}]"
+        )
+    return "\n".join(lines)
+
+
+__all__ = [
+    "ANALYTES",
+    "build_lab_index",
+    "cell_timing",
+    "render_lab_index",
+    "sentence_measurements",
+    "sentence_timing",
+    "table_measurements",
+]
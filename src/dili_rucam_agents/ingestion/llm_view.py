@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+from dili_rucam_agents.tokens import count_tokens
+
+from .case_bundle import CaseBundle, CaseBundleTable
+from .dedupe import CONTAINMENT_THRESHOLD, normalize_text, shingles
+from .lab_index import render_lab_index
+
+# Default budget for the rendering handed to analysts and arbiters; a typical 2–5
+# page case report fits with room to spare, longer reviews get trimmed.
+DEFAULT_LLM_VIEW_TOKENS = 6000
+
+# Sections in the order they are funded from the budget. RUCAM scoring depends
+# first on liver tests, then on the drugs involved and on onset/dechallenge timing.
+SECTION_PRIORITY = ("labs", "medications", "timeline", "other")
+
+_SECTION_PATTERNS: Dict[str, re.Pattern[str]] = {
+    "labs": re.compile(
+        r"\b(alt|ast|alp|ggt|gamma[- ]?glutamyl|alanine|aspartate|aminotransferase|transaminase|"
+        r"alkaline phosphatase|bilirubin|albumin|inr|prothrombin|eosinophil\w*|platelet\w*|"
+        r"serolog\w*|antibod\w*|igm|hav|hbv|hbsag|hcv|hev|cmv|ebv|hsv|ana|asma|biops\w*|"
+        r"ultrasound|ultrasonograph\w*|tomograph\w*|mri|uln|u/l|iu/l|[µu]mol/l|mg/dl|g/dl)\b",
+        re.IGNORECASE,
+    ),
+    "medications": re.compile(
+        r"\b(drugs?|medications?|treat(?:ed|ment)|therapy|dose|dosage|daily|mg|tablets?|"
+        r"administ\w*|prescri\w*|withdraw\w*|withdrawn|discontinu\w*|stopp\w*|rechalleng\w*|"
+        r"re-?administ\w*|herbal|supplements?|-induced)\b",
+        re.IGNORECASE,
+    ),
+    "timeline": re.compile(
+        r"\b((?:19|20)\d{2}|jan(?:uary)?|feb(?:ruary)?|march|april|june|july|aug(?:ust)?|"
+        r"sep(?:tember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?|days?|weeks?|months?|"
+        r"years? later|onset|admission|admitted|follow-?up|thereafter|subsequently|"
+        r"later|before|after|within)\b",
+        re.IGNORECASE,
+    ),
+}
+
+# Sentence boundaries inside a block; extractor blocks can span a whole page.
+_SENTENCE_BREAK = re.compile(r"(?<=[.;!?])\s+(?=[A-Z(\[])")
+
+
+@dataclass(slots=True)
+class LlmView:
+    """Single, non-redundant rendering of a case bundle sized for an LLM prompt."""
+
+    text: str
+    token_budget: int
+    tokens_before: int
+    tokens_after: int
+    sections: Dict[str, int] = field(default_factory=dict)
+    omitted_passages: int = 0
+    # Recall diagnostics when rendered by :func:`.retrieval.build_retrieval_view`.
+    retrieval: Optional[Dict[str, Any]] = None
+
+    @property
+    def tokens_saved(self) -> int:
+        return max(self.tokens_before - self.tokens_after, 0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {
+            "token_budget": self.token_budget,
+            "tokens_before": self.tokens_before,
+            "tokens_after": self.tokens_after,
+            "tokens_saved": self.tokens_saved,
+            "sections": dict(self.sections),
+            "omitted_passages": self.omitted_passages,
+        }
+        if self.retrieval is not None:
+            payload["retrieval"] = self.retrieval
+        return payload
+
+
+@dataclass(slots=True)
+class Passage:
+    """A run of sentences of one section on one page, with its rendered token count."""
+
+    section: str
+    page_number: int
+    order: int
+    text: str
+    tokens: int = 0
+
+
+def classify_text(text: str) -> str:
+    """Highest-priority section whose vocabulary appears in ``text``."""
+
+    for section in SECTION_PRIORITY[:-1]:
+        if _SECTION_PATTERNS[section].search(text):
+            return section
+    return "other"
+
+
+def _render_table(table: CaseBundleTable) -> str:
+    rows = [" | ".join(cell.strip() for cell in row if cell is not None) for row in table.raw_rows]
+    return f"Table {table.table_index}:\n" + "\n".join(row for row in rows if row.strip(" |"))
+
+
+def _table_shingles(tables: List[CaseBundleTable]) -> Dict[int, Set[int]]:
+    per_page: Dict[int, Set[int]] = {}
+    for table in tables:
+        cells = " ".join(cell or "" for row in table.raw_rows for cell in row)
+        per_page.setdefault(table.page_number, set()).update(shingles(normalize_text(cells)))
+    return per_page
+
+
+def collect_passages(bundle: CaseBundle) -> List[Passage]:
+    """Split blocks into sentences, drop repeats, and group runs of one section."""
+
+    table_shingles = _table_shingles(bundle.tables)
+    seen: Set[str] = set()
+    passages: List[Passage] = []
+    order = 0
+
+    for block in bundle.blocks:
+        if block.element_type == "Table":
+            # pdfplumber rows are the canonical copy when they cover this block.
+            covered = table_shingles.get(block.page_number, set())
+            block_shingles = shingles(normalize_text(block.text))
+            if block_shingles and len(block_shingles & covered) >= CONTAINMENT_THRESHOLD * len(block_shingles):
+                continue
+
+        for sentence in _SENTENCE_BREAK.split(block.text.strip()):
+            normalized = normalize_text(sentence)
+            # Running headers/footers and extractor overlap repeat verbatim.
+            if not normalized or normalized in seen:
+                continue
+            seen.add(normalized)
+
+            section = classify_text(sentence)
+            previous = passages[-1] if passages else None
+            if previous and previous.section == section and previous.page_number == block.page_number:
+                previous.text = f"{previous.text} {sentence.strip()}"
+            else:
+                passages.append(Passage(section, block.page_number, order, sentence.strip()))
+                order += 1
+
+    for table in bundle.tables:
+        rendered = _render_table(table)
+        passages.append(Passage(classify_text(rendered), table.page_number, order, rendered))
+        order += 1
+
+    for passage in passages:
+        passage.tokens = count_tokens(f"[p{passage.page_number}] {passage.text}\n")
+    return passages
+
+
+def render_header(bundle: CaseBundle) -> str:
+    """Source line, unknowns and the typed lab index that open every rendering."""
+
+    lines = [f"CASE BUNDLE (LLM view) source={bundle.pdf_path}"]
+    if bundle.unknowns:
+        lines.append("Unknowns: " + "; ".join(bundle.unknowns))
+    # The typed lab index is a few lines and is always kept: it is what RUCAM scores first.
+    lab_index = render_lab_index(bundle.lab_index)
+    if lab_index:
+        lines.append(lab_index)
+    return "\n".join(lines)
+
+
+def _omitted_summary(count: int, pages: List[int]) -> str:
+    return f"## OMITTED\n{count} lower-priority passages over budget (pages {pages})"
+
+
+def build_llm_view(bundle: CaseBundle, token_budget: int = DEFAULT_LLM_VIEW_TOKENS) -> LlmView:
+    """Render ``bundle`` once (no ``normalized_text``/``blocks``/table duplication) within ``token_budget``.
+
+    Passages are funded section by section in :data:`SECTION_PRIORITY` order and in
+    document order within a section; a passage that does not fit is skipped so
+    shorter ones later in the section can still be included. The rendering keeps
+    page references so reviewers can trace every statement to the PDF.
+    """
+
+    tokens_before = count_tokens(bundle.to_json())
+    header = render_header(bundle)
+    passages = collect_passages(bundle)
+    all_pages = sorted({p.page_number for p in passages})
+    # Keep room for the omission summary so the rendering never exceeds the budget.
+    remaining = token_budget - count_tokens(header + "\n" + _omitted_summary(len(passages), all_pages))
+
+    kept: Dict[str, List[Passage]] = {section: [] for section in SECTION_PRIORITY}
+    omitted: List[Passage] = []
+    for section in SECTION_PRIORITY:
+        heading_tokens = count_tokens(f"## {section.upper()}\n")
+        for passage in (p for p in passages if p.section == section):
+            cost = passage.tokens + (0 if kept[section] else heading_tokens)
+            if cost <= remaining:
+                kept[section].append(passage)
+                remaining -= cost
+            else:
+                omitted.append(passage)
+
+    parts = [header]
+    for section in SECTION_PRIORITY:
+        if not kept[section]:
+            continue
+        parts.append(f"## {section.upper()}")
+        parts.extend(f"[p{p.page_number}] {p.text}" for p in sorted(kept[section], key=lambda p: p.order))
+    if omitted:
+        parts.append(_omitted_summary(len(omitted), sorted({p.page_number for p in omitted})))
+
+    text = "\n".join(parts)
+    return LlmView(
+        text=text,
+        token_budget=token_budget,
+        tokens_before=tokens_before,
+        tokens_after=count_tokens(text),
+        sections={section: len(kept[section]) for section in SECTION_PRIORITY},
+        omitted_passages=len(omitted),
+    )
+
+
+__all__ = [
+    "DEFAULT_LLM_VIEW_TOKENS",
+    "SECTION_PRIORITY",
+    "LlmView",
+    "Passage",
+    "build_llm_view",
+    "classify_text",
+    "collect_passages",
+    "render_header",
+]
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import io
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+
+
+class PdfDocument:
+    """A PDF read from disk once and shared by every extractor.
+
+    The raw bytes are loaded a single time and each backend (PyMuPDF, pdfplumber,
+    unstructured) is opened lazily from that in-memory buffer. PyMuPDF page text is
+    decoded once per page and cached so repeated consumers do not pay for it again.
+    """
+
+    def __init__(self, path: Path, data: Optional[bytes] = None) -> None:
+        self.path = path
+        self._data: Optional[bytes] = data
+        self._fitz_doc: Any = None
+        self._plumber_doc: Any = None
+        self._page_text: Dict[int, str] = {}
+
+    @property
+    def data(self) -> bytes:
+        if self._data is None:
+            self._data = self.path.read_bytes()
+        return self._data
+
+    def stream(self) -> io.BytesIO:
+        """Fresh file-like view over the shared bytes (for APIs that consume a stream)."""
+
+        return io.BytesIO(self.data)
+
+    def fitz(self) -> Any:
+        if self._fitz_doc is None:
+            import fitz  # type: ignore
+
+            self._fitz_doc = fitz.open(stream=self.data, filetype="pdf")
+        return self._fitz_doc
+
+    def plumber(self) -> Any:
+        if self._plumber_doc is None:
+            import pdfplumber  # type: ignore
+
+            self._plumber_doc = pdfplumber.open(self.stream())
+        return self._plumber_doc
+
+    @property
+    def page_count(self) -> int:
+        return self.fitz().page_count
+
+    def page_text(self, page_number: int) -> str:
+        """PyMuPDF text for a 1-based page number, decoded at most once."""
+
+        if page_number not in self._page_text:
+            page = self.fitz().load_page(page_number - 1)
+            self._page_text[page_number] = page.get_text("text")
+        return self._page_text[page_number]
+
+    def release_page(self, page_number: int) -> None:
+        """Drop cached text for a page that will not be read again."""
+
+        self._page_text.pop(page_number, None)
+
+    def page_subset(self, page_number: int) -> "PdfDocument":
+        """Single-page document (same path, in-memory bytes) for per-page partitioning."""
+
+        import fitz  # type: ignore
+
+        subset = fitz.open()
+        try:
+            subset.insert_pdf(self.fitz(), from_page=page_number - 1, to_page=page_number - 1)
+            data = subset.tobytes()
+        finally:
+            subset.close()
+        return PdfDocument(self.path, data=data)
+
+    def close(self) -> None:
+        if self._fitz_doc is not None:
+            self._fitz_doc.close()
+            self._fitz_doc = None
+        if self._plumber_doc is not None:
+            self._plumber_doc.close()
+            self._plumber_doc = None
+        self._page_text.clear()
+
+    def __enter__(self) -> "PdfDocument":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+PdfSource = Union[Path, PdfDocument]
+
+
+@contextmanager
+def open_pdf_document(source: PdfSource) -> Iterator[PdfDocument]:
+    """Yield a shared document, closing it only when it was opened here."""
+
+    if isinstance(source, PdfDocument):
+        yield source
+        return
+
+    document = PdfDocument(Path(source))
+    try:
+        yield document
+    finally:
+        document.close()
+
+
+__all__ = ["PdfDocument", "PdfSource", "open_pdf_document"]
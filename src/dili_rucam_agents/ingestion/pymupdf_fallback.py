@@ -1,35 +1,67 @@
 from __future__ import annotations
 
-from pathlib import Path
-from typing import List, Tuple
+from collections import Counter
+from typing import Iterable, List, Optional, Sequence, Tuple
 
-from .case_bundle import CaseBundleBlock
+from .case_bundle import CaseBundleBlock, PageQuality
+from .pdf_document import PdfSource, open_pdf_document
 
+# A page falls back to PyMuPDF when unstructured recovered fewer than this many
+# non-whitespace characters, or less than this share of the page's text layer.
+FALLBACK_MIN_CHARS = 50
+FALLBACK_MIN_COVERAGE = 0.5
 
-def extract_fallback_blocks(pdf_path: Path) -> Tuple[List[CaseBundleBlock], List[str]]:
-    """Fallback text extraction using PyMuPDF (fitz)."""
+
+def pages_needing_fallback(
+    blocks: Sequence[CaseBundleBlock],
+    page_quality: Sequence[PageQuality],
+) -> List[int]:
+    """Pages whose text layer was not recovered by the primary extractor."""
+
+    recovered: Counter[int] = Counter()
+    for block in blocks:
+        recovered[block.page_number] += len("".join(block.text.split()))
+
+    pages: List[int] = []
+    for page in page_quality:
+        if page.char_count == 0:
+            continue
+        chars = recovered[page.page_number]
+        if chars < FALLBACK_MIN_CHARS or chars < FALLBACK_MIN_COVERAGE * page.char_count:
+            pages.append(page.page_number)
+    return pages
+
+
+def extract_fallback_blocks(
+    source: PdfSource,
+    pages: Optional[Iterable[int]] = None,
+) -> Tuple[List[CaseBundleBlock], List[str]]:
+    """Fallback text extraction using PyMuPDF (fitz).
+
+    ``pages`` restricts extraction to those 1-based page numbers; by default every
+    page is extracted.
+    """
 
     try:
-        import fitz  # type: ignore
+        import fitz  # type: ignore  # noqa: F401
     except Exception as exc:  # pragma: no cover - dependency optional
         return [], [f"PyMuPDF unavailable: {exc}"]
 
     blocks: List[CaseBundleBlock] = []
-    doc = fitz.open(str(pdf_path))
-    for page_index in range(doc.page_count):
-        page = doc.load_page(page_index)
-        text = page.get_text("text")
-        if not text.strip():
-            continue
+    with open_pdf_document(source) as document:
+        page_numbers = sorted(set(pages)) if pages is not None else range(1, document.page_count + 1)
+        for page_number in page_numbers:
+            text = document.page_text(page_number)
+            if not text.strip():
+                continue
 
-        blocks.append(
-            CaseBundleBlock(
-                element_type="NarrativeText",
-                page_number=page_index + 1,
-                text=" ".join(line.strip() for line in text.splitlines() if line.strip()),
+            blocks.append(
+                CaseBundleBlock(
+                    element_type="NarrativeText",
+                    page_number=page_number,
+                    text=" ".join(line.strip() for line in text.splitlines() if line.strip()),
+                )
             )
-        )
 
-    doc.close()
-    notes = ["PyMuPDF fallback blocks generated"] if blocks else []
+    notes = [f"PyMuPDF fallback blocks generated pages={[block.page_number for block in blocks]}"] if blocks else []
     return blocks, notes
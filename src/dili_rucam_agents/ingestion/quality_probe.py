@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+from .case_bundle import PageQuality
+from .pdf_document import PdfDocument, PdfSource, open_pdf_document
+
+# A page is routed to unstructured hi_res when its text layer is missing or thin,
+# when it looks like a scan (large images, little text), or when the layout has
+# three or more columns. Everything else is served well by the fast strategy.
+MIN_TEXT_CHARS = 200
+MIN_TEXT_COVERAGE = 0.05
+SCANNED_IMAGE_COVERAGE = 0.5
+HI_RES_COLUMN_COUNT = 3
+
+# Text blocks narrower than this fraction of the page width are column candidates;
+# left edges closer than COLUMN_GAP (fraction of width) belong to the same column.
+NARROW_BLOCK_WIDTH = 0.45
+COLUMN_GAP = 0.15
+
+
+def _column_count(blocks: List[Tuple[float, float]], page_width: float) -> int:
+    """Cluster left edges of narrow text blocks into columns."""
+
+    left_edges = sorted(x0 for x0, width in blocks if width < NARROW_BLOCK_WIDTH * page_width)
+    if len(left_edges) < 2:
+        return 1
+
+    clusters: List[List[float]] = [[left_edges[0]]]
+    for x0 in left_edges[1:]:
+        if x0 - clusters[-1][-1] > COLUMN_GAP * page_width:
+            clusters.append([x0])
+        else:
+            clusters[-1].append(x0)
+
+    # A lone indented block is not a column.
+    return max(1, sum(1 for cluster in clusters if len(cluster) >= 2))
+
+
+def _page_strategy(char_count: int, coverage: float, columns: int, image_coverage: float) -> str:
+    if char_count < MIN_TEXT_CHARS or coverage < MIN_TEXT_COVERAGE:
+        return "hi_res"
+    if image_coverage >= SCANNED_IMAGE_COVERAGE and coverage < 2 * MIN_TEXT_COVERAGE:
+        return "hi_res"
+    if columns >= HI_RES_COLUMN_COUNT:
+        return "hi_res"
+    return "fast"
+
+
+def probe_page(document: PdfDocument, page_number: int) -> PageQuality:
+    """Score one 1-based page of an open document (requires PyMuPDF)."""
+
+    page = document.fitz().load_page(page_number - 1)
+    rect = page.rect
+    page_area = max(rect.width * rect.height, 1.0)
+
+    char_count = len("".join(document.page_text(page_number).split()))
+
+    text_area = 0.0
+    block_geometry: List[Tuple[float, float]] = []
+    for x0, y0, x1, y1, text, _block_no, block_type in page.get_text("blocks"):
+        if block_type != 0 or not text.strip():
+            continue
+        text_area += (x1 - x0) * (y1 - y0)
+        block_geometry.append((x0 - rect.x0, x1 - x0))
+
+    image_area = 0.0
+    for image in page.get_image_info():
+        x0, y0, x1, y1 = image["bbox"]
+        image_area += max(0.0, x1 - x0) * max(0.0, y1 - y0)
+
+    coverage = min(text_area / page_area, 1.0)
+    image_coverage = min(image_area / page_area, 1.0)
+    columns = _column_count(block_geometry, rect.width)
+
+    return PageQuality(
+        page_number=page_number,
+        char_count=char_count,
+        text_coverage=round(coverage, 4),
+        # characters per 1000 square points
+        char_density=round(char_count * 1000 / page_area, 4),
+        column_count=columns,
+        image_coverage=round(image_coverage, 4),
+        strategy=_page_strategy(char_count, coverage, columns, image_coverage),
+    )
+
+
+def probe_page_quality(source: PdfSource) -> List[PageQuality]:
+    """Score every page's text layer with PyMuPDF; empty when PyMuPDF is missing."""
+
+    try:
+        import fitz  # type: ignore  # noqa: F401
+    except Exception:  # pragma: no cover - dependency optional
+        return []
+
+    with open_pdf_document(source) as document:
+        return [probe_page(document, page_number) for page_number in range(1, document.page_count + 1)]
+
+
+def choose_strategy(pages: List[PageQuality]) -> Optional[str]:
+    """Document-level unstructured strategy, or None when the probe had no data.
+
+    partition_pdf applies one strategy per call and chunks by title across pages,
+    so a single page that needs layout detection sends the whole document to hi_res.
+    """
+
+    if not pages:
+        return None
+    return "hi_res" if any(page.strategy == "hi_res" for page in pages) else "fast"
+
+
+__all__ = ["choose_strategy", "probe_page", "probe_page_quality"]
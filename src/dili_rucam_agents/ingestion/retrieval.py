@@ -0,0 +1,309 @@
+"""Lexical retrieval over case bundle passages, ranked per RUCAM item.
+
+Long reviews and supplements are mostly background: RUCAM needs the medication
+timeline, the liver tests, the exclusion workup and the dechallenge/rechallenge
+course. :class:`RetrievalIndex` scores every passage of the bundle (block
+sentences and pdfplumber tables, as split by :mod:`.llm_view`) against one BM25
+query per item, and :func:`build_retrieval_view` keeps only the passages that
+rank for some item. Everything is local and deterministic.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Sequence, Set, Tuple
+
+from dili_rucam_agents.tokens import count_tokens
+from dili_rucam_agents.validators.rucam_engine import RUCAM_ITEMS
+
+from .case_bundle import CaseBundle
+from .llm_view import DEFAULT_LLM_VIEW_TOKENS, LlmView, Passage, build_llm_view, collect_passages, render_header
+
+# Shorter documents are rendered by the plain LLM view: pruning a case report of a
+# few pages saves little and risks dropping the one sentence an item hinges on.
+RETRIEVAL_MIN_PAGES = 10
+
+# One query per RUCAM item, plus the liver tests behind R and the injury pattern.
+ITEM_QUERIES: Dict[str, str] = {
+    "injury_pattern": (
+        "ALT AST alanine aspartate aminotransferase transaminase alkaline phosphatase ALP GGT "
+        "bilirubin ULN normal U/L IU/L elevated peak"
+    ),
+    "time_to_onset": (
+        "started began initiated commenced given prescribed onset after starting days weeks months "
+        "later symptoms jaundice pruritus presented admitted latency"
+    ),
+    "course": (
+        "discontinued stopped withdrawn withdrawal dechallenge interrupted decreased declined fell "
+        "normalized normalised returned normal improved resolved recovery follow-up"
+    ),
+    "risk_factors": "alcohol ethanol drinking drinks consumption aged old pregnancy pregnant",
+    "concomitant_drugs": (
+        "concomitant medications co-medication drugs herbal supplements paracetamol acetaminophen "
+        "also taking combination"
+    ),
+    "alternative_causes_excluded": (
+        "hepatitis viral HAV HBV HBsAg HCV HEV CMV EBV HSV serology serological antibodies IgM "
+        "negative ultrasound ultrasonography biliary obstruction autoimmune ANA ASMA antimitochondrial "
+        "biopsy ischemic hypotension sepsis alcohol excluded"
+    ),
+    "known_hepatotoxicity": (
+        "hepatotoxicity hepatotoxic known reported previously cases literature label liver injury "
+        "drug-induced"
+    ),
+    "rechallenge": (
+        "rechallenge readministration readministered re-exposure reintroduced restarted resumed "
+        "recurrence recurred relapse"
+    ),
+}
+RETRIEVAL_ITEMS: Tuple[str, ...] = ("injury_pattern", *RUCAM_ITEMS)
+
+# Ranking cut-offs for one item: a passage is relevant when it scores at least this
+# share of the item's best passage, and at most ``PER_ITEM_LIMIT`` are kept.
+MIN_RELATIVE_SCORE = 0.3
+PER_ITEM_LIMIT = 8
+
+_WORD = re.compile(r"[a-z][a-z0-9]*")
+# "ALT"/"alt", "weeks"/"week", "withdrawal"/"withdrawn" share a term; six letters keep
+# "aminotransferase" and "alkaline" apart while folding most inflections.
+_STEM_LENGTH = 6
+# Running headers, citations and affiliations rank for nothing useful.
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from had has have in is it its of on or that the this to was were "
+    "which with".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased, truncation-stemmed word terms (numbers and stopwords dropped)."""
+
+    terms: List[str] = []
+    for word in _WORD.findall(text.lower()):
+        if word in _STOPWORDS:
+            continue
+        if len(word) > 3 and word.endswith("s"):
+            word = word[:-1]
+        terms.append(word[:_STEM_LENGTH])
+    return terms
+
+
+class Bm25Index:
+    """Okapi BM25 over a fixed list of documents."""
+
+    def __init__(self, documents: Sequence[str], *, k1: float = 1.5, b: float = 0.75) -> None:
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, List[Tuple[int, int]]] = {}
+        self._lengths: List[int] = []
+        for doc_id, document in enumerate(documents):
+            terms = tokenize(document)
+            self._lengths.append(len(terms))
+            for term, count in Counter(terms).items():
+                self._postings.setdefault(term, []).append((doc_id, count))
+        self._average_length = (sum(self._lengths) / len(self._lengths)) if self._lengths else 0.0
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def scores(self, query: str) -> List[float]:
+        """BM25 score of every document for ``query`` (each query term counted once)."""
+
+        scores = [0.0] * len(self._lengths)
+        total = len(self._lengths)
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1.0 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, count in postings:
+                norm = self.k1 * (1.0 - self.b + self.b * self._lengths[doc_id] / self._average_length)
+                scores[doc_id] += idf * count * (self.k1 + 1.0) / (count + norm)
+        return scores
+
+
+@dataclass(slots=True)
+class ItemRecall:
+    """How much of one item's relevant material the pruned context kept."""
+
+    item: str
+    matched: int
+    relevant: int
+    kept: int
+    score_recall: float
+    dropped_pages: List[int] = field(default_factory=list)
+
+    @property
+    def complete(self) -> bool:
+        return self.kept == self.relevant
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "item": self.item,
+            "matched": self.matched,
+            "relevant": self.relevant,
+            "kept": self.kept,
+            "score_recall": self.score_recall,
+            "dropped_pages": list(self.dropped_pages),
+            "complete": self.complete,
+        }
+
+
+class RetrievalIndex:
+    """BM25 index over one bundle's passages, built once and ranked per RUCAM item."""
+
+    def __init__(self, bundle: CaseBundle) -> None:
+        self.passages: List[Passage] = collect_passages(bundle)
+        self._bm25 = Bm25Index([passage.text for passage in self.passages])
+        self._rankings: Dict[str, List[Tuple[int, float]]] = {}
+
+    def rank(self, item: str) -> List[Tuple[int, float]]:
+        """``(passage index, score)`` for every passage matching ``item``, best first."""
+
+        if item not in self._rankings:
+            scores = self._bm25.scores(ITEM_QUERIES[item])
+            ranked = [(index, score) for index, score in enumerate(scores) if score > 0.0]
+            ranked.sort(key=lambda pair: (-pair[1], pair[0]))
+            self._rankings[item] = ranked
+        return self._rankings[item]
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[int, float]]:
+        """Ad-hoc query, e.g. a suspect drug name."""
+
+        scores = self._bm25.scores(query)
+        ranked = sorted(((i, s) for i, s in enumerate(scores) if s > 0.0), key=lambda pair: (-pair[1], pair[0]))
+        return ranked[:limit]
+
+    def relevant(self, item: str) -> List[Tuple[int, float]]:
+        """The item's passages that pass :data:`MIN_RELATIVE_SCORE` and :data:`PER_ITEM_LIMIT`."""
+
+        ranked = self.rank(item)
+        if not ranked:
+            return []
+        floor = ranked[0][1] * MIN_RELATIVE_SCORE
+        return [pair for pair in ranked if pair[1] >= floor][:PER_ITEM_LIMIT]
+
+
+_RELEVANT_HEADING = "## RELEVANT PASSAGES (BM25 per RUCAM item)"
+
+
+def _omitted_summary(count: int, pages: List[int]) -> str:
+    return f"## OMITTED\n{count} passages not ranked for any RUCAM item or over budget (pages {pages})"
+
+
+def _page_count(bundle: CaseBundle) -> int:
+    # The probe sees every page, including blank and image-only ones that yield no
+    # blocks; content pages are only a fallback for bundles built without PyMuPDF.
+    if bundle.quality.page_quality:
+        return len(bundle.quality.page_quality)
+    pages = {block.page_number for block in bundle.blocks} | {table.page_number for table in bundle.tables}
+    return len(pages)
+
+
+def _recall(index: RetrievalIndex, item: str, kept: Set[int]) -> ItemRecall:
+    ranked = index.rank(item)
+    relevant = index.relevant(item)
+    total = sum(score for _, score in ranked)
+    return ItemRecall(
+        item=item,
+        matched=len(ranked),
+        relevant=len(relevant),
+        kept=sum(1 for position, _ in relevant if position in kept),
+        score_recall=round(sum(score for position, score in ranked if position in kept) / total, 4) if total else 1.0,
+        dropped_pages=sorted({index.passages[p].page_number for p, _ in relevant if p not in kept}),
+    )
+
+
+def build_retrieval_view(
+    bundle: CaseBundle,
+    token_budget: int = DEFAULT_LLM_VIEW_TOKENS,
+    *,
+    min_pages: int = RETRIEVAL_MIN_PAGES,
+) -> LlmView:
+    """Relevance-pruned rendering of ``bundle`` for analysts and arbiters.
+
+    Bundles of ``min_pages`` pages or fewer get the plain :func:`build_llm_view`.
+    Longer ones keep, for every item in :data:`RETRIEVAL_ITEMS`, its relevant
+    passages (see :meth:`RetrievalIndex.relevant`), funded round-robin by rank so
+    each item gets its best passages before any item gets more; passages that no
+    item ranks are omitted. Kept passages are rendered once, in document order,
+    tagged with the items they serve. ``LlmView.retrieval`` records per-item recall
+    (``complete`` is False when the budget cut a relevant passage).
+    """
+
+    pages = _page_count(bundle)
+    if pages <= min_pages:
+        view = build_llm_view(bundle, token_budget)
+        view.retrieval = {"applied": False, "pages": pages, "min_pages": min_pages}
+        return view
+
+    tokens_before = count_tokens(bundle.to_json())
+    header = render_header(bundle)
+    index = RetrievalIndex(bundle)
+    passages = index.passages
+    all_pages = sorted({passage.page_number for passage in passages})
+    # Keep room for the omission summary so the rendering never exceeds the budget.
+    remaining = token_budget - count_tokens(
+        "\n".join([header, _RELEVANT_HEADING, _omitted_summary(len(passages), all_pages)])
+    )
+
+    relevant = {item: index.relevant(item) for item in RETRIEVAL_ITEMS}
+    tags: Dict[int, List[str]] = {}
+    for item in RETRIEVAL_ITEMS:
+        for position, _ in relevant[item]:
+            tags.setdefault(position, []).append(item)
+
+    kept: Set[int] = set()
+    for rank in range(PER_ITEM_LIMIT):
+        for item in RETRIEVAL_ITEMS:
+            if rank >= len(relevant[item]):
+                continue
+            position = relevant[item][rank][0]
+            if position in kept:
+                continue
+            cost = passages[position].tokens + count_tokens(" " + ",".join(tags[position]))
+            if cost <= remaining:
+                kept.add(position)
+                remaining -= cost
+
+    parts = [header, _RELEVANT_HEADING]
+    for position in sorted(kept, key=lambda p: passages[p].order):
+        passage = passages[position]
+        parts.append(f"[p{passage.page_number} {','.join(tags[position])}] {passage.text}")
+    omitted = [passage for position, passage in enumerate(passages) if position not in kept]
+    if omitted:
+        parts.append(_omitted_summary(len(omitted), sorted({passage.page_number for passage in omitted})))
+
+    text = "\n".join(parts)
+    items = [_recall(index, item, kept) for item in RETRIEVAL_ITEMS]
+    return LlmView(
+        text=text,
+        token_budget=token_budget,
+        tokens_before=tokens_before,
+        tokens_after=count_tokens(text),
+        sections={item: sum(1 for position in kept if item in tags[position]) for item in RETRIEVAL_ITEMS},
+        omitted_passages=len(omitted),
+        retrieval={
+            "applied": True,
+            "pages": pages,
+            "min_pages": min_pages,
+            "passages": len(passages),
+            "kept_passages": len(kept),
+            "complete": all(recall.complete for recall in items),
+            "items": [recall.to_dict() for recall in items],
+        },
+    )
+
+
+__all__ = [
+    "ITEM_QUERIES",
+    "RETRIEVAL_ITEMS",
+    "RETRIEVAL_MIN_PAGES",
+    "Bm25Index",
+    "ItemRecall",
+    "RetrievalIndex",
+    "build_retrieval_view",
+    "tokenize",
+]
@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from .case_bundle import (
+    CaseBundle,
+    CaseBundleBlock,
+    CaseBundleTable,
+    PageQuality,
+    QualityMetrics,
+    dumps_compact,
+    loads_json,
+)
+from .dedupe import merge_blocks_with_stats
+from .lab_index import build_lab_index
+from .pdf_document import PdfDocument
+from .pdfplumber_tables import extract_page_range_tables
+from .pymupdf_fallback import extract_fallback_blocks, pages_needing_fallback
+from .quality_probe import probe_page
+from .unstructured_ingest import run_unstructured_ingest
+
+
+@dataclass
+class PageBundle:
+    """Everything ingestion produced for a single page."""
+
+    page_number: int
+    blocks: List[CaseBundleBlock]
+    tables: List[CaseBundleTable]
+    quality: Optional[PageQuality] = None
+
+
+@dataclass
+class _StreamSummary:
+    unstructured_notes: List[str] = field(default_factory=list)
+    unstructured_block_count: int = 0
+    unstructured_strategies: List[str] = field(default_factory=list)
+    fallback_pages: List[int] = field(default_factory=list)
+    fallback_block_count: int = 0
+    table_count: int = 0
+    table_timings: Dict[int, float] = field(default_factory=dict)
+    tables_unavailable: Optional[str] = None
+    page_quality: List[PageQuality] = field(default_factory=list)
+    removed_blocks: int = 0
+    removed_tokens: int = 0
+    # Set when the document was built in one pass instead of page by page.
+    full_build: Optional[CaseBundle] = None
+
+    def notes(self) -> List[str]:
+        if self.full_build is not None:
+            return list(self.full_build.extraction_notes)
+        notes = list(self.unstructured_notes)
+        if self.fallback_pages:
+            notes.append(f"PyMuPDF fallback blocks generated pages={self.fallback_pages}")
+        if self.tables_unavailable:
+            notes.append(self.tables_unavailable)
+        else:
+            notes.append(f"pdfplumber tables extracted={self.table_count}")
+        notes.append(f"dedupe removed_blocks={self.removed_blocks} removed_tokens={self.removed_tokens}")
+        return notes
+
+    def quality(self) -> QualityMetrics:
+        if self.full_build is not None:
+            return self.full_build.quality
+        # Strategies that actually partitioned a page, not what the probe asked for.
+        strategies = {strategy for strategy in self.unstructured_strategies if strategy}
+        strategy = "per_page" if len(strategies) > 1 else "".join(strategies)
+        return QualityMetrics(
+            unstructured_total_score=self.unstructured_block_count,
+            fallback_pages=list(self.fallback_pages),
+            fallback_total_score=self.fallback_block_count,
+            unstructured_strategy=strategy,
+            page_quality=list(self.page_quality),
+        )
+
+
+def _unavailable(module: str, label: str) -> Optional[str]:
+    try:
+        __import__(module)
+    except Exception as exc:  # pragma: no cover - dependency optional
+        return f"{label}: {exc}"
+    return None
+
+
+class CaseBundleStream:
+    """Page-by-page case bundle ingestion.
+
+    Each page is probed, partitioned by unstructured (as a single-page document with
+    its own fast/hi_res strategy), patched with the PyMuPDF fallback when needed and
+    scanned for tables before the next page is touched, so memory stays flat on long
+    PDFs. Unlike :func:`build_case_bundle`, unstructured's by-title chunking stops at
+    page boundaries. Extraction notes and quality metrics are complete once
+    :meth:`pages` is exhausted.
+    """
+
+    def __init__(self, pdf_path: Path) -> None:
+        self.pdf_path = pdf_path
+        self._summary = _StreamSummary()
+
+    @property
+    def extraction_notes(self) -> List[str]:
+        return self._summary.notes()
+
+    @property
+    def quality(self) -> QualityMetrics:
+        return self._summary.quality()
+
+    @property
+    def diagnostics(self) -> Dict[str, Any]:
+        """Run timings, kept out of the records like :attr:`CaseBundle.diagnostics`."""
+
+        if self._summary.full_build is not None:
+            return dict(self._summary.full_build.diagnostics)
+        return {"pdfplumber_page_ms": dict(self._summary.table_timings)}
+
+    def pages(self) -> Iterator[PageBundle]:
+        from .build_bundle import CaseBundleExtractionError
+
+        if not self.pdf_path.exists():
+            raise CaseBundleExtractionError(f"PDF not found: {self.pdf_path}")
+
+        summary = self._summary = _StreamSummary()
+        if _unavailable("fitz", "PyMuPDF unavailable"):  # pragma: no cover - dependency optional
+            # No page splitting or probing without PyMuPDF: build once and replay.
+            yield from self._replay_full_build()
+            return
+
+        unstructured_skip = _unavailable("unstructured.partition.pdf", "unstructured partition skipped")
+        if unstructured_skip:
+            summary.unstructured_notes.append(unstructured_skip)
+        summary.tables_unavailable = _unavailable("pdfplumber", "pdfplumber unavailable")
+
+        with PdfDocument(self.pdf_path) as document:
+            for page_number in range(1, document.page_count + 1):
+                yield self._ingest_page(document, page_number, unstructured_skip is None)
+                document.release_page(page_number)
+
+    def _ingest_page(self, document: PdfDocument, page_number: int, use_unstructured: bool) -> PageBundle:
+        summary = self._summary
+        quality = probe_page(document, page_number)
+        summary.page_quality.append(quality)
+
+        unstructured_blocks: List[CaseBundleBlock] = []
+        if use_unstructured:
+            with document.page_subset(page_number) as subset:
+                subset_blocks, subset_notes, subset_strategy = run_unstructured_ingest(subset, quality.strategy)
+            summary.unstructured_strategies.append(subset_strategy)
+            unstructured_blocks = [replace(block, page_number=page_number) for block in subset_blocks]
+            summary.unstructured_notes.extend(f"page {page_number}: {note}" for note in subset_notes)
+            summary.unstructured_block_count += len(unstructured_blocks)
+
+        fallback_blocks: List[CaseBundleBlock] = []
+        if pages_needing_fallback(unstructured_blocks, [quality]):
+            fallback_blocks, _ = extract_fallback_blocks(document, [page_number])
+            if fallback_blocks:
+                summary.fallback_pages.append(page_number)
+                summary.fallback_block_count += len(fallback_blocks)
+
+        tables: List[CaseBundleTable] = []
+        if summary.tables_unavailable is None:
+            for _, page_tables, elapsed in extract_page_range_tables(document, page_number, page_number):
+                summary.table_timings[page_number] = round(elapsed * 1000, 1)
+                for rows in page_tables:
+                    summary.table_count += 1
+                    tables.append(
+                        CaseBundleTable(
+                            page_number=page_number,
+                            table_index=summary.table_count,
+                            raw_rows=rows,
+                            preview=" | ".join(rows[0]) if rows else "",
+                        )
+                    )
+
+        blocks, dedupe_stats = merge_blocks_with_stats(unstructured_blocks, fallback_blocks)
+        summary.removed_blocks += dedupe_stats.removed_blocks
+        summary.removed_tokens += dedupe_stats.removed_tokens
+
+        return PageBundle(
+            page_number=page_number,
+            blocks=blocks,
+            tables=tables,
+            quality=quality,
+        )
+
+    def _replay_full_build(self) -> Iterator[PageBundle]:  # pragma: no cover - dependency optional
+        from .build_bundle import build_case_bundle
+
+        bundle = build_case_bundle(self.pdf_path)
+        self._summary.full_build = bundle
+        page_numbers = sorted({block.page_number for block in bundle.blocks} | {t.page_number for t in bundle.tables})
+        for page_number in page_numbers:
+            yield PageBundle(
+                page_number=page_number,
+                blocks=[block for block in bundle.blocks if block.page_number == page_number],
+                tables=[table for table in bundle.tables if table.page_number == page_number],
+            )
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """NDJSON-ready records: header, per-page block/table/page records, footer."""
+
+        yield {"type": "header", "pdf_path": str(self.pdf_path)}
+        for page in self.pages():
+            for block in page.blocks:
+                yield {"type": "block", **block.to_dict()}
+            for table in page.tables:
+                yield {"type": "table", **table.to_dict()}
+            yield {
+                "type": "page",
+                "page_number": page.page_number,
+                "blocks": len(page.blocks),
+                "tables": len(page.tables),
+            }
+        yield {
+            "type": "footer",
+            "extraction_notes": self.extraction_notes,
+            "unknowns": [],
+            "quality": self.quality.to_dict(),
+        }
+
+
+def iter_case_bundle_records(pdf_path: Path) -> Iterator[Dict[str, Any]]:
+    return CaseBundleStream(pdf_path).records()
+
+
+def write_case_bundle_ndjson(pdf_path: Path, out: TextIO) -> int:
+    """Stream the bundle as NDJSON, flushing after each page; returns lines written."""
+
+    lines = 0
+    for record in iter_case_bundle_records(pdf_path):
+        out.write(dumps_compact(record).decode("utf-8"))
+        out.write("\n")
+        lines += 1
+        if record["type"] in ("page", "footer"):
+            out.flush()
+    return lines
+
+
+def materialize_case_bundle(records: Iterable[Dict[str, Any]]) -> CaseBundle:
+    """Collect streamed records back into a :class:`CaseBundle` (``to_dict`` shape unchanged)."""
+
+    pdf_path = ""
+    blocks: List[CaseBundleBlock] = []
+    tables: List[CaseBundleTable] = []
+    footer: Dict[str, Any] = {}
+    for record in records:
+        kind = record.get("type")
+        payload = {key: value for key, value in record.items() if key != "type"}
+        if kind == "header":
+            pdf_path = payload["pdf_path"]
+        elif kind == "block":
+            blocks.append(CaseBundleBlock.from_dict(payload))
+        elif kind == "table":
+            tables.append(CaseBundleTable.from_dict(payload))
+        elif kind == "footer":
+            footer = payload
+
+    return CaseBundle(
+        pdf_path=pdf_path,
+        extraction_notes=list(footer.get("extraction_notes", [])),
+        blocks=blocks,
+        normalized_text="\n".join(block.text for block in blocks if block.text).strip(),
+        tables=tables,
+        unknowns=list(footer.get("unknowns", [])),
+        quality=QualityMetrics.from_dict(footer.get("quality", {})),
+        lab_index=build_lab_index(blocks, tables),
+    )
+
+
+def read_case_bundle_ndjson(stream: TextIO) -> CaseBundle:
+    return materialize_case_bundle(loads_json(line) for line in stream if line.strip())
+
+
+__all__ = [
+    "CaseBundleStream",
+    "PageBundle",
+    "iter_case_bundle_records",
+    "materialize_case_bundle",
+    "read_case_bundle_ndjson",
+    "write_case_bundle_ndjson",
+]
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from crewai.tools import BaseTool
+
+from .build_bundle import render_case_bundle
+
+
+class CaseBundleExtractionTool(BaseTool):
+    """CrewAI tool wrapper around the deterministic case bundle pipeline."""
+
+    name: str = "case_bundle_extractor"
+    description: str = (
+        "Convert a PDF path into the canonical case_bundle_json contract "
+        "defined in agent.md using deterministic ingestion."
+    )
+    workers: int = 1
+    use_cache: bool = True
+    cache_dir: Optional[str] = None
+    # When set, return the token-budgeted LLM view instead of the full JSON contract.
+    llm_view_tokens: Optional[int] = None
+    # Prune documents over ten pages to the passages ranked for a RUCAM item.
+    retrieval_view: bool = False
+    last_llm_view: Optional[Dict[str, Any]] = None
+
+    def _run(self, pdf_path: str) -> str:
+        text, view_stats = render_case_bundle(
+            Path(pdf_path),
+            workers=self.workers,
+            use_cache=self.use_cache,
+            cache_dir=self.cache_dir,
+            llm_view_tokens=self.llm_view_tokens,
+            retrieval_view=self.retrieval_view,
+        )
+        if view_stats:
+            self.last_llm_view = view_stats
+        return text
+
+    async def _arun(self, pdf_path: str) -> str:  # pragma: no cover - async parity
+        return self._run(pdf_path)
+
+
+__all__ = ["CaseBundleExtractionTool"]
@@ -1,22 +1,30 @@
 from __future__ import annotations
 
-from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from .case_bundle import CaseBundleBlock
+from .pdf_document import PdfSource, open_pdf_document
 
 
-def run_unstructured_ingest(pdf_path: Path) -> Tuple[List[CaseBundleBlock], List[str]]:
-    """Return layout-aware blocks plus extraction notes from unstructured."""
+def run_unstructured_ingest(
+    source: PdfSource,
+    strategy: Optional[str] = None,
+) -> Tuple[List[CaseBundleBlock], List[str], str]:
+    """Return layout-aware blocks, extraction notes and the strategy that ran.
+
+    ``strategy="fast"`` skips hi_res entirely (chosen by the quality probe for PDFs
+    with a good text layer); otherwise hi_res is tried first with fast as fallback.
+    The returned strategy is the one whose partition succeeded, ``""`` when none did.
+    """
 
     try:
         from unstructured.partition.pdf import partition_pdf  # type: ignore
     except Exception as exc:  # pragma: no cover - dependency optional
-        return [], [f"unstructured partition skipped: {exc}"]
+        return [], [f"unstructured partition skipped: {exc}"], ""
 
-    def _partition(strategy: str):
+    def _partition(document, strategy: str):
         return partition_pdf(
-            filename=str(pdf_path),
+            file=document.stream(),
             strategy=strategy,
             extract_images_in_pdf=False,
             infer_table_structure=True,
@@ -26,17 +34,29 @@ def run_unstructured_ingest(pdf_path: Path) -> Tuple[List[CaseBundleBlock], List
     elements = []
     notes: List[str] = []
 
-    try:
-        elements = _partition("hi_res")
-        notes.append("unstructured partition_pdf hi_res strategy")
-    except Exception as exc:  # pragma: no cover - environment dependent
-        notes.append(f"unstructured hi_res failed: {exc}")
-        try:
-            elements = _partition("fast")
-            notes.append("unstructured partition_pdf fast strategy fallback")
-        except Exception as exc2:
-            notes.append(f"unstructured fast failed: {exc2}")
-            return [], notes
+    with open_pdf_document(source) as document:
+        if strategy == "fast":
+            try:
+                elements = _partition(document, "fast")
+                used = "fast"
+                notes.append("unstructured partition_pdf fast strategy (text layer passed quality probe)")
+            except Exception as exc:
+                notes.append(f"unstructured fast failed: {exc}")
+                return [], notes, ""
+        else:
+            try:
+                elements = _partition(document, "hi_res")
+                used = "hi_res"
+                notes.append("unstructured partition_pdf hi_res strategy")
+            except Exception as exc:  # pragma: no cover - environment dependent
+                notes.append(f"unstructured hi_res failed: {exc}")
+                try:
+                    elements = _partition(document, "fast")
+                    used = "fast"
+                    notes.append("unstructured partition_pdf fast strategy fallback")
+                except Exception as exc2:
+                    notes.append(f"unstructured fast failed: {exc2}")
+                    return [], notes, ""
 
     blocks: List[CaseBundleBlock] = []
     for element in elements:
@@ -55,4 +75,4 @@ def run_unstructured_ingest(pdf_path: Path) -> Tuple[List[CaseBundleBlock], List
         )
 
     notes.append(f"extracted_blocks={len(blocks)}")
-    return blocks, notes
+    return blocks, notes, used
@@ -2,9 +2,14 @@ from __future__ import annotations
 
 import argparse
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from dili_rucam_agents.crew.crew import run_crew
+from dili_rucam_agents.crew.repair import DEFAULT_REPAIR_RETRIES
+from dili_rucam_agents.crew.report_stream import report_filename
+from dili_rucam_agents.ingestion.build_bundle import INGESTION_MODES
+
+if TYPE_CHECKING:
+    from dili_rucam_agents.crew.factory import CrewFactory
 
 
 def run_end_to_end(
@@ -14,12 +19,40 @@ def run_end_to_end(
     *,
     use_arbiter_beta: bool = False,
     use_arbiter_gamma: bool = False,
+    ingestion_workers: int = 1,
+    use_bundle_cache: bool = True,
+    bundle_cache_dir: Optional[str] = None,
+    llm_view_tokens: Optional[int] = None,
+    analyst_concurrency: int = 1,
+    arbiter_concurrency: int = 1,
+    ingestion_mode: str = "agent",
+    retrieval_view: bool = False,
+    repair_retries: int = DEFAULT_REPAIR_RETRIES,
+    use_llm_cache: bool = True,
+    llm_cache_path: Optional[str] = None,
+    consensus_short_circuit: bool = False,
+    consensus_item_tolerance: int = 0,
+    consensus_r_ratio_tolerance: float = 0.05,
+    crew_factory: Optional[CrewFactory] = None,
+    stream: bool = False,
+    stream_stdout: bool = False,
 ) -> str:
-    """Public helper used by scripts/tests to run the full pipeline."""
+    """Public helper used by scripts/tests to run the full pipeline.
+
+    ``stream`` writes analyst/arbiter tokens to their files in ``output_dir`` as
+    they arrive; ``stream_stdout`` echoes them to stdout. The final reports still
+    replace those files at the end.
+    """
+
+    # CrewAI (and the pydantic report models) load on first use so `--help` stays fast.
+    from dili_rucam_agents.crew.consensus import ConsensusTolerance
+    from dili_rucam_agents.crew.crew import run_crew
 
     resolved_pdf = str(Path(pdf_path).expanduser().resolve())
     resolved_prompt = Path(prompt_path).expanduser().resolve() if prompt_path else None
     resolved_output_dir = Path(output_dir).expanduser().resolve() if output_dir else None
+    if stream and resolved_output_dir is None:
+        raise ValueError("stream=True writes into output_dir; pass one or use stream_stdout")
 
     if resolved_output_dir:
         resolved_output_dir.mkdir(parents=True, exist_ok=True)
@@ -30,6 +63,28 @@ def run_end_to_end(
         capture_reports=resolved_output_dir is not None,
         use_arbiter_beta=use_arbiter_beta,
         use_arbiter_gamma=use_arbiter_gamma,
+        ingestion_workers=ingestion_workers,
+        use_bundle_cache=use_bundle_cache,
+        bundle_cache_dir=bundle_cache_dir,
+        llm_view_tokens=llm_view_tokens,
+        analyst_concurrency=analyst_concurrency,
+        arbiter_concurrency=arbiter_concurrency,
+        ingestion_mode=ingestion_mode,
+        retrieval_view=retrieval_view,
+        repair_retries=repair_retries,
+        use_llm_cache=use_llm_cache,
+        llm_cache_path=llm_cache_path,
+        consensus_tolerance=(
+            ConsensusTolerance(
+                item_points=consensus_item_tolerance,
+                r_ratio_relative=consensus_r_ratio_tolerance,
+            )
+            if consensus_short_circuit
+            else None
+        ),
+        crew_factory=crew_factory,
+        stream_dir=resolved_output_dir if stream else None,
+        stream_stdout=stream_stdout,
     )
 
     if isinstance(result, tuple):
@@ -68,7 +123,110 @@ def _main() -> None:
         action="store_true",
         help="Enable the optional Arbiter Gamma agent (ARBITER_GAMMA_MODEL).",
     )
+    parser.add_argument(
+        "--ingestion-workers",
+        dest="ingestion_workers",
+        type=int,
+        default=1,
+        help="Run the unstructured, PyMuPDF, and pdfplumber extractors on a process pool of this size.",
+    )
+    parser.add_argument(
+        "--no-bundle-cache",
+        dest="use_bundle_cache",
+        action="store_false",
+        help="Always re-ingest the PDF instead of reusing a cached case bundle.",
+    )
+    parser.add_argument(
+        "--bundle-cache-dir",
+        dest="bundle_cache_dir",
+        help="Case bundle cache directory (defaults to DILI_RUCAM_CACHE_DIR or ~/.cache/dili_rucam_agents/case_bundles).",
+    )
+    parser.add_argument(
+        "--llm-view-tokens",
+        dest="llm_view_tokens",
+        type=int,
+        help="Hand analysts a token-budgeted LLM view of the case bundle instead of the full JSON.",
+    )
+    parser.add_argument(
+        "--retrieval-view",
+        dest="retrieval_view",
+        action="store_true",
+        help="For PDFs over ten pages, hand analysts and arbiters only the passages ranked for a RUCAM item (BM25).",
+    )
+    parser.add_argument(
+        "--repair-retries",
+        dest="repair_retries",
+        type=int,
+        default=DEFAULT_REPAIR_RETRIES,
+        help="Small follow-up calls allowed to fix an invalid SECTION C per analyst/arbiter report (0 disables).",
+    )
+    parser.add_argument(
+        "--analyst-concurrency",
+        dest="analyst_concurrency",
+        type=int,
+        default=1,
+        help="Number of analyst tasks run at once; 2 runs GPT-5.2 and Gemini 3.0 in parallel.",
+    )
+    parser.add_argument(
+        "--arbiter-concurrency",
+        dest="arbiter_concurrency",
+        type=int,
+        default=1,
+        help="Number of arbiters run at once when Beta/Gamma are enabled; their decisions are combined by vote.",
+    )
+    parser.add_argument(
+        "--ingestion-mode",
+        dest="ingestion_mode",
+        choices=INGESTION_MODES,
+        default="agent",
+        help="'direct' builds the case bundle in Python and injects it into the analyst tasks (no ingestion agent).",
+    )
+    parser.add_argument(
+        "--no-llm-cache",
+        dest="use_llm_cache",
+        action="store_false",
+        help="Always call the models instead of replaying cached temperature-0 responses.",
+    )
+    parser.add_argument(
+        "--llm-cache-path",
+        dest="llm_cache_path",
+        help="LLM response cache database (defaults to DILI_RUCAM_LLM_CACHE or ~/.cache/dili_rucam_agents/llm_responses.sqlite3).",
+    )
+    parser.add_argument(
+        "--consensus-skip",
+        dest="consensus_short_circuit",
+        action="store_true",
+        help="Skip the arbiters and emit a consensus report when both analysts' SECTION C agree.",
+    )
+    parser.add_argument(
+        "--consensus-item-tolerance",
+        dest="consensus_item_tolerance",
+        type=int,
+        default=0,
+        help="Largest per-item RUCAM score difference still treated as agreement (default 0).",
+    )
+    parser.add_argument(
+        "--consensus-r-ratio-tolerance",
+        dest="consensus_r_ratio_tolerance",
+        type=float,
+        default=0.05,
+        help="Largest relative R-ratio difference still treated as agreement (default 0.05).",
+    )
+    parser.add_argument(
+        "--stream",
+        dest="stream",
+        action="store_true",
+        help="Write each analyst/arbiter report to --output-dir token by token while it is generated.",
+    )
+    parser.add_argument(
+        "--stream-stdout",
+        dest="stream_stdout",
+        action="store_true",
+        help="Echo analyst/arbiter tokens to stdout as they arrive.",
+    )
     args = parser.parse_args()
+    if args.stream and not args.output_dir:
+        parser.error("--stream requires --output-dir")
     print(
         run_end_to_end(
             args.pdf_path,
@@ -76,25 +234,33 @@ def _main() -> None:
             args.output_dir,
             use_arbiter_beta=args.use_arbiter_beta,
             use_arbiter_gamma=args.use_arbiter_gamma,
+            ingestion_workers=args.ingestion_workers,
+            use_bundle_cache=args.use_bundle_cache,
+            bundle_cache_dir=args.bundle_cache_dir,
+            llm_view_tokens=args.llm_view_tokens,
+            analyst_concurrency=args.analyst_concurrency,
+            arbiter_concurrency=args.arbiter_concurrency,
+            ingestion_mode=args.ingestion_mode,
+            retrieval_view=args.retrieval_view,
+            repair_retries=args.repair_retries,
+            use_llm_cache=args.use_llm_cache,
+            llm_cache_path=args.llm_cache_path,
+            consensus_short_circuit=args.consensus_short_circuit,
+            consensus_item_tolerance=args.consensus_item_tolerance,
+            consensus_r_ratio_tolerance=args.consensus_r_ratio_tolerance,
+            stream=args.stream,
+            stream_stdout=args.stream_stdout,
         )
     )
 
 
 def _persist_reports(reports: dict[str, Optional[str]], output_dir: Path) -> None:
-    filename_map = {
-        "gpt_52": "gpt-5.2_report.md",
-        "gemini_30": "gemini-3.0_report.md",
-    }
-
     for key, content in reports.items():
         if not content:
             continue
 
-        if key in filename_map:
-            filename = filename_map[key]
-        elif key.startswith("arbiter_"):
-            filename = f"{key.replace('_', '-')}_report.md"
-        else:
+        filename = report_filename(key)
+        if filename is None:
             continue
 
         (output_dir / filename).write_text(content, encoding="utf-8")
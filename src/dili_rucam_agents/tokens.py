@@ -0,0 +1,36 @@
+"""Token estimates shared by ingestion reports and LLM budgeting."""
+
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+from typing import Any, Optional
+
+# o200k_base is the GPT-4o/GPT-5 family encoding; other vendors tokenize
+# differently, so every count here is an estimate used for relative savings.
+TIKTOKEN_ENCODING = "o200k_base"
+CHARS_PER_TOKEN = 4.0
+
+
+@lru_cache(maxsize=1)
+def _encoding() -> Optional[Any]:
+    try:
+        import tiktoken  # type: ignore
+
+        return tiktoken.get_encoding(TIKTOKEN_ENCODING)
+    except Exception:  # pragma: no cover - tokenizer optional / offline
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """tiktoken count when available, otherwise a ~4 characters/token estimate."""
+
+    if not text:
+        return 0
+    encoding = _encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+__all__ = ["count_tokens"]
@@ -0,0 +1,176 @@
+"""SECTION C extraction and validation over many report files.
+
+``iter_section_c`` streams report files one at a time (constant memory however
+large the archive is) and yields each file's SECTION C payload.
+``validate_rucam_batch`` validates thousands of payloads through one pydantic
+``TypeAdapter`` and returns an outcome per record instead of raising on the first
+bad one. ``iter_report_validations`` chains the two a chunk at a time, and
+``python -m dili_rucam_agents.validators.report_batch <dir>`` runs it over a
+directory of historical outputs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Annotated, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from pydantic import Field, TypeAdapter, ValidationError
+
+from .rucam_json import RucamReport, extract_section_c
+
+# ``list[RucamReport]`` in which every element validates: a record the model rejects
+# falls through to ``Any`` instead of failing the list, so one bad record never
+# costs the batch a second pass.
+_LENIENT_REPORT_LIST = TypeAdapter(List[Annotated[Union[RucamReport, Any], Field(union_mode="left_to_right")]])
+
+# Report files read and validated per batch by ``iter_report_validations``.
+VALIDATION_CHUNK = 1024
+
+# Report files written by the pipeline and batch runner (SECTION C lives in these).
+REPORT_GLOB = "*.md"
+
+
+@dataclass(slots=True)
+class SectionCRecord:
+    """SECTION C payload of one report file, or why there is none."""
+
+    source: str
+    payload: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+@dataclass(slots=True)
+class ReportValidation:
+    """Validation outcome of one record of a batch."""
+
+    index: int
+    source: Optional[str] = None
+    report: Optional[RucamReport] = None
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.report is not None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"index": self.index, "source": self.source, "ok": self.ok, "errors": list(self.errors)}
+
+
+def iter_report_files(paths: Iterable[Path], pattern: str = REPORT_GLOB) -> Iterator[Path]:
+    """Files given directly, plus ``pattern`` matches under directories (sorted, recursive)."""
+
+    for path in paths:
+        if path.is_dir():
+            # Sorting by string is several times faster than comparing Path objects.
+            yield from sorted(path.rglob(pattern), key=str)
+        else:
+            yield path
+
+
+def iter_section_c(paths: Iterable[Path], pattern: str = REPORT_GLOB) -> Iterator[SectionCRecord]:
+    """One :class:`SectionCRecord` per report file, read lazily in path order."""
+
+    for path in iter_report_files(paths, pattern):
+        try:
+            text = path.read_text(encoding="utf-8", errors="replace")
+        except OSError as exc:
+            yield SectionCRecord(source=str(path), error=f"unreadable: {exc}")
+            continue
+        payload = extract_section_c(text)
+        if payload is None:
+            yield SectionCRecord(source=str(path), error="SECTION C JSON not found")
+        else:
+            yield SectionCRecord(source=str(path), payload=payload)
+
+
+def _format_error(error: Dict[str, Any]) -> str:
+    location = ".".join(str(part) for part in error["loc"])
+    return f"{location}: {error['msg']}" if location else error["msg"]
+
+
+def _errors(payload: Any) -> Tuple[Optional[RucamReport], List[str]]:
+    """Validate one payload on its own, for the messages the batch pass does not keep."""
+
+    if payload is None:
+        return None, ["SECTION C JSON not found"]
+    try:
+        if isinstance(payload, (str, bytes)):
+            return RucamReport.model_validate_json(payload), []
+        return RucamReport.model_validate(payload), []
+    except ValidationError as exc:
+        return None, [_format_error(error) for error in exc.errors(include_url=False, include_input=False)]
+
+
+def validate_rucam_batch(
+    payloads: Sequence[Any], sources: Optional[Sequence[Optional[str]]] = None
+) -> List[ReportValidation]:
+    """Validate every payload in one pydantic-core pass; never raises on invalid records.
+
+    Payloads are dicts or SECTION C JSON strings; ``None`` is reported as missing.
+    Records the batch pass rejects are validated again one at a time for their
+    error messages. ``sources`` (e.g. report paths) are copied onto the results.
+    """
+
+    if sources is not None and len(sources) != len(payloads):
+        raise ValueError(f"sources has {len(sources)} entries for {len(payloads)} payloads")
+
+    results: List[ReportValidation] = []
+    for index, outcome in enumerate(_LENIENT_REPORT_LIST.validate_python(payloads)):
+        source = sources[index] if sources is not None else None
+        if type(outcome) is RucamReport:
+            results.append(ReportValidation(index=index, source=source, report=outcome))
+        else:
+            report, errors = _errors(payloads[index])
+            results.append(ReportValidation(index=index, source=source, report=report, errors=errors))
+    return results
+
+
+def iter_report_validations(paths: Iterable[Path], pattern: str = REPORT_GLOB) -> Iterator[ReportValidation]:
+    """Extract and validate SECTION C of every report under ``paths``, a chunk at a time."""
+
+    records = iter_section_c(paths, pattern)
+    offset = 0
+    while chunk := list(islice(records, VALIDATION_CHUNK)):
+        results = validate_rucam_batch([record.payload for record in chunk], [record.source for record in chunk])
+        for record, result in zip(chunk, results):
+            result.index += offset
+            if record.error:
+                result.errors = [record.error]
+            yield result
+        offset += len(chunk)
+
+
+def _main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Validate SECTION C of saved analyst/arbiter reports.")
+    parser.add_argument("paths", nargs="+", help="Report files or directories (searched recursively).")
+    parser.add_argument("--glob", default=REPORT_GLOB, help=f"Report file pattern inside directories (default {REPORT_GLOB}).")
+    parser.add_argument("--all", dest="show_all", action="store_true", help="Print valid records too.")
+    args = parser.parse_args(argv)
+
+    total = invalid = 0
+    for result in iter_report_validations([Path(path).expanduser() for path in args.paths], args.glob):
+        total += 1
+        invalid += not result.ok
+        if args.show_all or not result.ok:
+            print(json.dumps(result.to_dict(), ensure_ascii=False))
+    print(json.dumps({"reports": total, "valid": total - invalid, "invalid": invalid}), file=sys.stderr)
+
+
+__all__ = [
+    "REPORT_GLOB",
+    "ReportValidation",
+    "SectionCRecord",
+    "iter_report_files",
+    "iter_report_validations",
+    "iter_section_c",
+    "validate_rucam_batch",
+]
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI helper
+    _main()
@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+RUCAM_ITEMS = (
+    "time_to_onset",
+    "course",
+    "risk_factors",
+    "concomitant_drugs",
+    "alternative_causes_excluded",
+    "known_hepatotoxicity",
+    "rechallenge",
+)
+
+# Inclusive score range per item (same bounds as ``RucamScores``).
+ITEM_RANGES: Dict[str, Tuple[int, int]] = {
+    "time_to_onset": (-3, 3),
+    "course": (-3, 3),
+    "risk_factors": (-2, 2),
+    "concomitant_drugs": (-3, 3),
+    "alternative_causes_excluded": (-3, 3),
+    "known_hepatotoxicity": (-3, 3),
+    "rechallenge": (-3, 3),
+}
+
+# The production prompts name ``alternative_causes_excluded`` ``other_causes_excluded``.
+_ITEM_GETTER = itemgetter(*RUCAM_ITEMS)
+_PROMPT_ITEM_GETTER = itemgetter(
+    *("other_causes_excluded" if item == "alternative_causes_excluded" else item for item in RUCAM_ITEMS)
+)
+
+# Highest total of each category but the last (production prompt thresholds).
+CATEGORY_THRESHOLDS = (0, 2, 5, 8)
+CATEGORIES = ("Excluded", "Unlikely", "Possible", "Probable", "Highly probable")
+PATTERNS = ("hepatocellular", "mixed", "cholestatic")
+
+# R = (ALT/ULN) / (ALP/ULN): hepatocellular at R >= 5, cholestatic at R <= 2, mixed in
+# between. The prompts also state the bounds strictly (R > 5, R < 2), so an R exactly
+# on a bound is accepted with either neighbouring pattern by ``verify_batch``.
+R_HEPATOCELLULAR = 5.0
+R_CHOLESTATIC = 2.0
+
+# Reported vs lab-derived R ratio: relative tolerance plus two-decimal rounding.
+R_RATIO_TOLERANCE = 0.05
+
+
+def category_for_total(total: int) -> str:
+    """RUCAM causality category for a total score (production prompt thresholds)."""
+
+    for upper, category in zip(CATEGORY_THRESHOLDS, CATEGORIES):
+        if total <= upper:
+            return category
+    return CATEGORIES[-1]
+
+
+def injury_pattern_for_r(r_ratio: float) -> str:
+    """Injury pattern for an R ratio."""
+
+    if r_ratio >= R_HEPATOCELLULAR:
+        return "hepatocellular"
+    if r_ratio <= R_CHOLESTATIC:
+        return "cholestatic"
+    return "mixed"
+
+
+def r_ratio(alt: float, alt_uln: float, alp: float, alp_uln: float) -> float:
+    """R = (ALT / ULN_ALT) ÷ (ALP / ULN_ALP)."""
+
+    if alt_uln <= 0 or alp_uln <= 0 or alp <= 0:
+        raise ValueError(f"R ratio needs positive ALP and ULNs, got ALP={alp}, ULN_ALT={alt_uln}, ULN_ALP={alp_uln}")
+    return (alt / alt_uln) / (alp / alp_uln)
+
+
+def accepted_patterns(r_value: float) -> Tuple[str, ...]:
+    """Injury patterns consistent with ``r_value``; ``mixed`` is also accepted exactly on a bound."""
+
+    expected = injury_pattern_for_r(r_value)
+    if math.isclose(r_value, R_HEPATOCELLULAR) or math.isclose(r_value, R_CHOLESTATIC):
+        return (expected, "mixed")
+    return (expected,)
+
+
+@dataclass
+class EngineCheck:
+    """Arithmetic check of one SECTION C record against the RUCAM rules."""
+
+    index: int
+    issues: List[str] = field(default_factory=list)
+    expected: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.issues
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"index": self.index, "ok": self.ok, "issues": list(self.issues), "expected": dict(self.expected)}
+
+
+@dataclass
+class _Columns:
+    scores: Any
+    r_reported: Any
+    r_labs: Any
+    r_invalid: Any
+    total_reported: Any
+    category_code: Any
+    pattern_code: Any
+    malformed: Dict[int, List[str]]
+
+
+_INT_ONLY = {int}
+_CATEGORY_CODE = {category: code for code, category in enumerate(CATEGORIES)}
+_PATTERN_CODE = {pattern: code for code, pattern in enumerate(PATTERNS)}
+
+
+def _is_number(value: Any) -> bool:
+    return type(value) in (int, float) and math.isfinite(value)
+
+
+def _lab_ratio(labs: Optional[Mapping[str, Any]]) -> float:
+    if not labs:
+        return math.nan
+    values = [labs.get(key) for key in ("alt", "alt_uln", "alp", "alp_uln")]
+    if not all(_is_number(value) for value in values):
+        return math.nan
+    try:
+        return r_ratio(*values)
+    except ValueError:
+        return math.nan
+
+
+def _item_scores(item_scores: Dict[str, Any]) -> Tuple[Any, ...]:
+    try:
+        return _ITEM_GETTER(item_scores)
+    except KeyError:
+        pass
+    try:
+        return _PROMPT_ITEM_GETTER(item_scores)
+    except KeyError:
+        pass
+    values = [item_scores.get(item) for item in RUCAM_ITEMS]
+    column = RUCAM_ITEMS.index("alternative_causes_excluded")
+    if values[column] is None:
+        values[column] = item_scores.get("other_causes_excluded")
+    return tuple(values)
+
+
+def _columns(records: Sequence[Mapping[str, Any]], labs: Optional[Sequence[Optional[Mapping[str, Any]]]]) -> _Columns:
+    """One pass over the records into NumPy columns; unusable rows are scored as zeros and listed."""
+
+    import numpy as np
+
+    if labs is not None and len(labs) != len(records):
+        raise ValueError(f"labs has {len(labs)} entries for {len(records)} records")
+
+    nan = math.nan
+    missing_row = (0,) * len(RUCAM_ITEMS)
+    rows: List[Tuple[int, ...]] = []
+    fields: List[Tuple[Any, Any, Any, Any]] = []
+    malformed: Dict[int, List[str]] = {}
+    for row, record in enumerate(records):
+        item_scores = record.get("rucam_scores") if type(record) is dict else None
+        if type(item_scores) is not dict:
+            malformed[row] = ["rucam_scores missing"]
+            rows.append(missing_row)
+            fields.append((None, None, None, None))
+            continue
+        values = _item_scores(item_scores)
+        # Exact type check: keeps booleans (and floats) out.
+        if set(map(type, values)) != _INT_ONLY:
+            malformed[row] = [
+                f"rucam_scores.{item} missing or not an integer"
+                for item, value in zip(RUCAM_ITEMS, values)
+                if type(value) is not int
+            ]
+            values = missing_row
+        rows.append(values)
+        fields.append(
+            (record.get("R_ratio"), record.get("total_score"), record.get("category"), record.get("injury_pattern"))
+        )
+
+    r_reported: List[float] = []
+    r_invalid: List[bool] = []
+    for row, (reported, *_rest) in enumerate(fields):
+        valid = type(reported) in (int, float) and reported >= 0 and reported != math.inf
+        r_reported.append(reported if valid else nan)
+        r_invalid.append(not valid and reported is not None)
+    r_labs = [_lab_ratio(entry) for entry in labs] if labs is not None else [nan] * len(records)
+    return _Columns(
+        scores=np.array(rows, dtype=np.int64).reshape(len(records), len(RUCAM_ITEMS)),
+        r_reported=np.array(r_reported, dtype=np.float64),
+        r_labs=np.array(r_labs, dtype=np.float64),
+        r_invalid=np.array(r_invalid, dtype=bool),
+        total_reported=np.array([total if type(total) is int else nan for _, total, _, _ in fields], dtype=np.float64),
+        category_code=np.array(
+            [_CATEGORY_CODE.get(category, -1) if type(category) is str else -1 for _, _, category, _ in fields],
+            dtype=np.int64,
+        ),
+        pattern_code=np.array(
+            [_PATTERN_CODE.get(pattern, -1) if type(pattern) is str else -1 for _, _, _, pattern in fields],
+            dtype=np.int64,
+        ),
+        malformed=malformed,
+    )
+
+
+def _derive(columns: _Columns) -> Tuple[Any, Any, Any, Any]:
+    """Vectorised totals, category codes, R ratios and pattern codes (NaN R → no pattern)."""
+
+    import numpy as np
+
+    totals = columns.scores.sum(axis=1)
+    category_code = np.searchsorted(CATEGORY_THRESHOLDS, totals, side="left")
+    r_values = np.where(np.isnan(columns.r_labs), columns.r_reported, columns.r_labs)
+    pattern_code = np.where(
+        r_values >= R_HEPATOCELLULAR,
+        _PATTERN_CODE["hepatocellular"],
+        np.where(r_values <= R_CHOLESTATIC, _PATTERN_CODE["cholestatic"], _PATTERN_CODE["mixed"]),
+    )
+    return totals, category_code, r_values, pattern_code
+
+
+def _expected(total: int, category_code: int, r_value: float, pattern_code: int) -> Dict[str, Any]:
+    expected: Dict[str, Any] = {"total_score": total, "category": CATEGORIES[category_code]}
+    if r_value == r_value:  # not NaN
+        expected["R_ratio"] = round(r_value, 2)
+        expected["injury_pattern"] = PATTERNS[pattern_code]
+    return expected
+
+
+def _issues(record: Mapping[str, Any], expected: Dict[str, Any], scores: List[int], r_from_labs: bool) -> List[str]:
+    """Messages for a record the vectorised checks flagged."""
+
+    issues = [
+        f"{item} {score} outside {list(ITEM_RANGES[item])}"
+        for item, score in zip(RUCAM_ITEMS, scores)
+        if not ITEM_RANGES[item][0] <= score <= ITEM_RANGES[item][1]
+    ]
+    total = expected["total_score"]
+    if record.get("total_score") != total:
+        issues.append(f"total_score {record.get('total_score')} != item sum {total}")
+    if record.get("category") != expected["category"]:
+        issues.append(f"category {record.get('category')!r} does not match total {total} ({expected['category']!r})")
+    if "R_ratio" not in expected:
+        if "R_ratio" in record:
+            issues.append(f"R_ratio {record['R_ratio']!r} is not a non-negative number")
+        return issues
+    r_value = expected["R_ratio"]
+    if r_from_labs:
+        issues.append(f"R_ratio {record.get('R_ratio')} differs from the lab-derived {r_value}")
+    pattern = record.get("injury_pattern")
+    if pattern != expected["injury_pattern"] and pattern not in accepted_patterns(r_value):
+        issues.append(f"injury_pattern {pattern!r} does not match R {r_value} ({expected['injury_pattern']!r})")
+    return issues
+
+
+def verify_batch(
+    records: Sequence[Mapping[str, Any]],
+    labs: Optional[Sequence[Optional[Mapping[str, Any]]]] = None,
+) -> List[EngineCheck]:
+    """Check SECTION C records (JSON dicts) without raising; one :class:`EngineCheck` per record.
+
+    Beyond the item ranges and ``total_score`` that ``validate_rucam_json`` checks,
+    the category must match the item sum and the injury pattern must match the R
+    ratio. ``labs`` (``alt``, ``alt_uln``, ``alp``, ``alp_uln`` per record, or None)
+    recomputes R from the lab values, and the reported ``R_ratio`` must agree with it.
+    The checks run on NumPy columns; messages are only built for flagged records.
+    """
+
+    import numpy as np
+
+    columns = _columns(records, labs)
+    totals, category_code, r_values, pattern_code = _derive(columns)
+    low = np.array([ITEM_RANGES[item][0] for item in RUCAM_ITEMS])
+    high = np.array([ITEM_RANGES[item][1] for item in RUCAM_ITEMS])
+    has_r = ~np.isnan(r_values)
+    r_mismatch = (
+        ~np.isnan(columns.r_labs)
+        & ~np.isnan(columns.r_reported)
+        & (np.abs(columns.r_reported - r_values) > R_RATIO_TOLERANCE * r_values + 0.005)
+    )
+    on_bound = np.isclose(r_values, R_HEPATOCELLULAR) | np.isclose(r_values, R_CHOLESTATIC)
+    pattern_ok = (
+        ~has_r
+        | (columns.pattern_code == pattern_code)
+        | (on_bound & (columns.pattern_code == _PATTERN_CODE["mixed"]))
+    )
+    flagged = (
+        ((columns.scores < low) | (columns.scores > high)).any(axis=1)
+        | (columns.total_reported != totals)
+        | (columns.category_code != category_code)
+        | ~pattern_ok
+        | r_mismatch
+        | columns.r_invalid
+    )
+
+    flagged_rows = set(np.flatnonzero(flagged).tolist())
+    r_mismatch_rows = r_mismatch.tolist()
+    checks: List[EngineCheck] = []
+    for row, total, category, r_value, pattern in zip(
+        range(len(records)), totals.tolist(), category_code.tolist(), r_values.tolist(), pattern_code.tolist()
+    ):
+        if row in columns.malformed:
+            checks.append(EngineCheck(index=row, issues=list(columns.malformed[row])))
+            continue
+        expected = _expected(total, category, r_value, pattern)
+        issues: List[str] = []
+        if row in flagged_rows:
+            issues = _issues(records[row], expected, columns.scores[row].tolist(), r_mismatch_rows[row])
+        checks.append(EngineCheck(index=row, issues=issues, expected=expected))
+    return checks
+
+
+def rescore_batch(
+    records: Sequence[Mapping[str, Any]],
+    labs: Optional[Sequence[Optional[Mapping[str, Any]]]] = None,
+) -> List[Optional[Dict[str, Any]]]:
+    """Copies of the records with total, category, and (when R is known) pattern recomputed.
+
+    The item scores are kept as reported; with ``labs`` the ``R_ratio`` is replaced
+    by the lab-derived value. Records without seven integer item scores come back as None.
+    """
+
+    columns = _columns(records, labs)
+    totals, category_code, r_values, pattern_code = _derive(columns)
+    rescored: List[Optional[Dict[str, Any]]] = []
+    for row, total, category, r_value, pattern in zip(
+        range(len(records)), totals.tolist(), category_code.tolist(), r_values.tolist(), pattern_code.tolist()
+    ):
+        if row in columns.malformed:
+            rescored.append(None)
+            continue
+        rescored.append({**records[row], **_expected(total, category, r_value, pattern)})
+    return rescored
+
+
+__all__ = [
+    "CATEGORIES",
+    "ITEM_RANGES",
+    "PATTERNS",
+    "RUCAM_ITEMS",
+    "EngineCheck",
+    "accepted_patterns",
+    "category_for_total",
+    "injury_pattern_for_r",
+    "r_ratio",
+    "rescore_batch",
+    "verify_batch",
+]
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, Literal
+import re
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
-from pydantic import BaseModel, Field, ValidationError, validator
+from pydantic import AliasChoices, BaseModel, Field, ValidationError, ValidationInfo, field_validator
 
 
 InjuryPattern = Literal["hepatocellular", "mixed", "cholestatic"]
@@ -15,7 +16,13 @@ class RucamScores(BaseModel):
     course: int = Field(..., ge=-3, le=3)
     risk_factors: int = Field(..., ge=-2, le=2)
     concomitant_drugs: int = Field(..., ge=-3, le=3)
-    alternative_causes_excluded: int = Field(..., ge=-3, le=3)
+    # The production prompts name this item ``other_causes_excluded``.
+    alternative_causes_excluded: int = Field(
+        ...,
+        ge=-3,
+        le=3,
+        validation_alias=AliasChoices("alternative_causes_excluded", "other_causes_excluded"),
+    )
     known_hepatotoxicity: int = Field(..., ge=-3, le=3)
     rechallenge: int = Field(..., ge=-3, le=3)
 
@@ -41,14 +48,85 @@ class RucamReport(BaseModel):
     total_score: int
     category: CausalityCategory
 
-    @validator("total_score")
-    def validate_total_score(cls, value: int, values: Dict[str, Any]) -> int:
-        scores: RucamScores | None = values.get("rucam_scores")
+    @field_validator("total_score")
+    @classmethod
+    def validate_total_score(cls, value: int, info: ValidationInfo) -> int:
+        # Absent when rucam_scores itself failed validation.
+        scores: RucamScores | None = info.data.get("rucam_scores")
         if scores and value != scores.total:
             raise ValueError(f"total_score {value} does not match item sum {scores.total}")
         return value
 
 
+_SECTION_C_HEADING = re.compile(r"SECTION\s+C\b", re.IGNORECASE)
+# Case-sensitive patterns have a literal prefix and search about 15x faster than the
+# IGNORECASE one, so the spellings the prompts produce are tried first.
+_SECTION_C_SPELLINGS = (re.compile(r"SECTION\s+C\b"), re.compile(r"Section\s+C\b"))
+_JSON_FENCE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+# A line that opens SECTION C (markdown ``#``/``**`` prefixes allowed).
+_SECTION_C_LINE = re.compile(r"^[#*\s]*SECTION\s+C\b", re.IGNORECASE | re.MULTILINE)
+
+
+def section_c_heading(report: str) -> Optional[re.Match[str]]:
+    """The SECTION C heading :func:`extract_section_c` reads from (first mention wins)."""
+
+    matches = [match for match in (pattern.search(report) for pattern in _SECTION_C_SPELLINGS) if match]
+    return min(matches, key=lambda match: match.start()) if matches else _SECTION_C_HEADING.search(report)
+
+
+def _section_c_json(report: str) -> Optional[Tuple[Dict[str, Any], int, int]]:
+    heading = section_c_heading(report)
+    offset = heading.end() if heading else 0
+    tail = report[offset:]
+    # (JSON text, span start, span end or None for the end of the decoded object)
+    candidates: List[Tuple[str, int, Optional[int]]] = []
+    fenced = _JSON_FENCE.search(tail)
+    if fenced:
+        candidates.append((fenced.group(1), fenced.start(), fenced.end()))
+    start = tail.find("{")
+    if start != -1:
+        candidates.append((tail[start:], start, None))
+
+    decoder = json.JSONDecoder()
+    for candidate, span_start, span_end in candidates:
+        try:
+            payload, length = decoder.raw_decode(candidate)
+        except ValueError:
+            continue
+        if isinstance(payload, dict):
+            return payload, offset + span_start, offset + (span_start + length if span_end is None else span_end)
+    return None
+
+
+def extract_section_c(report: str) -> Optional[Dict[str, Any]]:
+    """First JSON object after the SECTION C heading of an analyst/arbiter report."""
+
+    found = _section_c_json(report)
+    return found[0] if found else None
+
+
+def section_c_span(report: str) -> Optional[Tuple[int, int]]:
+    """``(start, end)`` of the text :func:`extract_section_c` parsed, ``None`` when it found nothing.
+
+    The span covers the whole ```json fence when the object came from one, so
+    replacing it swaps exactly the SECTION C that validation sees.
+    """
+
+    found = _section_c_json(report)
+    return (found[1], found[2]) if found else None
+
+
+def sections_before_c(report: str) -> str:
+    """``report`` up to its SECTION C heading line (the whole report when there is none).
+
+    Used when a derived report embeds an analyst's or arbiter's Sections A and B, so
+    :func:`extract_section_c` finds the derived SECTION C rather than the embedded one.
+    """
+
+    heading = _SECTION_C_LINE.search(report)
+    return (report[: heading.start()] if heading else report).rstrip()
+
+
 def validate_rucam_json(payload: Dict[str, Any] | str) -> RucamReport:
     """Validate final SECTION C output and raise with helpful errors on mismatch."""
 
@@ -61,4 +139,12 @@ def validate_rucam_json(payload: Dict[str, Any] | str) -> RucamReport:
         raise ValueError(f"Invalid RUCAM JSON: {exc}") from exc
 
 
-__all__ = ["RucamScores", "RucamReport", "validate_rucam_json"]
+__all__ = [
+    "RucamScores",
+    "RucamReport",
+    "extract_section_c",
+    "section_c_heading",
+    "section_c_span",
+    "sections_before_c",
+    "validate_rucam_json",
+]
@@ -0,0 +1,56 @@
+from pathlib import Path
+
+from dili_rucam_agents import batch
+
+FIXTURE_PDF = Path(__file__).parent / "fixtures" / "example_case.pdf"
+
+
+def test_batch_resumes_from_manifest(tmp_path, monkeypatch):
+    corpus = tmp_path / "corpus"
+    corpus.mkdir()
+    (corpus / "a.pdf").write_bytes(FIXTURE_PDF.read_bytes())
+    (corpus / "b.pdf").write_bytes(FIXTURE_PDF.read_bytes() + b"\n% b")
+
+    calls = []
+
+    def fake_run_end_to_end(pdf_path, output_dir=None, **kwargs):
+        calls.append(Path(pdf_path).name)
+        assert kwargs["ingestion_mode"] == "direct"
+        if Path(pdf_path).name == "b.pdf" and calls.count("b.pdf") == 1:
+            raise RuntimeError("model timeout")
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        return f"final for {Path(pdf_path).name}"
+
+    monkeypatch.setattr(batch, "run_end_to_end", fake_run_end_to_end)
+    output = tmp_path / "out"
+    kwargs = dict(ingestion_workers=2, llm_concurrency=2, bundle_cache_dir=str(tmp_path / "cache"))
+
+    first = batch.run_batch(corpus, output, **kwargs)
+    assert first == {"total": 2, "done": 1, "failed": 1, "skipped": 0}
+
+    manifest = batch.BatchManifest(output / batch.MANIFEST_FILENAME)
+    done = manifest.entries[str((corpus / "a.pdf").resolve())]
+    assert done.status == batch.STATUS_DONE
+    assert (Path(done.output_dir) / batch.FINAL_REPORT_FILENAME).read_text() == "final for a.pdf"
+    assert set(done.stage_seconds) == {"ingestion", "llm"}
+    assert "model timeout" in manifest.entries[str((corpus / "b.pdf").resolve())].error
+
+    # Resume: the finished case is skipped, the failed one only runs when asked.
+    assert batch.run_batch(corpus, output, **kwargs)["skipped"] == 2
+    resumed = batch.run_batch(corpus, output, retry_failed=True, **kwargs)
+    assert resumed == {"total": 2, "done": 1, "failed": 0, "skipped": 1}
+    assert calls.count("a.pdf") == 1
+
+    # A torn last line from an interrupted write is ignored.
+    with (output / batch.MANIFEST_FILENAME).open("a") as handle:
+        handle.write('{"pdf_path": "x.pdf", "sta')
+    reloaded = batch.BatchManifest(output / batch.MANIFEST_FILENAME)
+    assert all(entry.status == batch.STATUS_DONE for entry in reloaded.entries.values())
+
+
+def test_discover_pdfs_reads_list_files(tmp_path):
+    listing = tmp_path / "cases.txt"
+    listing.write_text(f"# corpus\n{FIXTURE_PDF}\n\nrelative.pdf\n")
+
+    assert batch.discover_pdfs(listing) == [FIXTURE_PDF.resolve(), (tmp_path / "relative.pdf").resolve()]
+    assert FIXTURE_PDF.resolve() in batch.discover_pdfs(FIXTURE_PDF.parent)
@@ -0,0 +1,82 @@
+import os
+import time
+from pathlib import Path
+
+from dili_rucam_agents.ingestion.build_bundle import build_case_bundle
+from dili_rucam_agents.ingestion import bundle_cache
+from dili_rucam_agents.ingestion.bundle_cache import CaseBundleCache, bundle_cache_key
+
+
+FIXTURE_PDF = Path(__file__).resolve().parent / "fixtures" / "example_case.pdf"
+
+
+def test_cache_hit_returns_identical_bundle(tmp_path):
+    cache = CaseBundleCache(tmp_path)
+
+    first = build_case_bundle(FIXTURE_PDF, cache=cache)
+    second = build_case_bundle(FIXTURE_PDF, cache=cache)
+
+    assert cache.stats.misses == 1
+    assert cache.stats.hits == 1
+    assert cache.stats.writes == 1
+    assert second.to_dict() == first.to_dict()
+    assert not list(tmp_path.glob(".tmp-*"))
+
+
+def test_cache_is_content_addressed(tmp_path):
+    cache = CaseBundleCache(tmp_path / "cache")
+    copy = tmp_path / "renamed_case.pdf"
+    copy.write_bytes(FIXTURE_PDF.read_bytes())
+
+    build_case_bundle(FIXTURE_PDF, cache=cache)
+    bundle = build_case_bundle(copy, cache=cache)
+
+    assert cache.stats.hits == 1
+    assert bundle.pdf_path == str(copy)
+
+
+def test_bundle_cache_key_changes_with_the_schema_version(tmp_path, monkeypatch):
+    key = bundle_cache_key(FIXTURE_PDF)
+    assert CaseBundleCache(tmp_path).key_for(FIXTURE_PDF) == key
+
+    monkeypatch.setattr(bundle_cache, "BUNDLE_SCHEMA_VERSION", bundle_cache.BUNDLE_SCHEMA_VERSION + 1)
+    assert bundle_cache_key(FIXTURE_PDF) != key
+
+
+def test_cache_evicts_expired_and_oversized_entries(tmp_path):
+    cache = CaseBundleCache(tmp_path, max_age_seconds=60)
+    bundle = build_case_bundle(FIXTURE_PDF)
+
+    stale, a, b = "0" * 64, "a" * 64, "b" * 64
+    cache.put(stale, bundle)
+    stale_path = tmp_path / f"{stale}.bundle"
+    old = time.time() - 120
+    os.utime(stale_path, (old, old))
+    assert cache.get(stale) is None
+    assert not stale_path.exists()
+
+    cache.put(a, bundle)
+    entry_size = (tmp_path / f"{a}.bundle").stat().st_size
+    cache.max_bytes = entry_size
+    os.utime(tmp_path / f"{a}.bundle", (old + 90, old + 90))
+    cache.put(b, bundle)
+
+    assert not (tmp_path / f"{a}.bundle").exists()
+    assert (tmp_path / f"{b}.bundle").exists()
+    assert cache.stats.evictions >= 2
+
+
+def test_eviction_leaves_foreign_files_in_a_shared_directory(tmp_path):
+    cache = CaseBundleCache(tmp_path, max_age_seconds=60)
+    legacy = tmp_path / f"{'c' * 64}.json"
+    legacy.write_text("{}")
+    foreign = [tmp_path / "run_metrics.json", tmp_path / "manifest.json", tmp_path / "notes.bundle"]
+    for path in foreign:
+        path.write_text("{}")
+
+    cache.put("d" * 64, build_case_bundle(FIXTURE_PDF))
+    assert not legacy.exists()
+    cache.clear()
+
+    assert not (tmp_path / f"{'d' * 64}.bundle").exists()
+    assert all(path.exists() for path in foreign)
@@ -45,3 +45,70 @@ def test_merge_blocks_removes_duplicates_and_sorts():
     assert merged[0].element_type == "Title"
     assert merged[1].element_type == "NarrativeText"
     assert merged[2].element_type == "Caption"
+
+
+def test_merge_blocks_drops_fallback_page_covered_by_elements():
+    from dili_rucam_agents.ingestion.dedupe import merge_blocks_with_stats
+
+    elements = [
+        CaseBundleBlock(element_type="Title", page_number=1, text="Results"),
+        CaseBundleBlock(
+            element_type="NarrativeText",
+            page_number=1,
+            text="The patient developed jaundice three weeks after starting carbamazepine therapy.",
+        ),
+        CaseBundleBlock(
+            element_type="NarrativeText",
+            page_number=1,
+            text="Serum ALT was 420 IU/L and alkaline phosphatase 610 IU/L; the drug was withdrawn.",
+        ),
+    ]
+    fallback = [
+        CaseBundleBlock(
+            element_type="NarrativeText",
+            page_number=1,
+            text=(
+                "Results The patient devel- oped jaundice three weeks after starting carbamazepine "
+                "therapy. Serum ALT was 420 IU/L and alkaline phos- phatase 610 IU/L; the drug was withdrawn."
+            ),
+        ),
+        CaseBundleBlock(element_type="NarrativeText", page_number=2, text="Results"),
+    ]
+
+    merged, stats = merge_blocks_with_stats(elements, fallback)
+
+    assert sorted(block.text for block in merged if block.page_number == 1) == sorted(
+        block.text for block in elements
+    )
+    # Same words on another page are not duplicates.
+    assert any(block.page_number == 2 for block in merged)
+    assert stats.removed_blocks == 1
+    assert stats.removed_tokens > 0
+
+
+def test_normalize_text_folds_ligatures_and_hyphenation():
+    from dili_rucam_agents.ingestion.dedupe import normalize_text
+
+    assert normalize_text("Hepato-  toxicity of ﬁbrates,\nDRUG-induced") == "hepatotoxicity of fibrates drug induced"
+
+
+def test_case_bundle_round_trips_through_compact_and_binary_formats():
+    bundle = CaseBundle(
+        pdf_path="dummy.pdf",
+        extraction_notes=["note"],
+        blocks=[CaseBundleBlock(element_type="NarrativeText", page_number=1, text="ALT 1 250 U/L ↑")],
+        normalized_text="ALT 1 250 U/L ↑",
+        tables=[CaseBundleTable(page_number=1, table_index=1, raw_rows=[["ALT", "1250"]], preview="ALT | 1250")],
+        unknowns=[],
+        quality=QualityMetrics(unstructured_total_score=1, fallback_pages=[2]),
+    )
+
+    compact = bundle.to_json()
+    binary = bundle.to_bytes()
+
+    assert "\n" not in compact and ", " not in compact
+    assert len(compact) < len(bundle.to_json(compact=False))
+    assert CaseBundle.from_json(compact).to_dict() == bundle.to_dict()
+    assert CaseBundle.from_bytes(binary).to_dict() == bundle.to_dict()
+    assert CaseBundle.from_bytes(bundle.to_bytes(binary=False)).to_dict() == bundle.to_dict()
+    assert not hasattr(bundle.blocks[0], "__dict__")
@@ -0,0 +1,62 @@
+import json
+
+from dili_rucam_agents.crew.consensus import ConsensusTolerance, compare_reports, render_consensus_report
+from dili_rucam_agents.validators.rucam_engine import category_for_total
+from dili_rucam_agents.validators.rucam_json import extract_section_c
+
+
+def _report(**overrides):
+    scores = {
+        "time_to_onset": 2,
+        "course": 2,
+        "risk_factors": 1,
+        "concomitant_drugs": 0,
+        "other_causes_excluded": 1,
+        "known_hepatotoxicity": 1,
+        "rechallenge": 0,
+    }
+    scores.update(overrides.pop("scores", {}))
+    payload = {
+        "injury_pattern": "mixed",
+        "R_ratio": 3.0,
+        "rucam_scores": scores,
+        "total_score": sum(scores.values()),
+        "category": category_for_total(sum(scores.values())),
+    }
+    payload.update(overrides)
+    return f"SECTION B ...\n## SECTION C — JSON\n```json\n{json.dumps(payload)}\n```\n"
+
+
+def test_identical_analysts_reach_consensus():
+    result = compare_reports(_report(), _report(R_ratio=3.1))
+
+    assert result.agreed
+    assert result.consensus["total_score"] == 7
+    assert result.consensus["category"] == "Probable"
+
+
+def test_consensus_report_section_c_is_the_consensus():
+    gpt = _report()
+    result = compare_reports(gpt, _report(R_ratio=3.1))
+
+    rendered = render_consensus_report(result, gpt, ConsensusTolerance())
+
+    assert "SECTION B ..." in rendered
+    assert extract_section_c(rendered) == result.consensus
+
+
+def test_item_differences_respect_tolerance():
+    strict = compare_reports(_report(), _report(scores={"risk_factors": 0}))
+    lenient = compare_reports(
+        _report(), _report(scores={"risk_factors": 0}), ConsensusTolerance(item_points=1)
+    )
+
+    assert not strict.agreed and strict.reasons == ["risk_factors 1 vs 0"]
+    assert lenient.agreed and lenient.consensus["rucam_scores"]["risk_factors"] == 0
+
+
+def test_missing_or_invalid_section_c_requires_arbitration():
+    result = compare_reports(_report(), "SECTION C\nnot json")
+
+    assert not result.agreed
+    assert result.reasons == ["Gemini 3.0: SECTION C JSON not found"]
@@ -0,0 +1,330 @@
+import json
+import time
+
+import pytest
+from crewai.tasks.task_output import TaskOutput
+
+from dili_rucam_agents.crew.crew import build_crew
+
+FIXTURE_PDF = "tests/fixtures/example_case.pdf"
+
+
+@pytest.fixture(autouse=True)
+def _offline_env(monkeypatch):
+    for key in ("OPENAI_API_KEY", "GEMINI_API_KEY", "DEEPSEEK_API_KEY"):
+        monkeypatch.setenv(key, "test-key")
+    monkeypatch.setenv("CREWAI_DISABLE_TELEMETRY", "true")
+    monkeypatch.setenv("OTEL_SDK_DISABLED", "true")
+
+
+def _stub_llm_calls(crew, delay=0.3, response="Final Answer: stub"):
+    """Replace every agent's LLM call with a sleep; returns {role: (start, end)}."""
+
+    spans = {}
+
+    for agent in crew.agents:
+
+        def fake_call(*args, _role=agent.role, **kwargs):
+            start = time.perf_counter()
+            time.sleep(delay)
+            spans[_role] = (start, time.perf_counter())
+            return response
+
+        object.__setattr__(agent.llm, "call", fake_call)
+    return spans
+
+
+def _overlap(a, b):
+    return a[0] < b[1] and b[0] < a[1]
+
+
+@pytest.mark.parametrize("concurrency, overlapping", [(1, False), (2, True)])
+def test_analyst_concurrency_controls_parallel_analysts(concurrency, overlapping):
+    crew, task_map = build_crew(FIXTURE_PDF, analyst_concurrency=concurrency)
+    crew.verbose = False
+    spans = _stub_llm_calls(crew)
+
+    crew.kickoff(inputs={"pdf_path": FIXTURE_PDF})
+
+    gpt = spans[task_map["gpt_52"].agent.role]
+    gemini = spans[task_map["gemini_30"].agent.role]
+    arbiter = spans[task_map["arbiter_arbiter_alpha"].agent.role]
+    assert _overlap(gpt, gemini) is overlapping
+    assert arbiter[0] >= max(gpt[1], gemini[1])
+
+
+def test_analyst_concurrency_must_be_positive():
+    with pytest.raises(ValueError):
+        build_crew(FIXTURE_PDF, analyst_concurrency=0)
+
+
+def test_direct_ingestion_mode_injects_bundle_without_ingestion_agent(monkeypatch, tmp_path):
+    from dili_rucam_agents.crew import crew as crew_module
+
+    captured = {}
+    original_build = crew_module.build_crew
+
+    def build_and_stub(*args, **kwargs):
+        crew, task_map = original_build(*args, **kwargs)
+        crew.verbose = False
+        captured["crew"], captured["task_map"] = crew, task_map
+        _stub_llm_calls(crew, delay=0)
+        return crew, task_map
+
+    monkeypatch.setattr(crew_module, "build_crew", build_and_stub)
+
+    _, reports = crew_module.run_crew(
+        FIXTURE_PDF,
+        capture_reports=True,
+        ingestion_mode="direct",
+        bundle_cache_dir=str(tmp_path),
+        llm_cache_path=str(tmp_path / "llm.sqlite3"),
+    )
+
+    task_map = captured["task_map"]
+    assert "case_bundle" not in task_map
+    assert len(captured["crew"].agents) == 3
+    gpt_task = task_map["gpt_52"]
+    assert gpt_task.context == []
+    assert '"pdf_path":' in gpt_task.description and "{case_bundle}" not in gpt_task.description
+
+    metrics = json.loads(reports["run_metrics"])
+    assert metrics["ingestion_mode"] == "direct"
+    assert metrics["bundle_tokens"] > 0
+    assert {"ingestion", "build_crew", "crew"} <= set(metrics["stage_seconds"])
+    assert metrics["llm_cache"] == {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+    assert metrics["ingestion_diagnostics"]["bundle_cache"] == "miss"
+    assert sorted(metrics["ingestion_diagnostics"]["pdfplumber_page_ms"]) == ["1", "2", "3", "4"]
+
+
+def test_consensus_short_circuit_skips_arbiters(monkeypatch, tmp_path):
+    from dili_rucam_agents.crew import crew as crew_module
+    from dili_rucam_agents.crew.consensus import ConsensusTolerance
+
+    section_c = json.dumps(
+        {
+            "injury_pattern": "cholestatic",
+            "R_ratio": 0.8,
+            "rucam_scores": {
+                "time_to_onset": 2,
+                "course": 2,
+                "risk_factors": 0,
+                "concomitant_drugs": -1,
+                "other_causes_excluded": 2,
+                "known_hepatotoxicity": 2,
+                "rechallenge": 0,
+            },
+            "total_score": 7,
+            "category": "Probable",
+        }
+    )
+    report = f"SECTION A\nnarrative\nSECTION C\n```json\n{section_c}\n```"
+    spans = {}
+    original_build = crew_module.build_crew
+
+    def build_and_stub(*args, **kwargs):
+        crew, task_map = original_build(*args, **kwargs)
+        crew.verbose = False
+        spans.update(_stub_llm_calls(crew, delay=0, response=f"Final Answer: {report}"))
+        spans["task_map"] = task_map
+        for key, task in task_map.items():
+            if key.startswith("arbiter_"):
+                # Some CrewAI versions keep the empty skipped output on the task.
+                task.output = TaskOutput(description=task.description, raw="", agent=task.agent.role)
+        return crew, task_map
+
+    monkeypatch.setattr(crew_module, "build_crew", build_and_stub)
+
+    final_output, reports = crew_module.run_crew(
+        FIXTURE_PDF,
+        capture_reports=True,
+        ingestion_mode="direct",
+        bundle_cache_dir=str(tmp_path),
+        use_llm_cache=False,
+        use_arbiter_beta=True,
+        consensus_tolerance=ConsensusTolerance(),
+    )
+
+    arbiter_role = spans["task_map"]["arbiter_arbiter_alpha"].agent.role
+    assert arbiter_role not in spans
+    assert reports["arbiter_arbiter_alpha"] is None
+    assert final_output == reports["consensus"]
+    assert "SECTION D — CONSENSUS JUSTIFICATION" in final_output
+    metrics = json.loads(reports["run_metrics"])
+    assert metrics["consensus"]["agreed"] is True
+    assert metrics["consensus"]["arbiters_skipped"] == 2
+    assert metrics["arbiter_ensemble"] is None
+    assert not any(key.startswith("arbiter_") for key in metrics["token_usage"])
+
+
+def test_arbiter_concurrency_runs_arbiters_in_parallel_and_aggregates(monkeypatch, tmp_path):
+    from dili_rucam_agents.crew import crew as crew_module
+
+    section_c = json.dumps(
+        {
+            "injury_pattern": "hepatocellular",
+            "R_ratio": 6.2,
+            "rucam_scores": {
+                "time_to_onset": 2,
+                "course": 3,
+                "risk_factors": 1,
+                "concomitant_drugs": 0,
+                "alternative_causes_excluded": 2,
+                "known_hepatotoxicity": 2,
+                "rechallenge": 0,
+            },
+            "total_score": 10,
+            "category": "Highly probable",
+        }
+    )
+    captured = {}
+    original_build = crew_module.build_crew
+
+    def build_and_stub(*args, **kwargs):
+        crew, task_map = original_build(*args, **kwargs)
+        crew.verbose = False
+        captured["spans"] = _stub_llm_calls(crew, delay=1.0, response=f"Final Answer: SECTION C\n```json\n{section_c}\n```")
+        captured["task_map"] = task_map
+        return crew, task_map
+
+    monkeypatch.setattr(crew_module, "build_crew", build_and_stub)
+
+    final_output, reports = crew_module.run_crew(
+        FIXTURE_PDF,
+        capture_reports=True,
+        ingestion_mode="direct",
+        bundle_cache_dir=str(tmp_path),
+        use_llm_cache=False,
+        use_arbiter_beta=True,
+        use_arbiter_gamma=True,
+        analyst_concurrency=2,
+        arbiter_concurrency=3,
+    )
+
+    spans, task_map = captured["spans"], captured["task_map"]
+    role = lambda key: task_map[key].agent.role  # noqa: E731
+    arbiters = [spans[role(key)] for key in task_map if key.startswith("arbiter_")]
+    analysts = [spans[role("gpt_52")], spans[role("gemini_30")]]
+    assert len(arbiters) == 3
+    assert _overlap(*analysts)
+    assert all(_overlap(a, b) for a in arbiters for b in arbiters if a is not b)
+    assert min(a[0] for a in arbiters) >= max(a[1] for a in analysts)
+    assert final_output == reports["arbiter_ensemble"]
+    ensemble = json.loads(reports["run_metrics"])["arbiter_ensemble"]
+    assert ensemble["decision"]["category"] == "Highly probable"
+    assert ensemble["disagreement"] == 0.0
+
+
+def test_static_prompt_prefix_is_identical_across_cases():
+    crew, task_map = build_crew(FIXTURE_PDF, ingestion_mode="direct")
+    crew.verbose = False
+    gpt_agent = task_map["gpt_52"].agent
+    seen = []
+
+    for agent in crew.agents:
+
+        def fake_call(messages, *args, _agent=agent, **kwargs):
+            if _agent is gpt_agent:
+                seen.append(messages)
+            return "Final Answer: stub"
+
+        object.__setattr__(agent.llm, "call", fake_call)
+
+    for bundle in ('{"case": 1}', '{"case": 2, "longer": true}'):
+        crew.kickoff(inputs={"pdf_path": FIXTURE_PDF, "case_bundle": bundle})
+
+    (system_a, user_a), (system_b, user_b) = [
+        [message["content"] for message in messages if message["role"] in ("system", "user")][:2]
+        for messages in seen
+    ]
+    assert system_a == system_b and "--- BEGIN PRODUCTION PROMPT ---" in system_a
+    assert "PRODUCTION PROMPT ---" not in user_a
+    prefix = user_a[: user_a.index("--- BEGIN CASE BUNDLE ---")]
+    assert user_b.startswith(prefix) and '{"case": 1}' not in prefix
+
+
+def test_run_metrics_split_cached_and_uncached_prompt_tokens(monkeypatch, tmp_path):
+    from crewai.events import LLMCallCompletedEvent, crewai_event_bus
+    from crewai.events.types.llm_events import LLMCallType
+
+    from dili_rucam_agents.crew import crew as crew_module
+
+    original_build = crew_module.build_crew
+
+    def build_and_stub(*args, **kwargs):
+        crew, task_map = original_build(*args, **kwargs)
+        crew.verbose = False
+        for agent in crew.agents:
+
+            def fake_call(messages, *call_args, _agent=agent, **call_kwargs):
+                usage = {
+                    "prompt_tokens": 3000,
+                    "completion_tokens": 50,
+                    "prompt_tokens_details": {"cached_tokens": 2048},
+                }
+                event = LLMCallCompletedEvent(
+                    messages=messages,
+                    response="stub",
+                    call_type=LLMCallType.LLM_CALL,
+                    usage=usage,
+                    from_agent=_agent,
+                    model=_agent.llm.model,
+                    call_id="test",
+                )
+                crewai_event_bus.emit(_agent.llm, event)
+                return "Final Answer: stub"
+
+            object.__setattr__(agent.llm, "call", fake_call)
+        return crew, task_map
+
+    monkeypatch.setattr(crew_module, "build_crew", build_and_stub)
+
+    _, reports = crew_module.run_crew(
+        FIXTURE_PDF,
+        capture_reports=True,
+        ingestion_mode="direct",
+        bundle_cache_dir=str(tmp_path),
+        use_llm_cache=False,
+    )
+
+    metrics = json.loads(reports["run_metrics"])
+    assert len(metrics["llm_calls"]) == 3
+    assert metrics["llm_calls"][0]["uncached_prompt_tokens"] == 952
+    assert metrics["prompt_cache"] == {
+        "calls": 3,
+        "prompt_tokens": 9000,
+        "cached_prompt_tokens": 6144,
+        "uncached_prompt_tokens": 2856,
+        "cached_fraction": 0.6827,
+    }
+
+
+def test_crew_factory_reuses_clients_but_isolates_cases():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from dili_rucam_agents.crew.factory import CrewFactory
+
+    factory = CrewFactory(use_arbiter_beta=True, ingestion_mode="direct")
+    with ThreadPoolExecutor(4) as pool:
+        built = list(pool.map(factory.build, [FIXTURE_PDF] * 4))
+
+    gpt_agents = [task_map["gpt_52"].agent for _, task_map in built]
+    assert len({id(agent) for agent in gpt_agents}) == 4
+    assert len({id(agent.llm) for agent in gpt_agents}) == 4
+    assert all(agent.llm._client is factory._gpt_agent.llm._client for agent in gpt_agents)
+
+    gpt_agents[0].llm._token_usage["prompt_tokens"] += 10
+    assert gpt_agents[1].llm.get_token_usage_summary().prompt_tokens == 0
+    assert set(built[0][1]) == {"gpt_52", "gemini_30", "arbiter_arbiter_alpha", "arbiter_arbiter_beta"}
+
+
+def test_retrieval_view_hands_the_bundle_to_arbiters():
+    crew, task_map = build_crew(FIXTURE_PDF, ingestion_mode="agent", retrieval_view=True)
+    alpha = task_map["arbiter_arbiter_alpha"]
+    assert alpha.context[0] is task_map["case_bundle"]
+    assert task_map["case_bundle"].agent.tools[0].retrieval_view
+
+    crew, task_map = build_crew(FIXTURE_PDF, ingestion_mode="direct", retrieval_view=True)
+    assert "{case_bundle}" in task_map["arbiter_arbiter_alpha"].description
+    crew, task_map = build_crew(FIXTURE_PDF, ingestion_mode="direct")
+    assert "{case_bundle}" not in task_map["arbiter_arbiter_alpha"].description
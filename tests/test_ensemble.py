@@ -0,0 +1,73 @@
+import json
+
+import pytest
+
+from dili_rucam_agents.crew.ensemble import aggregate_arbiters, render_ensemble_report
+from dili_rucam_agents.validators.rucam_engine import category_for_total
+from dili_rucam_agents.validators.rucam_json import extract_section_c
+
+
+def _report(**scores):
+    items = {
+        "time_to_onset": 2,
+        "course": 2,
+        "risk_factors": 1,
+        "concomitant_drugs": 0,
+        "alternative_causes_excluded": 1,
+        "known_hepatotoxicity": 1,
+        "rechallenge": 0,
+    }
+    items.update(scores)
+    total = sum(items.values())
+    payload = {
+        "injury_pattern": "mixed",
+        "R_ratio": 3.0,
+        "rucam_scores": items,
+        "total_score": total,
+        "category": category_for_total(total),
+    }
+    return f"SECTION A\nnarrative\n## SECTION C — JSON\n```json\n{json.dumps(payload)}\n```\n"
+
+
+def test_per_item_median_and_disagreement():
+    reports = {
+        "alpha": _report(),
+        "beta": _report(course=3, known_hepatotoxicity=2),
+        "gamma": _report(course=0, known_hepatotoxicity=2),
+    }
+
+    result = aggregate_arbiters(reports)
+
+    assert result.decision["rucam_scores"]["course"] == 2
+    assert result.decision["rucam_scores"]["known_hepatotoxicity"] == 2
+    assert result.decision["total_score"] == 8
+    assert result.decision["category"] == "Probable"
+    assert result.category_votes == {"Probable": 2, "Highly probable": 1}
+    assert result.majority_category == "Probable"
+    assert result.item_spread["course"] == 3
+    assert result.disagreement == pytest.approx(4 / 21, abs=1e-4)
+    report = render_ensemble_report(result, reports)
+    assert "SECTION C — ENSEMBLE JSON" in report and "| course | 2 | 3 | 0 | 2 | 3 |" in report
+    assert "narrative" in report
+    assert extract_section_c(report) == result.decision
+
+
+def test_injury_pattern_follows_the_ensemble_r_ratio():
+    mixed = '"injury_pattern": "mixed", "R_ratio": 3.0'
+    reports = {
+        "alpha": _report().replace(mixed, '"injury_pattern": "hepatocellular", "R_ratio": 6.0'),
+        "beta": _report().replace(mixed, '"injury_pattern": "cholestatic", "R_ratio": 1.5'),
+    }
+
+    decision = aggregate_arbiters(reports).decision
+
+    assert (decision["R_ratio"], decision["injury_pattern"]) == (1.5, "cholestatic")
+
+
+def test_ensemble_needs_two_valid_arbiters():
+    result = aggregate_arbiters({"alpha": _report(), "beta": "no json here"})
+
+    assert not result.available
+    assert "beta" in result.invalid
+    with pytest.raises(ValueError):
+        render_ensemble_report(result, {})
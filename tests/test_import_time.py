@@ -0,0 +1,40 @@
+import subprocess
+import sys
+
+import pytest
+
+# Modules that must not load until an LLM crew is actually built.
+HEAVY_MODULES = ("crewai", "litellm", "openai", "google.genai", "unstructured")
+
+# Cumulative import budgets (seconds); measured ~0.1 s / ~0.1 s / ~0.05 s locally.
+BUDGETS = {
+    "dili_rucam_agents.ingestion.build_bundle": 1.0,
+    "dili_rucam_agents.pipeline": 1.0,
+    "dili_rucam_agents.batch": 1.0,
+}
+
+
+def _importtime(module):
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        if cumulative_us.strip().isdigit():
+            cumulative[name.strip()] = int(cumulative_us) / 1e6
+    return cumulative
+
+
+@pytest.mark.parametrize("module, budget", sorted(BUDGETS.items()))
+def test_import_stays_light(module, budget):
+    cumulative = _importtime(module)
+
+    heavy = [name for name in cumulative if any(name == m or name.startswith(m + ".") for m in HEAVY_MODULES)]
+    assert heavy == []
+    assert cumulative[module] < budget
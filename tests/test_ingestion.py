@@ -30,11 +30,170 @@ def test_build_case_bundle_missing_file():
         build_case_bundle(missing_pdf)
 
 
-def test_case_bundle_extraction_tool_outputs_valid_json():
-    tool = CaseBundleExtractionTool()
+def test_case_bundle_extraction_tool_outputs_valid_json(tmp_path):
+    tool = CaseBundleExtractionTool(cache_dir=str(tmp_path))
     output = tool._run(str(FIXTURE_PDF))
     payload = json.loads(output)
 
     assert payload["pdf_path"].endswith("example_case.pdf")
     assert "blocks" in payload and isinstance(payload["blocks"], list)
     assert "tables" in payload and isinstance(payload["tables"], list)
+
+
+def test_extractors_accept_shared_document():
+    from dili_rucam_agents.ingestion.pdf_document import PdfDocument
+    from dili_rucam_agents.ingestion.pdfplumber_tables import extract_tables
+    from dili_rucam_agents.ingestion.pymupdf_fallback import extract_fallback_blocks
+
+    with PdfDocument(FIXTURE_PDF) as document:
+        shared_blocks, _ = extract_fallback_blocks(document)
+        shared_tables, _ = extract_tables(document)
+        # The shared document stays open for the next extractor.
+        assert document.page_text(1) is document.page_text(1)
+
+    path_blocks, _ = extract_fallback_blocks(FIXTURE_PDF)
+    path_tables, _ = extract_tables(FIXTURE_PDF)
+
+    assert [b.to_dict() for b in shared_blocks] == [b.to_dict() for b in path_blocks]
+    assert [t.to_dict() for t in shared_tables] == [t.to_dict() for t in path_tables]
+
+
+def test_build_case_bundle_parallel_matches_serial():
+    serial = build_case_bundle(FIXTURE_PDF)
+    parallel = build_case_bundle(FIXTURE_PDF, workers=3)
+
+    assert parallel.to_json() == serial.to_json()
+    assert build_case_bundle(FIXTURE_PDF).to_json() == serial.to_json()
+    assert sorted(serial.diagnostics["pdfplumber_page_ms"]) == [1, 2, 3, 4]
+    assert "diagnostics" not in serial.to_dict()
+
+
+def test_extract_tables_sharded_matches_serial():
+    from dili_rucam_agents.ingestion.pdfplumber_tables import extract_tables, shard_pages
+
+    assert shard_pages(5, 2) == [(1, 3), (4, 5)]
+    assert shard_pages(2, 8) == [(1, 1), (2, 2)]
+
+    timings = {}
+    serial_tables, serial_notes = extract_tables(FIXTURE_PDF)
+    sharded_tables, sharded_notes = extract_tables(FIXTURE_PDF, workers=3, timings=timings)
+
+    assert [t.to_dict() for t in sharded_tables] == [t.to_dict() for t in serial_tables]
+    assert serial_notes == sharded_notes
+    assert sorted(timings) == [1, 2, 3, 4]
+
+
+def test_quality_probe_routes_unstructured_strategy():
+    from dili_rucam_agents.ingestion.case_bundle import PageQuality
+    from dili_rucam_agents.ingestion.quality_probe import choose_strategy, probe_page_quality
+
+    pages = probe_page_quality(FIXTURE_PDF)
+
+    assert [page.page_number for page in pages] == [1, 2, 3, 4]
+    # Text-dense OCR pages pass; the figure page with a thin text layer does not.
+    assert pages[0].strategy == "fast"
+    assert pages[1].strategy == "hi_res"
+    assert choose_strategy(pages) == "hi_res"
+    assert choose_strategy([]) is None
+
+    born_digital = PageQuality(
+        page_number=1,
+        char_count=4000,
+        text_coverage=0.5,
+        char_density=8.0,
+        column_count=2,
+        image_coverage=0.0,
+        strategy="fast",
+    )
+    assert choose_strategy([born_digital]) == "fast"
+
+    bundle = build_case_bundle(FIXTURE_PDF)
+    assert [page["strategy"] for page in bundle.to_dict()["quality"]["page_quality"]] == [
+        page.strategy for page in pages
+    ]
+
+
+class _Element:
+    category = "NarrativeText"
+
+    def __init__(self, text):
+        self.text = text
+        self.metadata = None
+
+    def __str__(self):
+        return self.text
+
+
+def test_quality_records_the_unstructured_strategy_that_ran(monkeypatch):
+    import sys
+    from types import ModuleType
+
+    requested = []
+
+    def partition_pdf(file, strategy, **kwargs):
+        requested.append(strategy)
+        if strategy == "hi_res":
+            raise RuntimeError("poppler not installed")
+        return [_Element("ALT 410 U/L")]
+
+    module = ModuleType("unstructured.partition.pdf")
+    module.partition_pdf = partition_pdf
+    monkeypatch.setitem(sys.modules, "unstructured", ModuleType("unstructured"))
+    monkeypatch.setitem(sys.modules, "unstructured.partition", ModuleType("unstructured.partition"))
+    monkeypatch.setitem(sys.modules, "unstructured.partition.pdf", module)
+
+    bundle = build_case_bundle(FIXTURE_PDF)
+
+    # The probe asks for hi_res; it fails, so fast is what actually ran.
+    assert requested == ["hi_res", "fast"]
+    assert bundle.quality.unstructured_strategy == "fast"
+
+    monkeypatch.delitem(sys.modules, "unstructured.partition.pdf")
+    monkeypatch.setitem(sys.modules, "unstructured.partition.pdf", None)
+    assert build_case_bundle(FIXTURE_PDF).quality.unstructured_strategy == ""
+
+
+def test_fallback_only_runs_for_pages_unstructured_missed():
+    from dili_rucam_agents.ingestion.case_bundle import CaseBundleBlock, PageQuality
+    from dili_rucam_agents.ingestion.pymupdf_fallback import extract_fallback_blocks, pages_needing_fallback
+
+    def page(number, chars):
+        return PageQuality(
+            page_number=number,
+            char_count=chars,
+            text_coverage=0.5,
+            char_density=1.0,
+            column_count=1,
+            image_coverage=0.0,
+            strategy="fast",
+        )
+
+    unstructured = [
+        CaseBundleBlock(element_type="NarrativeText", page_number=1, text="x" * 900),
+        CaseBundleBlock(element_type="Title", page_number=2, text="Short heading only"),
+    ]
+    quality = [page(1, 1000), page(2, 1000), page(3, 1000), page(4, 0)]
+
+    # Page 2 is thin, page 3 is missing, page 4 has no text layer at all.
+    assert pages_needing_fallback(unstructured, quality) == [2, 3]
+
+    blocks, notes = extract_fallback_blocks(FIXTURE_PDF, [3, 1])
+    assert [block.page_number for block in blocks] == [1, 3]
+    assert notes == ["PyMuPDF fallback blocks generated pages=[1, 3]"]
+
+
+def test_ingestion_cli_writes_case_bundle(tmp_path, capsys):
+    from dili_rucam_agents.ingestion.__main__ import main
+
+    output = tmp_path / "bundle.json"
+    main([str(FIXTURE_PDF), "--cache-dir", str(tmp_path / "cache"), "--output", str(output)])
+
+    bundle_json = output.read_text(encoding="utf-8")
+    assert json.loads(bundle_json)["pdf_path"].endswith("example_case.pdf")
+    assert "pdfplumber_page_ms" not in bundle_json
+    diagnostics = json.loads(capsys.readouterr().err)["diagnostics"]
+    assert diagnostics["bundle_cache"] == "miss"
+    assert sorted(diagnostics["pdfplumber_page_ms"]) == ["1", "2", "3", "4"]
+
+    main([str(FIXTURE_PDF), "--cache-dir", str(tmp_path / "cache"), "--output", str(output)])
+    assert json.loads(capsys.readouterr().err)["diagnostics"] == {"bundle_cache": "hit"}
@@ -0,0 +1,68 @@
+from pathlib import Path
+
+from dili_rucam_agents.ingestion.build_bundle import build_case_bundle
+from dili_rucam_agents.ingestion.case_bundle import CaseBundle, CaseBundleBlock, CaseBundleTable
+from dili_rucam_agents.ingestion.lab_index import build_lab_index, sentence_measurements, table_measurements
+
+FIXTURE_PDF = Path(__file__).parent / "fixtures" / "example_case.pdf"
+
+
+def test_inline_mentions_keep_units_ulns_and_timing():
+    found = sentence_measurements(
+        "Three weeks after starting amoxicillin, ALT was 1,250 U/L (ULN 40) and ALP 2.5 x ULN; "
+        "ALT and AST were 450 and 300 U/L on day 9.",
+        page_number=2,
+    )
+
+    assert [(m.analyte, m.value, m.unit, m.uln, m.day, m.day_basis) for m in found] == [
+        ("ALT", 1250.0, "U/L", 40.0, 21, "drug_start"),
+        ("ALP", 2.5, "xULN", None, 21, "drug_start"),
+    ]
+
+
+def test_table_layouts_group_values_by_time_point():
+    by_row_label = CaseBundleTable(
+        page_number=2,
+        table_index=1,
+        raw_rows=[
+            ["Test", "Day 0", "Day 7", "Normal range"],
+            ["ALT (U/L)", "45", "1250", "5-40"],
+            ["ALP (U/L)", "100", "240", "40-120"],
+            ["INR", "1.1", "1.4", ""],
+        ],
+        preview="",
+    )
+    by_column_header = CaseBundleTable(
+        page_number=3,
+        table_index=2,
+        raw_rows=[["Date", "ALT", "ALP"], ["Admission", "600", "150"], ["Normal", "40", "120"]],
+        preview="",
+    )
+
+    day_groups = table_measurements(by_row_label)
+    admission = table_measurements(by_column_header)
+
+    assert [[(m.analyte, m.value, m.uln, m.day) for m in group] for group in day_groups] == [
+        [("ALT", 45.0, 40.0, 0), ("ALP", 100.0, 120.0, 0)],
+        [("ALT", 1250.0, 40.0, 7), ("ALP", 240.0, 120.0, 7)],
+    ]
+    assert [(m.analyte, m.uln, m.day_basis) for m in admission[0]] == [("ALT", 40.0, "admission"), ("ALP", 120.0, "admission")]
+
+    index = build_lab_index([], [by_row_label, by_column_header])
+    assert [(c.r_ratio, c.injury_pattern, c.day) for c in index.r_ratios] == [
+        (1.35, "cholestatic", 0),
+        (15.62, "hepatocellular", 7),
+        (12.0, "hepatocellular", 0),
+    ]
+
+
+def test_case_bundle_carries_lab_index_and_r_ratio():
+    bundle = build_case_bundle(FIXTURE_PDF, cache=None)
+
+    measurements = {m.analyte: m for m in bundle.lab_index.measurements if m.source == "text"}
+    assert (measurements["ALT"].value, measurements["ALT"].uln) == (91.0, 45.0)
+    assert (measurements["ALP"].value, measurements["ALP"].uln) == (25.0, 5.0)
+    assert [(c.r_ratio, c.injury_pattern) for c in bundle.lab_index.r_ratios] == [(0.4, "cholestatic")]
+    assert CaseBundle.from_json(bundle.to_json()).lab_index == bundle.lab_index
+    assert "## LAB INDEX" in bundle.to_llm_view(600).text
+    assert build_lab_index([CaseBundleBlock("NarrativeText", 1, "No liver tests here.")], []).measurements == []
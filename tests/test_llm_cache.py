@@ -0,0 +1,56 @@
+import os
+import time
+
+import pytest
+from crewai import LLM
+
+from dili_rucam_agents.crew.llm_cache import LLMResponseCache, install_llm_cache, request_key
+
+
+@pytest.fixture
+def counting_llm(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    llm = LLM(model="gpt-4o-mini", temperature=0)
+    calls = []
+
+    def fake_call(messages, tools=None, *args, **kwargs):
+        calls.append(messages)
+        return f"response {len(calls)}"
+
+    object.__setattr__(llm, "call", fake_call)
+    return llm, calls
+
+
+def test_llm_cache_replays_identical_requests(tmp_path, counting_llm):
+    llm, calls = counting_llm
+    cache = LLMResponseCache(tmp_path / "llm.sqlite3")
+    install_llm_cache(llm, cache, bundle_hash="abc")
+
+    messages = [{"role": "user", "content": "score this case"}]
+    assert llm.call(messages) == "response 1"
+    assert llm.call(messages) == "response 1"
+    assert llm.call([{"role": "user", "content": "another case"}]) == "response 2"
+    # Tool-bearing calls are never served from the cache.
+    assert llm.call(messages, tools=[{"name": "case_bundle_extractor"}]) == "response 3"
+
+    assert len(calls) == 3
+    assert cache.stats.to_dict() == {"hits": 1, "misses": 2, "writes": 2, "evictions": 0}
+    assert request_key(llm, messages, "abc") != request_key(llm, messages, "other-bundle")
+
+
+def test_llm_cache_expires_and_evicts_least_recently_used(tmp_path):
+    cache = LLMResponseCache(tmp_path / "llm.sqlite3", max_age_seconds=60)
+    cache.put("a", "model", "x" * 100)
+    cache.put("b", "model", "y" * 100)
+    assert cache.get("a") == "x" * 100
+
+    cache.max_bytes = 150
+    cache.put("c", "model", "z" * 50)
+    assert cache.get("b") is None
+    assert cache.get("a") == "x" * 100
+    assert cache.get("c") == "z" * 50
+
+    cache.max_age_seconds = 0
+    time.sleep(0.01)
+    assert cache.evict() >= 1
+    assert len(cache) == 0
@@ -0,0 +1,70 @@
+from pathlib import Path
+
+from dili_rucam_agents.ingestion.build_bundle import CaseBundleExtractionTool, build_case_bundle
+from dili_rucam_agents.ingestion.case_bundle import CaseBundle, CaseBundleBlock, CaseBundleTable, QualityMetrics
+from dili_rucam_agents.ingestion.llm_view import build_llm_view, classify_text
+
+FIXTURE_PDF = Path(__file__).parent / "fixtures" / "example_case.pdf"
+
+
+def _bundle() -> CaseBundle:
+    blocks = [
+        CaseBundleBlock(element_type="Title", page_number=1, text="Journal of Hepatology 2020"),
+        CaseBundleBlock(
+            element_type="NarrativeText",
+            page_number=1,
+            text="The patient enjoyed gardening. She was given amoxicillin 500 mg daily. ALT rose to 1250 U/L.",
+        ),
+        CaseBundleBlock(element_type="Table", page_number=2, text="ALT 1250 AST 900 bilirubin 3.1 ALP 240 INR 1.2"),
+        CaseBundleBlock(element_type="Title", page_number=2, text="Journal of Hepatology 2020"),
+    ]
+    return CaseBundle(
+        pdf_path="case.pdf",
+        extraction_notes=[],
+        blocks=blocks,
+        normalized_text="\n".join(block.text for block in blocks),
+        tables=[
+            CaseBundleTable(
+                page_number=2,
+                table_index=1,
+                raw_rows=[["ALT", "1250", "AST", "900"], ["bilirubin", "3.1", "ALP", "240", "INR", "1.2"]],
+                preview="ALT | 1250 | AST | 900",
+            )
+        ],
+        unknowns=[],
+        quality=QualityMetrics(),
+    )
+
+
+def test_llm_view_renders_each_passage_once_with_labs_first():
+    view = build_llm_view(_bundle(), token_budget=1000)
+
+    assert classify_text("ALT rose to 1250 U/L.") == "labs"
+    assert view.text.index("## LABS") < view.text.index("## MEDICATIONS") < view.text.index("## OTHER")
+    assert view.text.count("Journal of Hepatology 2020") == 1
+    # The unstructured Table block is covered by the pdfplumber rows.
+    assert "ALT 1250 AST 900" not in view.text
+    assert "ALT | 1250 | AST | 900" in view.text
+    assert view.tokens_after < view.tokens_before
+
+
+def test_llm_view_respects_budget_by_dropping_low_priority_sections():
+    bundle = build_case_bundle(FIXTURE_PDF, cache=None)
+    full = bundle.to_llm_view(100_000)
+    trimmed = bundle.to_llm_view(600)
+
+    assert full.omitted_passages == 0
+    assert trimmed.tokens_after <= 600
+    assert trimmed.sections["labs"] == full.sections["labs"]
+    assert trimmed.sections["other"] < full.sections["other"]
+    assert "## OMITTED" in trimmed.text
+
+
+def test_extraction_tool_returns_llm_view_and_records_savings(tmp_path):
+    tool = CaseBundleExtractionTool(cache_dir=str(tmp_path), llm_view_tokens=2000)
+
+    output = tool._run(str(FIXTURE_PDF))
+
+    assert output.startswith("CASE BUNDLE (LLM view)")
+    assert tool.last_llm_view["tokens_after"] <= 2000
+    assert tool.last_llm_view["tokens_saved"] > 0
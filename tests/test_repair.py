@@ -0,0 +1,149 @@
+import json
+from types import SimpleNamespace
+
+from dili_rucam_agents.crew.repair import SectionCRepair, replace_section_c, section_c_problems
+
+
+def _payload(**overrides):
+    payload = {
+        "injury_pattern": "mixed",
+        "R_ratio": 3.2,
+        "rucam_scores": {
+            "time_to_onset": 2,
+            "course": 1,
+            "risk_factors": 0,
+            "concomitant_drugs": 0,
+            "other_causes_excluded": 2,
+            "known_hepatotoxicity": 2,
+            "rechallenge": 0,
+        },
+        "total_score": 7,
+        "category": "Probable",
+    }
+    payload.update(overrides)
+    return payload
+
+
+def _report(payload):
+    return (
+        "## SECTION B — SCORING\nTime to onset +2 ...\n\n"
+        "## SECTION C — MACHINE-READABLE JSON\n```json\n"
+        + json.dumps(payload)
+        + "\n```\n\n## SECTION D — NOTES\nNone.\n"
+    )
+
+
+class _FakeAgent:
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.calls = []
+        self.llm = SimpleNamespace(call=self._call)
+
+    def _call(self, messages, **kwargs):
+        self.calls.append(messages)
+        return self.replies.pop(0)
+
+
+def test_section_c_problems_checks_schema_category_and_pattern():
+    assert section_c_problems(_report(_payload())) == []
+    assert section_c_problems("Final Answer: stub") is None
+    assert section_c_problems("## SECTION C\nnothing here") == ["SECTION C JSON missing or not parseable"]
+    assert section_c_problems(_report(_payload(total_score=8))) == [
+        "total_score: Value error, total_score 8 does not match item sum 7"
+    ]
+    assert section_c_problems(_report(_payload(category="Possible", injury_pattern="cholestatic"))) == [
+        "category: 'Possible' does not match total_score 7 ('Probable')",
+        "injury_pattern: 'cholestatic' does not match R_ratio 3.2 ('mixed')",
+    ]
+
+
+def test_replace_section_c_keeps_the_rest_of_the_report():
+    report = _report(_payload(total_score=8))
+    repaired = replace_section_c(report, _payload())
+
+    assert section_c_problems(repaired) == []
+    assert repaired.startswith("## SECTION B — SCORING")
+    assert repaired.endswith("## SECTION D — NOTES\nNone.\n")
+    assert repaired.count("```json") == 1
+
+    appended = replace_section_c("SECTION B only", _payload())
+    assert section_c_problems(appended) == []
+
+
+def test_replace_section_c_swaps_the_json_extract_section_c_reads():
+    from dili_rucam_agents.validators.rucam_json import extract_section_c
+
+    # The heading is not at a line start, and a bare object follows the fenced one.
+    report = (
+        "Final Answer: SECTION C — JSON\n```json\n"
+        + json.dumps(_payload(total_score=8))
+        + '\n```\nAppendix: {"note": "kept"}\n'
+    )
+    repaired = replace_section_c(report, _payload())
+
+    assert extract_section_c(repaired) == _payload()
+    assert repaired.startswith("Final Answer: SECTION C — JSON\n```json\n")
+    assert repaired.endswith('\nAppendix: {"note": "kept"}\n')
+    assert repaired.count("SECTION C") == 1
+
+
+def test_repair_sends_errors_and_retries_until_valid():
+    agent = _FakeAgent(["no json, sorry", "```json\n" + json.dumps(_payload()) + "\n```"])
+    repair = SectionCRepair(agent, retries=2)
+    output = SimpleNamespace(raw=_report(_payload(total_score=8)))
+
+    passed, repaired = repair.validate(output)
+
+    assert passed and section_c_problems(repaired) == []
+    assert "## SECTION D — NOTES" in repaired
+    assert len(agent.calls) == 2
+    assert "total_score 8 does not match" in agent.calls[0][1]["content"]
+    assert "no json, sorry" in agent.calls[1][1]["content"]
+    assert repair.result.to_dict() == {
+        "problems": ["total_score: Value error, total_score 8 does not match item sum 7"],
+        "attempts": 2,
+        "repaired": True,
+        "remaining": [],
+    }
+
+
+def test_repair_passes_valid_and_unrepairable_output_through():
+    valid = SimpleNamespace(raw=_report(_payload()))
+    agent = _FakeAgent([])
+    assert SectionCRepair(agent).validate(valid) == (True, valid)
+    assert agent.calls == []
+
+    broken = SimpleNamespace(raw=_report(_payload(total_score=8)))
+    repair = SectionCRepair(_FakeAgent(["still nothing"]), retries=1)
+    assert repair.validate(broken) == (True, broken)
+    assert repair.result.repaired is False
+    assert repair.result.remaining == ["reply contained no JSON object"]
+
+
+def test_repair_call_errors_leave_the_output_unchanged():
+    def failing_call(messages, **kwargs):
+        raise ConnectionError("provider unreachable")
+
+    broken = SimpleNamespace(raw=_report(_payload(total_score=8)))
+    repair = SectionCRepair(SimpleNamespace(llm=SimpleNamespace(call=failing_call)), retries=2)
+
+    assert repair.validate(broken) == (True, broken)
+    assert repair.result.attempts == 1
+    assert repair.result.remaining == [
+        "total_score: Value error, total_score 8 does not match item sum 7",
+        "repair call failed: ConnectionError: provider unreachable",
+    ]
+
+
+def test_factory_attaches_repair_guardrail_unless_disabled(monkeypatch):
+    for key in ("OPENAI_API_KEY", "GEMINI_API_KEY", "DEEPSEEK_API_KEY"):
+        monkeypatch.setenv(key, "test-key")
+    from dili_rucam_agents.crew.crew import build_crew
+
+    _, task_map = build_crew("tests/fixtures/example_case.pdf", ingestion_mode="direct")
+    assert isinstance(task_map["gpt_52"].guardrail.__self__, SectionCRepair)
+    assert task_map["gpt_52"].guardrail.__self__.agent is task_map["gpt_52"].agent
+    assert isinstance(task_map["arbiter_arbiter_alpha"].guardrail.__self__, SectionCRepair)
+
+    _, task_map = build_crew("tests/fixtures/example_case.pdf", ingestion_mode="direct", repair_retries=0)
+    assert task_map["gpt_52"].guardrail is None
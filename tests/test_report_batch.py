@@ -0,0 +1,66 @@
+import json
+
+from dili_rucam_agents.validators.report_batch import iter_report_validations, validate_rucam_batch
+
+
+def _payload(**overrides):
+    payload = {
+        "injury_pattern": "mixed",
+        "R_ratio": 3.2,
+        "rucam_scores": {
+            "time_to_onset": 2,
+            "course": 1,
+            "risk_factors": 0,
+            "concomitant_drugs": 0,
+            "other_causes_excluded": 2,
+            "known_hepatotoxicity": 2,
+            "rechallenge": 0,
+        },
+        "total_score": 7,
+        "category": "Probable",
+    }
+    payload.update(overrides)
+    return payload
+
+
+def test_batch_returns_errors_per_record_without_raising():
+    bad_item = _payload()
+    bad_item["rucam_scores"] = {**bad_item["rucam_scores"], "course": 9}
+    payloads = [_payload(), _payload(total_score=8), bad_item, "{not json", None, json.dumps(_payload())]
+
+    results = validate_rucam_batch(payloads, sources=[f"r{i}.md" for i in range(len(payloads))])
+
+    assert [result.ok for result in results] == [True, False, False, False, False, True]
+    assert results[0].report.rucam_scores.alternative_causes_excluded == 2
+    assert results[1].errors == ["total_score: Value error, total_score 8 does not match item sum 7"]
+    assert results[2].errors == ["rucam_scores.course: Input should be less than or equal to 3"]
+    assert results[3].errors[0].startswith("Invalid JSON")
+    assert results[4].errors == ["SECTION C JSON not found"]
+    assert [result.source for result in results] == [f"r{i}.md" for i in range(6)]
+
+
+def test_report_files_are_streamed_in_chunks(tmp_path, monkeypatch):
+    from dili_rucam_agents.validators import report_batch
+
+    monkeypatch.setattr(report_batch, "VALIDATION_CHUNK", 2)
+    for index in range(5):
+        case_dir = tmp_path / f"case-{index}"
+        case_dir.mkdir()
+        body = _payload(total_score=7 if index != 3 else 6)
+        (case_dir / "gpt-5.2_report.md").write_text(
+            f"## SECTION C — MACHINE-READABLE JSON\n```json\n{json.dumps(body)}\n```\n", encoding="utf-8"
+        )
+    (tmp_path / "case-0" / "notes.md").write_text("No structured output.", encoding="utf-8")
+
+    results = list(iter_report_validations([tmp_path]))
+
+    assert [result.index for result in results] == list(range(6))
+    assert [(r.source.rsplit("/", 2)[-2], r.ok) for r in results] == [
+        ("case-0", True),
+        ("case-0", False),
+        ("case-1", True),
+        ("case-2", True),
+        ("case-3", False),
+        ("case-4", True),
+    ]
+    assert results[1].errors == ["SECTION C JSON not found"]
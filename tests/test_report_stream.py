@@ -0,0 +1,92 @@
+import io
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from dili_rucam_agents.crew.report_stream import ReportStreamer, report_filename
+
+FIXTURE_PDF = "tests/fixtures/example_case.pdf"
+
+
+def _chunk(agent_id, chunk, call_id="c1", at=None, tool_call=None):
+    return SimpleNamespace(
+        agent_id=agent_id, chunk=chunk, call_id=call_id, tool_call=tool_call, timestamp=at or datetime.now(timezone.utc)
+    )
+
+
+def test_streamer_appends_chunks_per_agent_and_times_first_token(tmp_path):
+    agents = {"gpt_52": SimpleNamespace(id="a"), "arbiter_arbiter_alpha": SimpleNamespace(id="b")}
+    echo = io.StringIO()
+    streamer = ReportStreamer(agents, tmp_path, echo=echo)
+    start = datetime.now(timezone.utc)
+
+    streamer.on_call_started(SimpleNamespace(agent_id="a", timestamp=start))
+    streamer.on_chunk(_chunk("a", "## SECTION A", at=start + timedelta(seconds=0.5)))
+    assert (tmp_path / "gpt-5.2_report.md").read_text() == "## SECTION A"
+    streamer.on_chunk(_chunk("b", "ruling"))
+    streamer.on_chunk(_chunk("a", "\nR = 3.2"))
+    streamer.on_chunk(_chunk("a", "{}", tool_call={"name": "x"}))
+    streamer.on_chunk(_chunk("z", "someone else"))
+    streamer.on_chunk(_chunk("a", "repaired", call_id="c2"))
+    streamer.close()
+
+    assert (tmp_path / "gpt-5.2_report.md").read_text() == "## SECTION A\nR = 3.2\n\nrepaired"
+    assert (tmp_path / "arbiter-arbiter-alpha_report.md").read_text() == "ruling"
+    assert echo.getvalue() == (
+        "\n==> gpt-5.2_report.md <==\n## SECTION A"
+        "\n==> arbiter-arbiter-alpha_report.md <==\nruling"
+        "\n==> gpt-5.2_report.md <==\n\nR = 3.2\n\nrepaired\n"
+    )
+    stats = streamer.to_dict()
+    assert stats["gpt_52"]["chunks"] == 3
+    assert stats["gpt_52"]["time_to_first_token_seconds"] == 0.5
+    assert stats["arbiter_arbiter_alpha"]["time_to_first_token_seconds"] is None
+    assert report_filename("llm_view_stats") == "llm_view_stats.json"
+    assert report_filename("case_bundle") is None
+
+
+def test_run_crew_streams_reports_and_records_time_to_first_token(monkeypatch, tmp_path):
+    for key in ("OPENAI_API_KEY", "GEMINI_API_KEY", "DEEPSEEK_API_KEY"):
+        monkeypatch.setenv(key, "test-key")
+    from crewai.events import LLMCallStartedEvent, LLMStreamChunkEvent, crewai_event_bus
+
+    from dili_rucam_agents.crew import crew as crew_module
+
+    original_build = crew_module.build_crew
+    seen = {}
+
+    def build_and_stub(*args, **kwargs):
+        crew, task_map = original_build(*args, **kwargs)
+        crew.verbose = False
+        for agent in crew.agents:
+
+            def fake_call(messages, *call_args, _agent=agent, **call_kwargs):
+                seen[_agent.role] = _agent.llm.stream
+                crewai_event_bus.emit(
+                    _agent.llm, LLMCallStartedEvent(messages=messages, from_agent=_agent, call_id="s")
+                )
+                for piece in ("Final Answer: ", "## SECTION A", " done"):
+                    crewai_event_bus.emit(
+                        _agent.llm, LLMStreamChunkEvent(chunk=piece, from_agent=_agent, call_id="s")
+                    )
+                return "Final Answer: ## SECTION A done"
+
+            object.__setattr__(agent.llm, "call", fake_call)
+        return crew, task_map
+
+    monkeypatch.setattr(crew_module, "build_crew", build_and_stub)
+
+    _, reports = crew_module.run_crew(
+        FIXTURE_PDF,
+        capture_reports=True,
+        ingestion_mode="direct",
+        bundle_cache_dir=str(tmp_path / "cache"),
+        use_llm_cache=False,
+        stream_dir=tmp_path,
+    )
+
+    assert all(seen.values())
+    assert (tmp_path / "gemini-3.0_report.md").read_text() == "Final Answer: ## SECTION A done"
+    streaming = json.loads(reports["run_metrics"])["streaming"]
+    assert set(streaming) == {"gpt_52", "gemini_30", "arbiter_arbiter_alpha"}
+    assert all(entry["time_to_first_token_seconds"] >= 0 for entry in streaming.values())
@@ -0,0 +1,71 @@
+import random
+from pathlib import Path
+
+from dili_rucam_agents.ingestion.build_bundle import build_case_bundle
+from dili_rucam_agents.ingestion.case_bundle import CaseBundleBlock, PageQuality
+from dili_rucam_agents.ingestion.retrieval import RETRIEVAL_ITEMS, RetrievalIndex, build_retrieval_view
+
+FIXTURE_PDF = Path(__file__).parent / "fixtures" / "example_case.pdf"
+_BACKGROUND = (
+    "epilepsy neuralgia pharmacokinetics metabolism cytochrome epoxide clearance plasma concentration trial "
+    "cohort randomized placebo efficacy seizure frequency tolerability rash dizziness diplopia ataxia"
+).split()
+
+
+def _long_bundle(extra_pages=12):
+    """The 4-page fixture followed by pages of pharmacology background."""
+
+    bundle = build_case_bundle(FIXTURE_PDF, cache=None)
+    rng = random.Random(0)
+    for page_number in range(5, 5 + extra_pages):
+        bundle.quality.page_quality.append(PageQuality(page_number, 3000, 0.6, 6.0, 1, 0.0, "fast"))
+        for line in range(12):
+            words = " ".join(rng.choice(_BACKGROUND) for _ in range(25))
+            bundle.blocks.append(
+                CaseBundleBlock("NarrativeText", page_number, f"{words.capitalize()} study {page_number}-{line}.")
+            )
+    return bundle
+
+
+def test_short_documents_keep_the_plain_llm_view():
+    bundle = build_case_bundle(FIXTURE_PDF, cache=None)
+
+    view = build_retrieval_view(bundle, 6000)
+
+    assert view.retrieval == {"applied": False, "pages": 4, "min_pages": 10}
+    assert view.text == bundle.to_llm_view(6000).text
+
+
+def test_long_documents_keep_ranked_passages_and_report_recall():
+    bundle = _long_bundle()
+    index = RetrievalIndex(bundle)
+    top_rechallenge = index.passages[index.rank("rechallenge")[0][0]].text
+
+    view = build_retrieval_view(bundle, 6000)
+
+    assert view.retrieval["applied"] and view.retrieval["complete"]
+    assert [item["item"] for item in view.retrieval["items"]] == list(RETRIEVAL_ITEMS)
+    assert "readministration" in top_rechallenge.lower() or "readmission" in top_rechallenge.lower()
+    assert top_rechallenge in view.text
+    assert "anti-HAV IgM, absent" in view.text and "## LAB INDEX" in view.text
+    assert "study 9-3." not in view.text
+    assert view.tokens_after < bundle.to_llm_view(6000).tokens_after / 2
+
+
+def test_page_count_includes_pages_without_content():
+    bundle = build_case_bundle(FIXTURE_PDF, cache=None)
+    for page_number in range(5, 12):
+        bundle.quality.page_quality.append(PageQuality(page_number, 0, 0.0, 0.0, 0, 1.0, "hi_res"))
+
+    view = build_retrieval_view(bundle, 6000)
+
+    assert view.retrieval["applied"] and view.retrieval["pages"] == 11
+
+
+def test_tight_budget_reports_dropped_relevant_passages():
+    view = build_retrieval_view(_long_bundle(), 500)
+
+    assert view.tokens_after <= 500
+    assert not view.retrieval["complete"]
+    dropped = [item for item in view.retrieval["items"] if not item["complete"]]
+    assert dropped and all(item["dropped_pages"] and item["kept"] < item["relevant"] for item in dropped)
@@ -0,0 +1,82 @@
+from dili_rucam_agents.validators.rucam_engine import (
+    category_for_total,
+    injury_pattern_for_r,
+    r_ratio,
+    rescore_batch,
+    verify_batch,
+)
+
+
+def _record(**overrides):
+    record = {
+        "injury_pattern": "mixed",
+        "R_ratio": 3.2,
+        "rucam_scores": {
+            "time_to_onset": 2,
+            "course": 1,
+            "risk_factors": 0,
+            "concomitant_drugs": 0,
+            "other_causes_excluded": 2,
+            "known_hepatotoxicity": 2,
+            "rechallenge": 0,
+        },
+        "total_score": 7,
+        "category": "Probable",
+    }
+    record.update(overrides)
+    return record
+
+
+def test_thresholds_match_production_prompt():
+    assert [category_for_total(total) for total in (-1, 0, 1, 2, 3, 5, 6, 8, 9, 14)] == [
+        "Excluded",
+        "Excluded",
+        "Unlikely",
+        "Unlikely",
+        "Possible",
+        "Possible",
+        "Probable",
+        "Probable",
+        "Highly probable",
+        "Highly probable",
+    ]
+    assert [injury_pattern_for_r(r) for r in (0.9, 2.0, 3.5, 5.0, 8.1)] == [
+        "cholestatic",
+        "cholestatic",
+        "mixed",
+        "hepatocellular",
+        "hepatocellular",
+    ]
+    assert r_ratio(alt=400, alt_uln=40, alp=240, alp_uln=120) == 5.0
+
+
+def test_verify_batch_reports_every_inconsistency_without_raising():
+    records = [
+        _record(),
+        _record(category="Possible"),
+        _record(total_score=8),
+        _record(injury_pattern="hepatocellular"),
+        _record(R_ratio=5.0, injury_pattern="mixed"),
+        {"rucam_scores": {"course": 1}},
+    ]
+
+    checks = verify_batch(records)
+
+    assert [check.ok for check in checks] == [True, False, False, False, True, False]
+    assert "category 'Possible' does not match total 7 ('Probable')" in checks[1].issues
+    assert checks[2].issues == ["total_score 8 != item sum 7"]
+    assert checks[3].expected["injury_pattern"] == "mixed"
+    assert "rucam_scores.time_to_onset missing or not an integer" in checks[5].issues
+
+
+def test_labs_recompute_r_ratio_and_rescore():
+    records = [_record(), _record(rucam_scores={**_record()["rucam_scores"], "course": 3})]
+    labs = [{"alt": 600, "alt_uln": 40, "alp": 150, "alp_uln": 120}, None]
+
+    checks = verify_batch(records, labs=labs)
+    rescored = rescore_batch(records, labs=labs)
+
+    assert "R_ratio 3.2 differs from the lab-derived 12.0" in checks[0].issues
+    assert rescored[0]["R_ratio"] == 12.0 and rescored[0]["injury_pattern"] == "hepatocellular"
+    assert rescored[1]["total_score"] == 9 and rescored[1]["category"] == "Highly probable"
+    assert verify_batch(rescored, labs=labs)[0].ok
@@ -1,6 +1,6 @@
 import pytest
 
-from dili_rucam_agents.validators.rucam_json import validate_rucam_json
+from dili_rucam_agents.validators.rucam_json import extract_section_c, validate_rucam_json
 
 
 def test_validate_rucam_json_accepts_valid_payload():
@@ -44,3 +44,20 @@ def test_validate_rucam_json_rejects_bad_total():
 
     with pytest.raises(ValueError):
         validate_rucam_json(payload)
+
+
+def test_extract_section_c_accepts_prompt_field_names():
+    report = """SECTION B — RUCAM SCORING TABLE
+| Total | 6 | Probable |
+
+SECTION C — MACHINE-READABLE JSON
+```json
+{"injury_pattern": "cholestatic", "R_ratio": 0.9,
+ "rucam_scores": {"time_to_onset": 2, "course": 2, "risk_factors": 0, "concomitant_drugs": 0,
+                  "other_causes_excluded": 1, "known_hepatotoxicity": 1, "rechallenge": 0},
+ "total_score": 6, "category": "Probable"}
+```"""
+
+    report_model = validate_rucam_json(extract_section_c(report))
+
+    assert report_model.rucam_scores.alternative_causes_excluded == 1
@@ -0,0 +1,44 @@
+import io
+import json
+from pathlib import Path
+
+from dili_rucam_agents.ingestion.build_bundle import build_case_bundle
+from dili_rucam_agents.ingestion.streaming import (
+    CaseBundleStream,
+    read_case_bundle_ndjson,
+    write_case_bundle_ndjson,
+)
+
+
+FIXTURE_PDF = Path(__file__).resolve().parent / "fixtures" / "example_case.pdf"
+
+
+def _comparable(payload):
+    payload["quality"].pop("unstructured_strategy")
+    return payload
+
+
+def test_stream_yields_pages_in_order():
+    stream = CaseBundleStream(FIXTURE_PDF)
+    pages = list(stream.pages())
+
+    assert [page.page_number for page in pages] == [1, 2, 3, 4]
+    assert all(block.page_number == page.page_number for page in pages for block in page.blocks)
+    assert [quality.page_number for quality in stream.quality.page_quality] == [1, 2, 3, 4]
+
+
+def test_ndjson_round_trip_matches_build_case_bundle():
+    buffer = io.StringIO()
+    lines = write_case_bundle_ndjson(FIXTURE_PDF, buffer)
+
+    records = [json.loads(line) for line in buffer.getvalue().splitlines()]
+    assert len(records) == lines
+    assert records[0]["type"] == "header"
+    assert records[-1]["type"] == "footer"
+    assert [r["page_number"] for r in records if r["type"] == "page"] == [1, 2, 3, 4]
+
+    streamed = read_case_bundle_ndjson(io.StringIO(buffer.getvalue()))
+    built = build_case_bundle(FIXTURE_PDF)
+
+    assert streamed.to_dict().keys() == built.to_dict().keys()
+    assert _comparable(streamed.to_dict()) == _comparable(built.to_dict())